@@ -0,0 +1,5 @@
+from sys import exit
+
+from benchmarks.benchmark import main
+
+exit(main())
@@ -0,0 +1,258 @@
+""" Benchmarks rendering and layout calculation. """
+
+import json
+import tracemalloc
+from argparse import ArgumentParser
+from io import BytesIO
+from itertools import product
+from time import perf_counter
+from typing import Callable, Dict, Iterator, List, NamedTuple, Optional, Sequence
+
+from progrow import Layout, Row, Rows, Style
+
+Results = Dict[str, Dict[str, float]]
+""" Measurements by case ID. """
+
+KINDS = [
+    "row.render",
+    "rows.render",
+    "rows.calculate_layout",
+    "rows.append",
+    "rows.restore",
+    "columnar_rows.restore",
+]
+""" Operations to benchmark. """
+
+UNSTYLED_KINDS = {"rows.append", "rows.restore", "columnar_rows.restore"}
+""" Operations that do not depend on the render width or style. """
+
+ROW_COUNTS = [1, 1_000, 100_000]
+""" Default numbers of rows to render. """
+
+WIDTHS = [40, 120, 300]
+""" Default render widths. """
+
+
+class Case(NamedTuple):
+    """ A single benchmark. """
+
+    kind: str
+    rows: int
+    width: int
+    color: bool
+    show_fraction: bool
+    show_percent: bool
+
+    @property
+    def id(self) -> str:
+        """ Unique, stable ID of this case. """
+        return (
+            f"{self.kind} rows={self.rows} width={self.width} "
+            + f"color={int(self.color)} fraction={int(self.show_fraction)} "
+            + f"percent={int(self.show_percent)}"
+        )
+
+    @property
+    def style(self) -> Style:
+        """ Style to render with. """
+        return Style(
+            color=self.color,
+            show_fraction=self.show_fraction,
+            show_percent=self.show_percent,
+            width=self.width,
+        )
+
+
+def cases(
+    kinds: Sequence[str] = KINDS,
+    row_counts: Sequence[int] = ROW_COUNTS,
+    widths: Sequence[int] = WIDTHS,
+) -> Iterator[Case]:
+    """
+    Yields every combination of the given options. Operations that do not
+    depend on the style are measured only once per row count.
+    """
+
+    toggles = [False, True]
+
+    for kind, rows, width, color, fraction, percent in product(
+        kinds, row_counts, widths, toggles, toggles, toggles
+    ):
+        styled = (width, color, fraction, percent) != (widths[0], False, False, False)
+        if kind in UNSTYLED_KINDS and styled:
+            continue
+        yield Case(kind, rows, width, color, fraction, percent)
+
+
+def make_rows(count: int) -> Rows:
+    """ Creates `count` rows with varied names and values. """
+
+    rows = Rows()
+    for index in range(count):
+        maximum = 1 + (index * 7919) % 100_000
+        rows.append(f"partition-{index}", current=index % maximum, maximum=maximum)
+    return rows
+
+
+def prepare(case: Case) -> Callable[[], None]:
+    """ Returns a function that runs `case` once. """
+
+    style = case.style
+
+    if case.kind == "row.render":
+        row = Row("partition-0", current=1_234, maximum=56_789)
+        layout = Layout(
+            left_fraction_length=6,
+            name_length=12,
+            percent_length=5,
+            right_fraction_length=6,
+        )
+
+        def render_row() -> None:
+            for _ in range(case.rows):
+                row.render(layout, style)
+
+        return render_row
+
+    if case.kind == "rows.render":
+        rows = make_rows(case.rows)
+
+        def render_rows() -> None:
+            rows.render(style)
+
+        return render_rows
+
+    if case.kind == "rows.calculate_layout":
+        # Measure a cold layout. Every run creates its own rows, since rows
+        # measured by an earlier run would keep their listeners.
+        source = make_rows(case.rows).rows
+        values = [(row.name, row.current, row.maximum) for row in source]
+
+        def calculate_layout() -> None:
+            Rows([Row(*value) for value in values]).calculate_layout(style)
+
+        return calculate_layout
+
+    if case.kind == "rows.append":
+        # The peak memory of this case is the memory held by the rows.
+        def append_rows() -> None:
+            make_rows(case.rows)
+
+        return append_rows
+
+    if case.kind in ("rows.restore", "columnar_rows.restore"):
+        rows = make_rows(case.rows)
+        stream = BytesIO()
+        rows.dump(stream)
+        snapshot = stream.getvalue()
+
+        # Restore over rows with the same names, as a resumed job would.
+        if case.kind == "columnar_rows.restore":
+            rows = Rows.load(BytesIO(snapshot))
+
+        def restore_rows() -> None:
+            rows.restore(BytesIO(snapshot))
+
+        return restore_rows
+
+    raise ValueError(f"unknown benchmark kind: {case.kind}")
+
+
+def measure(case: Case, min_time: float = 0.2) -> Dict[str, float]:
+    """
+    Measures `case`. Returns the best time per row, in seconds, over enough runs
+    to take at least `min_time` seconds, and the peak memory of one traced run
+    in total and per row.
+    """
+
+    run = prepare(case)
+    run()  # Warm up.
+
+    best = float("inf")
+    total = 0.0
+
+    while total < min_time:
+        start = perf_counter()
+        run()
+        elapsed = perf_counter() - start
+        best = min(best, elapsed)
+        total += elapsed
+
+    tracemalloc.start()
+    try:
+        run()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "seconds_per_row": best / case.rows,
+        "peak_bytes": float(peak),
+        "peak_bytes_per_row": peak / case.rows,
+    }
+
+
+def compare(
+    baseline: Results,
+    results: Results,
+    tolerance: float = 0.25,
+) -> List[str]:
+    """
+    Compares `results` against `baseline`. Returns a description of every
+    measurement that grew by more than `tolerance`, as a fraction.
+    """
+
+    regressions: List[str] = []
+
+    for case_id, measurements in sorted(results.items()):
+        base = baseline.get(case_id)
+        if not base:
+            continue
+        for metric, value in sorted(measurements.items()):
+            previous = base.get(metric)
+            if previous and value > previous * (1.0 + tolerance):
+                change = (value / previous - 1.0) * 100
+                regressions.append(f"{case_id}: {metric} +{change:.0f}%")
+
+    return regressions
+
+
+def main(args: Optional[Sequence[str]] = None) -> int:
+    """ Runs the benchmarks from the command line. Returns the exit code. """
+
+    parser = ArgumentParser(description=__doc__)
+    parser.add_argument("--kinds", nargs="+", default=KINDS, choices=KINDS)
+    parser.add_argument("--rows", nargs="+", default=ROW_COUNTS, type=int)
+    parser.add_argument("--widths", nargs="+", default=WIDTHS, type=int)
+    parser.add_argument("--min-time", default=0.2, type=float)
+    parser.add_argument("--save", help="write results to this JSON file")
+    parser.add_argument("--compare", help="compare to a baseline JSON file")
+    parser.add_argument("--tolerance", default=0.25, type=float)
+    options = parser.parse_args(args)
+
+    results: Results = {}
+
+    for case in cases(options.kinds, options.rows, options.widths):
+        measurement = measure(case, options.min_time)
+        results[case.id] = measurement
+        print(
+            f"{case.id:<80} "
+            + f"{measurement['seconds_per_row'] * 1_000_000:>10.3f} µs/row "
+            + f"{measurement['peak_bytes'] / 1024:>12,.1f} KiB peak "
+            + f"{measurement['peak_bytes_per_row']:>10,.1f} B/row"
+        )
+
+    if options.save:
+        with open(options.save, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+
+    if options.compare:
+        with open(options.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare(baseline, results, options.tolerance)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        if regressions:
+            return 1
+
+    return 0
@@ -32,5 +32,6 @@ flake8 .
 echo -e "${li:?}Checking Python types..."
 mypy progrow
 mypy tests
+mypy benchmarks
 
 echo -e "${ok:?}OK!"
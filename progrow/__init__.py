@@ -75,6 +75,430 @@ banana harvest  █▊                     9 /  99 •   9%
 caramel harvest ███████████████████▉ 100 / 100 • 100%
 ```
 
+### Live rendering
+
+To redraw rows in place in a terminal, create a `LiveRenderer` and call
+`LiveRenderer.render` whenever the rows change. Only the lines that changed
+since the previous frame are rewritten, in a single write. Frames taller than
+the terminal are cropped to fit, so use a `Viewport` to pick the rows to show.
+
+```python
+from progrow import LiveRenderer, Rows
+
+rows = Rows()
+rows.append("apple harvest", current=0, maximum=9)
+renderer = LiveRenderer(rows)
+
+for row in rows.rows:
+    for _ in range(9):
+        row.current += 1
+        renderer.render()
+```
+
+Frames are sent through a `FrameWriter`, which encodes each frame into a reused
+buffer and sends it in one write. To stop terminals that support it from
+drawing half a frame, and to hide the cursor while drawing, pass your own
+writer. `FrameWriter.last_bytes` and `FrameWriter.average_bytes` report how
+much each frame costs to send, for example over SSH.
+
+```python
+from progrow import FrameWriter, LiveRenderer, Rows
+
+rows = Rows()
+rows.append("apple harvest", current=0, maximum=9)
+
+with FrameWriter(synchronized=True, hide_cursor=True) as writer:
+    renderer = LiveRenderer(rows, writer=writer)
+    for _ in range(9):
+        rows.rows[0].advance()
+        renderer.render()
+
+print(f"{writer.average_bytes:.0f} bytes per frame")
+```
+
+### Limiting the frame rate
+
+To render frequent updates without redrawing on every one, wrap the rows in a
+`RefreshScheduler` and update them through `RefreshScheduler.update`. Updates
+are coalesced into at most `fps` frames per second, and a final frame is always
+rendered on exit.
+
+```python
+from progrow import RefreshScheduler, Rows
+
+rows = Rows()
+rows.append("apple harvest", current=0, maximum=100_000)
+
+with RefreshScheduler(rows, fps=20) as scheduler:
+    for current in range(1, 100_001):
+        scheduler.update(rows.rows[0], current)
+```
+
+### Very large collections
+
+To track hundreds of thousands of rows, create them from columns with
+`Rows.from_columns`. The values are stored in arrays rather than as `Row`
+instances, and `ColumnarRows.rows` presents them as lightweight `Row` views.
+
+```python
+from progrow import Rows
+
+rows = Rows.from_columns(
+    names=[f"partition {index}" for index in range(1_000_000)],
+    currents=[0] * 1_000_000,
+    maximums=[100] * 1_000_000,
+)
+```
+
+### Streaming
+
+To write rows to a file or pipe without building the whole render in memory,
+call `Rows.render_to`. To process rendered rows one at a time, iterate over
+`Rows.iter_render`.
+
+```python
+from sys import stdout
+
+rows.render_to(stdout, Style(color=False))
+```
+
+### Updating rows by name
+
+Rows are indexed by name, so `Rows.set` and `rows[name]` find a row without
+searching the collection. To apply many updates at once, pass pairs of names and
+values to `Rows.update_many`; the batch is measured for the next layout in one
+step rather than update by update.
+
+```python
+from progrow import Rows
+
+rows = Rows()
+rows.append("shard-1", current=0, maximum=100)
+rows.append("shard-2", current=0, maximum=100)
+
+rows.set("shard-1", 30)
+rows["shard-2"].advance(5)
+rows.update_many([("shard-1", 40), ("shard-2", 60)])
+```
+
+### Updating from many threads
+
+`Row.advance` adds to a row's progress and is safe to call from many threads at
+once. Rows are guarded by a shared pool of locks, so threads advancing
+different rows rarely wait on each other, and each row is rendered from a
+consistent `Row.snapshot`.
+
+```python
+from concurrent.futures import ThreadPoolExecutor
+
+def work(row):
+    for _ in range(row.maximum):
+        row.advance()
+
+with ThreadPoolExecutor() as executor:
+    executor.map(work, rows.rows)
+```
+
+### Progress across processes
+
+To show the progress of child processes, create the rows with
+`SharedRows.create`. Their values live in shared memory, so children attach
+with `SharedRows.attach` and advance their rows directly, without sending any
+messages. Requires Python 3.8 or later.
+
+```python
+from concurrent.futures import ProcessPoolExecutor
+
+from progrow import SharedRows
+
+def work(handle, index):
+    with SharedRows.attach(handle) as rows:
+        row = rows.row(index)
+        for _ in range(100):
+            row.advance()
+
+names = [f"worker {index}" for index in range(4)]
+
+with SharedRows.create(names, [0] * 4, [100] * 4) as rows:
+    with ProcessPoolExecutor() as executor:
+        for index in range(4):
+            executor.submit(work, rows.handle, index)
+    print(rows.render())
+```
+
+### Progress from unrelated processes
+
+To gather progress from processes that don't share a parent, start a
+`ProgressServer` on a Unix domain socket. It merges updates from every client
+into one `Rows`, adding rows as new names arrive, and renders them as one live
+view.
+
+```python
+from progrow import ProgressServer
+
+with ProgressServer("/tmp/progress.sock") as server:
+    input("Press Enter to stop.\n")
+```
+
+Each process sends its progress with a `ProgressClient`. Updates are coalesced
+by name and sent in one small packet at most every `interval` seconds, so
+updating a row for every item is cheap. Close the client, or use it as a context
+manager, to send the final values. If the server isn't running, updates are kept
+and sent once it is, rather than raising.
+
+```python
+from progrow import ProgressClient
+
+with ProgressClient("/tmp/progress.sock", interval=0.2) as client:
+    client.update("shard-4812", current=0, maximum=10_000)
+    for _ in range(10_000):
+        client.advance("shard-4812")
+```
+
+### asyncio
+
+To redraw rows in place from an event loop, use `live` as an asynchronous
+context manager. Frames are rendered by a loop task and written from a worker
+thread, so the loop never waits on the terminal, and a final frame is written on
+exit or cancellation. Update rows as usual; there is nothing to await.
+
+```python
+import asyncio
+
+from progrow import Rows, live
+
+async def main():
+    rows = Rows()
+    rows.append("apple harvest", current=0, maximum=100)
+
+    async with live(rows, fps=20):
+        for _ in range(100):
+            rows.rows[0].advance()
+            await asyncio.sleep(0.01)
+
+asyncio.run(main())
+```
+
+### Caching renders
+
+When most rows don't change between frames, pass a `RenderCache` to `Rows`.
+Unchanged rows then return their previous render, keyed on their name, values,
+layout and style. `Style.freeze` and `Layout.freeze` create the hashable
+`FrozenStyle` and `FrozenLayout` used as keys. Make `maxsize` at least the
+number of rows: a cache too small to hold every row is bypassed.
+
+```python
+from progrow import RenderCache, Rows
+
+cache = RenderCache(maxsize=10_000)
+rows = Rows(render_cache=cache)
+rows.append("apple harvest", current=23, maximum=100)
+
+rows.render()
+rows.render()
+print(cache.hits, cache.misses)
+```
+
+```text
+1 1
+```
+
+Without a cache, `Rows` compiles the layout and style into a `RenderPlan` once
+per render, so the prefixes, colour codes and padding shared by every row are
+worked out only once. To render your own rows the same way, create a plan and
+call `RenderPlan.render` for each row:
+
+```python
+from progrow import Layout, RenderPlan, Row, Style
+
+plan = RenderPlan(Layout(name_length=12), Style(show_percent=True, width=40))
+
+for row in [Row("apple", 3, 7), Row("banana", 5, 7)]:
+    print(plan.render(row))
+```
+
+### Viewports
+
+To show a window onto more rows than fit on screen, create a `Viewport` with a
+height and an offset. Only the visible rows are rendered. Pass a sort key to
+choose which rows come first; only the rows up to the bottom of the window are
+sorted. A `Viewport` can be passed to `LiveRenderer` in place of `Rows`.
+
+```python
+from progrow import Viewport
+
+viewport = Viewport(rows, height=20, key=lambda row: row.percent)
+print(viewport.render())
+
+viewport.scroll(20)
+print(viewport.render())
+```
+
+To always show the least complete rows, create a `TopRows`. Rows are kept in
+order as they change, so each frame costs in proportion to the rows shown rather
+than to the size of the collection. Set `most=True` to show the most complete
+rows instead.
+
+```python
+from progrow import TopRows
+
+slowest = TopRows(rows, 10)
+print(slowest.render())
+```
+
+### Trees
+
+To group rows, create a `TreeRows` and add each row beneath its parent. Parent
+rows sum their children's progress, which is kept up to date as children
+change, and rows are indented by depth. Set `max_depth` to show only the top
+levels, and `total` to add a footer row that sums the whole tree.
+
+```python
+from progrow import Style, TreeRows
+
+tree = TreeRows(total="total")
+job = tree.add("job")
+stage = tree.add("stage 1", parent=job)
+tree.add("shard a", current=3, maximum=10, parent=stage)
+tree.add("shard b", current=5, maximum=10, parent=stage)
+tree.add("other job", current=2, maximum=2)
+
+print(tree.render(Style(show_fraction=True, width=40)))
+```
+
+```text
+job         ████████▏             8 / 20
+  stage 1   ████████▏             8 / 20
+    shard a ██████▏               3 / 10
+    shard b ██████████▏           5 / 10
+other job   ███████████████████▉  2 /  2
+total       █████████▏           10 / 22
+```
+
+### Rates and estimated times
+
+To show how fast each row is moving and when it should finish, create `Rows`
+with a `rate_half_life` and set `show_rate` and `show_eta` in the `Style`.
+Rates are moving averages in which progress counts for half as much after
+`rate_half_life` seconds, so each update costs the same and each row holds a
+fixed amount of state, however long the work runs.
+
+```python
+from progrow import Rows, Style
+
+rows = Rows(rate_half_life=10)
+rows.append("apple harvest", current=0, maximum=1_000)
+
+# ...advance rows as work completes...
+
+print(rows.render(Style(show_percent=True, show_rate=True, show_eta=True)))
+```
+
+```text
+apple harvest ████▎                 23% • 12.5/s • ETA 1:02
+```
+
+To estimate the rate of a single `Row`, set its `Row.rate_estimator` to a
+`RateEstimator`.
+
+### Logging progress
+
+When output is not a terminal, such as under systemd or Kubernetes, rendering
+every row on every update fills the log. Instead, create a `ProgressLog` to
+write a short line for a row only when it reaches a new percentage `step`, and
+optionally when `interval` seconds have passed since its last line.
+
+Each change is checked as it happens, in constant time, and each row's last
+logged state is kept in a few bytes.
+
+```python
+from progrow import ProgressLog, Rows
+
+rows = Rows()
+rows.append("apple harvest", current=0, maximum=1_000)
+
+log = ProgressLog(rows, step=25, interval=60)
+
+# ...advance rows as work completes...
+```
+
+```text
+apple harvest 250 / 1,000 (25%)
+apple harvest 500 / 1,000 (50%)
+apple harvest 750 / 1,000 (75%)
+apple harvest 1,000 / 1,000 (100%)
+```
+
+Rows stored in columns don't report their changes, so call `ProgressLog.poll`
+periodically to log a `ColumnarRows` or `SharedRows`.
+
+To draw the rows in place in a terminal but log them anywhere else, call
+`progress_output`. It creates a `LiveRenderer` if the stream is a terminal, or
+a `ProgressLog` otherwise.
+
+```python
+from progrow import Rows, progress_output
+
+rows = Rows()
+rows.append("apple harvest", current=0, maximum=1_000)
+
+output = progress_output(rows, step=25, interval=60)
+```
+
+### Saving and replaying progress
+
+To save the rows so that a restarted job can pick up where it left off, call
+`Rows.dump` with a binary stream. Load the snapshot with `Rows.load`, which
+reads the values straight into a `ColumnarRows` without creating a `Row` for
+each one. Snapshots are compact binary by default; pass `format="jsonl"` for
+one JSON array per line instead.
+
+```python
+from progrow import Rows
+
+rows = Rows()
+rows.append("apple harvest", current=23, maximum=100)
+
+with open("progress.bin", "wb") as f:
+    rows.dump(f)
+
+with open("progress.bin", "rb") as f:
+    restored = Rows.load(f)
+```
+
+To resume into rows of your own type, such as a `TreeRows` rebuilt by the
+restarted job, call `Rows.restore` instead. Rows are matched by name and given
+the snapshot's values.
+
+```python
+with open("progress.bin", "rb") as f:
+    rows.restore(f)
+```
+
+To record how a run progressed, create a `Journal` and watch the rows. Every
+change is appended to the journal with its time.
+
+```python
+from progrow import Journal, Rows
+
+rows = Rows()
+
+with open("progress.jsonl", "ab") as f:
+    journal = Journal(f)
+    journal.watch(rows)
+    rows.append("apple harvest", current=0, maximum=100)
+    for _ in range(100):
+        rows.rows[0].advance()
+```
+
+To watch the run again, create a `Replay` and call `Replay.run`, or run
+`python -m progrow` with the journal's path. `speed` sets how many times faster
+than recorded to replay.
+
+```shell
+python -m progrow progress.jsonl --speed 10 --percent
+```
+
 ## Issues
 
 Please report any issues at
@@ -92,9 +516,59 @@ and [sponsoring me](https://github.com/sponsors/cariad).
 
 """
 
+from progrow.async_live import AsyncLive, live
+from progrow.columnar_rows import ColumnarRows
+from progrow.frame_writer import FrameWriter
+from progrow.frozen_layout import FrozenLayout
+from progrow.frozen_style import FrozenStyle
+from progrow.journal import Journal
 from progrow.layout import Layout
+from progrow.live_renderer import LiveRenderer
+from progrow.progress_client import ProgressClient
+from progrow.progress_log import ProgressLog, progress_output
+from progrow.progress_server import ProgressServer
+from progrow.rate_estimator import RateEstimator
+from progrow.refresh_scheduler import RefreshScheduler
+from progrow.render_cache import RenderCache
+from progrow.render_plan import RenderPlan
+from progrow.replay import Replay
 from progrow.row import Row
+from progrow.row_view import RowView
 from progrow.rows import Rows
+from progrow.segment import Segment
+from progrow.shared_rows import SharedRows, SharedRowsHandle
 from progrow.style import Style
-
-__all__ = ["Layout", "Row", "Rows", "Style"]
+from progrow.top_rows import TopRows
+from progrow.tree_rows import TreeRows
+from progrow.viewport import Viewport
+
+__all__ = [
+    "AsyncLive",
+    "ColumnarRows",
+    "FrameWriter",
+    "FrozenLayout",
+    "FrozenStyle",
+    "Journal",
+    "Layout",
+    "LiveRenderer",
+    "ProgressClient",
+    "ProgressLog",
+    "ProgressServer",
+    "RateEstimator",
+    "RefreshScheduler",
+    "RenderCache",
+    "RenderPlan",
+    "Replay",
+    "Row",
+    "RowView",
+    "Rows",
+    "Segment",
+    "SharedRows",
+    "SharedRowsHandle",
+    "Style",
+    "TopRows",
+    "TreeRows",
+    "Viewport",
+    "live",
+    "progress_output",
+]
@@ -0,0 +1,5 @@
+from sys import exit
+
+from progrow.replay import main
+
+exit(main())
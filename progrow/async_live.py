@@ -0,0 +1,168 @@
+""" Hosts the `AsyncLive` class. """
+
+from types import TracebackType
+from typing import TYPE_CHECKING, Optional, TextIO, Type
+
+from progrow.live_renderer import LiveRenderer
+from progrow.rows import Rows
+from progrow.style import Style
+
+if TYPE_CHECKING:
+    import asyncio
+
+
+class AsyncLive:
+    """
+    Redraws rows in place from an asyncio event loop.
+
+    Use as an asynchronous context manager. While inside, a loop task renders
+    the rows up to `fps` times per second. Frames are written to the terminal
+    from a worker thread, so a slow terminal never blocks the loop, and a final
+    frame is written on exit, even if the surrounding task is cancelled.
+
+    Coroutines update rows as usual, for example with `Row.advance`, with no need
+    to await anything.
+
+    If drawing fails, the error is raised on exit, after a last attempt at the
+    final frame. If the body raised its own exception, that exception is raised
+    instead and the drawing error is passed to the loop's exception handler.
+
+    `rows` describes the rows to render.
+
+    `renderer` describes the renderer to draw frames with. Defaults to a
+    `LiveRenderer` writing to standard output.
+
+    `fps` describes the maximum number of frames to render per second.
+    """
+
+    def __init__(
+        self,
+        rows: Rows,
+        renderer: Optional[LiveRenderer] = None,
+        fps: float = 10.0,
+    ) -> None:
+        if fps <= 0:
+            raise ValueError(f"fps must be positive, not {fps}")
+
+        self.rows = rows
+        """ Rows to render. """
+
+        self.renderer = renderer or LiveRenderer(rows)
+        """ Renderer to draw frames with. """
+
+        self.interval = 1.0 / fps
+        """ Minimum number of seconds between frames. """
+
+        self.frames = 0
+        """ Number of frames written. """
+
+        self._task: "Optional[asyncio.Future[None]]" = None
+        self._writing: "Optional[asyncio.Future[int]]" = None
+
+    async def __aenter__(self) -> "AsyncLive":
+        # asyncio is imported on use, so that importing progrow stays fast.
+        import asyncio
+
+        self._task = asyncio.ensure_future(self._run())
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        import asyncio
+
+        task = self._task
+        error: Optional[Exception] = None
+
+        if task:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+            except Exception as ex:
+                error = ex
+            self._task = None
+
+        # Shield the final frame so that it is written even if this task is
+        # cancelled again while waiting for it.
+        try:
+            await asyncio.shield(self._finish())
+        except Exception as ex:
+            error = error or ex
+
+        if error is None:
+            return
+
+        if exc_value is None:
+            raise error
+
+        # Let the body's own exception propagate.
+        asyncio.get_running_loop().call_exception_handler(
+            {"message": "AsyncLive failed to draw", "exception": error}
+        )
+
+    async def draw(self) -> None:
+        """
+        Renders a frame in the loop and writes it from a worker thread.
+        """
+
+        import asyncio
+
+        frame = self.renderer.next_frame()
+
+        if not frame:
+            return
+
+        loop = asyncio.get_running_loop()
+        self._writing = loop.run_in_executor(None, self.renderer.write, frame)
+        self.frames += 1
+
+        # If the drawing task is cancelled, let the write carry on so that the
+        # final frame can wait for it and not overtake it.
+        await asyncio.shield(self._writing)
+
+    async def _finish(self) -> None:
+        import asyncio
+
+        loop = asyncio.get_running_loop()
+
+        try:
+            if self._writing:
+                # Wait for the previous write without raising its error again,
+                # so that the final frame is still attempted.
+                await asyncio.wait([self._writing])
+            await self.draw()
+        finally:
+            # Restoring the terminal is a write too, so it is also made from a
+            # worker thread.
+            await loop.run_in_executor(None, self.renderer.close)
+
+    async def _run(self) -> None:
+        import asyncio
+
+        while True:
+            await self.draw()
+            await asyncio.sleep(self.interval)
+
+
+def live(
+    rows: Rows,
+    fps: float = 10.0,
+    stream: Optional[TextIO] = None,
+    style: Optional[Style] = None,
+) -> AsyncLive:
+    """
+    Creates an `AsyncLive` that redraws `rows` in place from the event loop.
+
+    `fps` describes the maximum number of frames to render per second.
+
+    `stream` describes the terminal stream to write to. Defaults to standard
+    output.
+
+    `style` describes the style to render with.
+    """
+    return AsyncLive(rows, LiveRenderer(rows, stream=stream, style=style), fps)
@@ -0,0 +1,71 @@
+""" Hosts the bar rendering functions. """
+
+from functools import lru_cache
+from math import floor
+
+FULL_BLOCK = chr(0x2588)
+""" Glyph for a completely filled cell. """
+
+PARTIAL_BLOCKS = tuple(chr(0x258F - index) for index in range(7))
+"""
+Glyphs for partially filled cells, from one eighth (`▏`) to seven eighths
+(`▉`).
+"""
+
+
+def render_bar(percent: float, length: int) -> str:
+    """
+    Renders a plain bar of `length` characters filled to `percent`.
+
+    The bar is built from a run of full blocks, at most one partial block and
+    space padding, so the cost does not grow with `length`.
+
+    `percent` describes the fill. For example, `0.5` to fill half the bar.
+
+    `length` describes the character length of the bar.
+    """
+
+    if length <= 0:
+        return ""
+
+    # Each cell is split into sevenths; every change of glyph happens on a whole
+    # seventh. Values that land (within floating-point noise) on a boundary are
+    # rendered by the original column-by-column arithmetic so that the output
+    # is identical to earlier releases.
+    cells = percent * length
+    sevenths = cells * 7
+    if percent <= 0.0 or abs(sevenths - round(sevenths)) <= length * length * 1e-14:
+        return render_boundary_bar(percent, length)
+
+    if cells >= length:
+        return FULL_BLOCK * length
+
+    full = int(cells)
+    partial = PARTIAL_BLOCKS[int((cells - full) * 7)]
+    return FULL_BLOCK * full + partial + " " * (length - full - 1)
+
+
+@lru_cache(maxsize=1024)
+def render_boundary_bar(percent: float, length: int) -> str:
+    """
+    Renders a plain bar of `length` characters filled to `percent` one column at
+    a time.
+
+    This is slower than `render_bar` but reproduces the rounding of earlier
+    releases exactly. `render_bar` defers to it for values on a glyph boundary,
+    which are few and frequently repeated, so results are cached.
+    """
+
+    block = 1.0 / length
+    remaining = percent
+    glyphs = []
+
+    for _ in range(length):
+        this_pc = min(1.0, (1.0 / block) * remaining)
+        remaining -= min(remaining, block)
+        if this_pc == 0.0:
+            glyphs.append(" ")
+        else:
+            glyphs.append(chr(0x258F - floor(this_pc / (1.0 / 7))))
+
+    return "".join(glyphs)
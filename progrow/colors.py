@@ -0,0 +1,45 @@
+""" Hosts the `Colors` class. """
+
+from functools import lru_cache
+from typing import NamedTuple
+
+
+class Colors(NamedTuple):
+    """ Colour codes to render the parts of a row with. """
+
+    bar: str
+    """ Colour code for the bar. """
+
+    fraction: str
+    """ Colour code for the fraction. """
+
+    name: str
+    """ Colour code for the name. """
+
+    percent: str
+    """ Colour code for the percentage. """
+
+    rate: str
+    """ Colour code for the rate of progress and estimated time remaining. """
+
+    reset: str
+    """ Code to reset the colour. """
+
+
+@lru_cache(maxsize=None)
+def get_colors() -> Colors:
+    """
+    Gets the colour codes. `colorama` is imported on the first call, so that
+    importing progrow and rendering without colour never import it.
+    """
+
+    import colorama
+
+    return Colors(
+        bar=str(colorama.Fore.GREEN),
+        fraction=str(colorama.Fore.LIGHTBLUE_EX),
+        name=str(colorama.Fore.YELLOW),
+        percent=str(colorama.Fore.CYAN),
+        rate=str(colorama.Fore.MAGENTA),
+        reset=str(colorama.Fore.RESET),
+    )
@@ -0,0 +1,46 @@
+""" Hosts the `ColumnWidths` class. """
+
+from typing import Dict, Optional
+
+
+class ColumnWidths:
+    """
+    Counts the widths of the values in a column so that the widest can be found
+    without visiting every value, even as values shrink or are removed.
+    """
+
+    def __init__(self) -> None:
+        self.counts: Dict[int, int] = {}
+        """ Number of values of each width. """
+
+        self.maximum: Optional[int] = None
+        """ Widest width counted, or `None` if nothing is counted. """
+
+    def add(self, width: int) -> None:
+        """ Counts a value of `width`. """
+
+        self.counts[width] = self.counts.get(width, 0) + 1
+
+        if self.maximum is None or width > self.maximum:
+            self.maximum = width
+
+    def clear(self) -> None:
+        """ Forgets every counted value. """
+
+        self.counts = {}
+        self.maximum = None
+
+    def remove(self, width: int) -> None:
+        """ Forgets a previously-counted value of `width`. """
+
+        count = self.counts[width] - 1
+
+        if count:
+            self.counts[width] = count
+            return
+
+        del self.counts[width]
+
+        if width == self.maximum:
+            # There are only ever a handful of distinct widths.
+            self.maximum = max(self.counts) if self.counts else None
@@ -0,0 +1,337 @@
+""" Hosts the `ColumnarRows` class. """
+
+from array import array
+from itertools import repeat
+from math import floor
+from operator import mul, truediv
+from typing import (
+    BinaryIO,
+    Collection,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    MutableSequence,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from progrow.layout import Layout
+from progrow.render_cache import RenderCache
+from progrow.row import Row, percent_of
+from progrow.row_view import RowView, unbox
+from progrow.rows import Rows
+from progrow.style import Style
+
+
+def number_width(value: float) -> int:
+    """ Gets the rendered length of a value in a `ColumnarRows` column. """
+    return len(f"{unbox(value):,}")
+
+
+def column_width(values: Sequence[float]) -> Optional[int]:
+    """
+    Gets the rendered length of the widest value in a column, or `None` if the
+    column is empty.
+    """
+
+    if not values:
+        return None
+
+    if all(map(float.is_integer, values)):
+        # Whole numbers only get wider as they move away from zero, so the
+        # widest is at one end or the other.
+        return max(number_width(min(values)), number_width(max(values)))
+
+    return max(map(number_width, values))
+
+
+class ColumnarRows(Rows):
+    """
+    Describes a collection of rows stored in columns.
+
+    Names are kept in a list and values in `array("d")` columns, so a row costs
+    a few bytes per value rather than a `Row` instance. Layouts are calculated
+    from whole columns at once. Whole-number values render without a decimal
+    point, exactly as `Row` renders an `int`.
+
+    Create with `Rows.from_columns` or by appending rows. `ColumnarRows.rows`
+    and `ColumnarRows.row` present rows as lightweight `Row` views.
+
+    `names`, `currents` and `maximums` describe the initial columns, which must
+    be the same length. Any iterables will do, including NumPy arrays.
+
+    `render_cache` describes an optional cache to render through.
+    """
+
+    def __init__(
+        self,
+        names: Optional[Iterable[str]] = None,
+        currents: Optional[Iterable[float]] = None,
+        maximums: Optional[Iterable[float]] = None,
+        render_cache: Optional[RenderCache] = None,
+    ) -> None:
+        self._indexes: Optional[Dict[str, int]] = None
+
+        super().__init__(render_cache=render_cache)
+
+        self.names: List[str] = [] if names is None else list(names)
+        """ Names of the rows. """
+
+        self.currents: MutableSequence[float] = array(
+            "d",
+            [] if currents is None else currents,
+        )
+        """ Current progress of the rows. """
+
+        self.maximums: MutableSequence[float] = array(
+            "d",
+            [] if maximums is None else maximums,
+        )
+        """ Potential maximum progress of the rows. """
+
+        if not len(self.names) == len(self.currents) == len(self.maximums):
+            raise ValueError(
+                f"columns differ in length: {len(self.names)} names, "
+                + f"{len(self.currents)} currents, {len(self.maximums)} maximums"
+            )
+
+    def __getitem__(self, name: str) -> Row:
+        """
+        Gets a view of the row named `name`. If several rows share the name,
+        gets the first. Raises `KeyError` if no row has the name, after
+        searching every row.
+        """
+        return self.row(self._index(name))
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    @property
+    def rows(self) -> List[Row]:
+        """
+        Views of every row. Changes to the views' values are written to the
+        columns, but rows must be added with `ColumnarRows.append`. Assigning a
+        list of rows replaces the columns with their names and values.
+        """
+        return [self.row(index) for index in range(len(self.names))]
+
+    @rows.setter
+    def rows(self, rows: List[Row]) -> None:
+        self.names = [row.name for row in rows]
+        self.currents = array("d", [row.current for row in rows])
+        self.maximums = array("d", [row.maximum for row in rows])
+        self._indexes = None
+
+    def append(self, name: str, current: float, maximum: float) -> None:
+        """
+        Appends a row.
+
+        `name` describes the name of the row.
+
+        `current` describes the current progress. For example, `3` if 3 out of 7
+        units of work are complete.
+
+        `maximum` describes the potential maximum progress. For example, `7` if
+        3 out of 7 units of work are complete.
+        """
+        self.names.append(name)
+        self.currents.append(current)
+        self.maximums.append(maximum)
+
+        if self._indexes is not None:
+            self._indexes.setdefault(name, len(self.names) - 1)
+
+    def calculate_layout(self, style: Style) -> Layout:
+        """ Calculates a layout to align all rows. """
+
+        if not self.names:
+            return Layout()
+
+        left_fraction: Optional[int] = None
+        right_fraction: Optional[int] = None
+        percent: Optional[int] = None
+
+        if style.show_fraction:
+            left_fraction = column_width(self.currents)
+            right_fraction = column_width(self.maximums)
+
+        if style.show_percent:
+            percents = self.percents()
+            widest = max(
+                len(str(floor(min(percents) * 100))),
+                len(str(floor(max(percents) * 100))),
+            )
+            percent = widest + 1
+
+        return Layout.from_widths(
+            style,
+            name=max(map(len, self.names)),
+            left_fraction=left_fraction,
+            right_fraction=right_fraction,
+            percent=percent,
+        )
+
+    def invalidate(self, row: Row) -> None:
+        """
+        Passes `row` to each of `Rows.watchers`. Layouts are calculated from
+        whole columns, so there is nothing to mark.
+        """
+        for watcher in self.watchers:
+            watcher(row)
+
+    def invalidate_many(self, rows: Collection[Row]) -> None:
+        """
+        Passes every row in `rows` to each of `Rows.watchers`. Layouts are
+        calculated from whole columns, so there is nothing to mark.
+        """
+        for watcher in self.watchers:
+            for row in rows:
+                watcher(row)
+
+    def percents(self) -> List[float]:
+        """
+        Gets the progress percentage of every row. Rows with a maximum of `0`
+        are `0.0`.
+        """
+        try:
+            reciprocals = map(truediv, repeat(1.0), self.maximums)
+            return list(map(mul, reciprocals, self.currents))
+        except ZeroDivisionError:
+            return list(map(percent_of, self.currents, self.maximums))
+
+    def dump(self, stream: BinaryIO, format: str = "binary") -> None:
+        """
+        Writes a snapshot of the columns to `stream`. See `Rows.dump`.
+        """
+        from progrow.snapshot_file import dump_columns
+
+        snapshot = self.snapshot()
+        dump_columns(
+            stream,
+            snapshot.names,
+            snapshot.currents,
+            snapshot.maximums,
+            format,
+        )
+
+    def iter_render(self, style: Optional[Style] = None) -> Iterator[str]:
+        """
+        Renders the rows one at a time. Yields each rendered row without a line
+        break.
+        """
+
+        style = style or Style()
+        snapshot = self.snapshot()
+        layout = snapshot.calculate_layout(style)
+        return self.render_rows(snapshot._iter_views(), layout, style)
+
+    def restore(self, stream: BinaryIO) -> None:
+        """
+        Reads a snapshot written by `Rows.dump`, in either format, straight into
+        the columns. See `Rows.restore`.
+        """
+        from progrow.snapshot_file import load_columns
+
+        snapshot = load_columns(stream)
+
+        if snapshot.names == self.names:
+            # The usual case when resuming: copy each column in one step.
+            self.currents[:] = snapshot.currents
+            self.maximums[:] = snapshot.maximums
+            indexes: Iterable[int] = range(len(self.names))
+        else:
+            # Reversing keeps the first position of each name.
+            positions = {
+                name: index for index, name in reversed(list(enumerate(self.names)))
+            }
+            found = list(map(positions.get, snapshot.names))
+            values = zip(found, snapshot.names, snapshot.currents, snapshot.maximums)
+
+            # Missing rows are appended first, so that a collection that can't
+            # grow is left unchanged.
+            for index, name, current, maximum in values:
+                if index is None:
+                    self.append(name, current, maximum)
+
+            currents = self.currents
+            maximums = self.maximums
+            indexes = [index for index in found if index is not None]
+
+            for index, current, maximum in zip(
+                found, snapshot.currents, snapshot.maximums
+            ):
+                if index is not None:
+                    currents[index] = current
+                    maximums[index] = maximum
+
+        if self.watchers:
+            self.invalidate_many([self.row(index) for index in indexes])
+
+    def row(self, index: int) -> Row:
+        """ Gets a view of the row at `index`. """
+        if not -len(self.names) <= index < len(self.names):
+            raise IndexError(f"row index {index} out of range")
+        return RowView(self.names, self.currents, self.maximums, index % len(self))
+
+    def set(self, name: str, current: float) -> None:
+        """ Sets the current progress of the row named `name`. """
+        self.row(self._index(name)).current = current
+
+    def update_many(self, updates: Iterable[Tuple[str, float]]) -> None:
+        """
+        Sets the current progress of many rows in one pass.
+        Raises `KeyError`, and changes no rows, if any name is unknown.
+
+        `updates` describes pairs of row names and current progress.
+        """
+        # Find every row before changing any.
+        found = [(self._index(name), current) for name, current in updates]
+
+        for index, current in found:
+            self.row(index).current = current
+
+    def snapshot(self) -> "ColumnarRows":
+        """
+        Gets a detached copy of the columns.
+
+        Each column is copied in one step, so the copy holds consistent values
+        even while other threads are advancing rows.
+        """
+        return ColumnarRows(self.names, self.currents, self.maximums)
+
+    def _index(self, name: str) -> int:
+        """
+        Gets the position of the row named `name`. The names are indexed on the
+        first lookup rather than on creation, so collections that are never
+        searched don't pay for an index.
+        """
+
+        indexes = self._indexes
+        index = None if indexes is None else indexes.get(name)
+
+        if index is None or self.names[index] != name:
+            # Not yet indexed, missing, or the names were changed directly.
+            indexes = {}
+            for position, found in enumerate(self.names):
+                indexes.setdefault(found, position)
+            self._indexes = indexes
+            index = indexes.get(name)
+
+        if index is None:
+            raise KeyError(name)
+
+        return index
+
+    def _iter_views(self) -> Iterator[Row]:
+        """
+        Yields a view of each row in turn. The same view is moved along the
+        columns, so no view is created per row.
+        """
+
+        view = RowView(self.names, self.currents, self.maximums, 0)
+
+        for index in range(len(self.names)):
+            view.index = index
+            yield view
@@ -0,0 +1,142 @@
+""" Hosts the `FrameWriter` class. """
+
+import sys
+from io import TextIOWrapper
+from types import TracebackType
+from typing import Optional, TextIO, Type
+
+BEGIN_SYNCHRONIZED = "\x1b[?2026h"
+""" Asks the terminal to hold drawing until the end of the update. """
+
+END_SYNCHRONIZED = "\x1b[?2026l"
+""" Asks the terminal to draw everything held since the update began. """
+
+HIDE_CURSOR = "\x1b[?25l"
+""" Hides the cursor. """
+
+SHOW_CURSOR = "\x1b[?25h"
+""" Shows the cursor. """
+
+
+class FrameWriter:
+    """
+    Writes frames to a terminal, each in a single write.
+
+    Each frame is encoded into one buffer, which is reused from frame to frame,
+    and sent to the stream in one write and one flush. Frames written to a
+    standard text stream such as `sys.stdout` are sent straight to its
+    underlying binary buffer, so they are encoded only once.
+
+    Terminals that support synchronized output draw a whole frame at once
+    rather than line by line, which prevents tearing. Terminals that don't
+    ignore the request.
+
+    `stream` describes the terminal stream to write to. Defaults to standard
+    output.
+
+    `synchronized` describes whether to wrap each frame in the terminal's
+    synchronized output mode.
+
+    `hide_cursor` describes whether to hide the cursor while frames are drawn.
+    The cursor is shown again when the writer is closed.
+    """
+
+    def __init__(
+        self,
+        stream: Optional[TextIO] = None,
+        synchronized: bool = False,
+        hide_cursor: bool = False,
+    ) -> None:
+        self.stream = stream
+        """ Terminal stream to write to. Standard output if not set. """
+
+        self.synchronized = synchronized
+        """ Whether to wrap each frame in synchronized output mode. """
+
+        self.hide_cursor = hide_cursor
+        """ Whether to hide the cursor while frames are drawn. """
+
+        self.frames = 0
+        """ Number of frames written. """
+
+        self.last_bytes = 0
+        """ Number of bytes written by the most recent frame. """
+
+        self.total_bytes = 0
+        """ Number of bytes written by every frame. """
+
+        self._buffer = bytearray()
+        self._cursor_hidden = False
+
+    def __enter__(self) -> "FrameWriter":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+    @property
+    def average_bytes(self) -> float:
+        """ Average number of bytes written per frame. """
+        return self.total_bytes / self.frames if self.frames else 0.0
+
+    def close(self) -> None:
+        """ Shows the cursor again, if it was hidden. """
+
+        if self._cursor_hidden:
+            self._send(SHOW_CURSOR)
+            self._cursor_hidden = False
+
+    def write(self, frame: str) -> int:
+        """
+        Writes `frame` in a single write, if it is not empty. Returns the number
+        of bytes written, including any escape codes.
+        """
+
+        if not frame:
+            return 0
+
+        prefix = ""
+        suffix = ""
+
+        if self.hide_cursor and not self._cursor_hidden:
+            prefix = HIDE_CURSOR
+            self._cursor_hidden = True
+
+        if self.synchronized:
+            prefix += BEGIN_SYNCHRONIZED
+            suffix = END_SYNCHRONIZED
+
+        written = self._send(prefix, frame, suffix)
+
+        self.frames += 1
+        self.last_bytes = written
+        self.total_bytes += written
+        return written
+
+    def _send(self, *parts: str) -> int:
+        """ Writes `parts` in a single write and returns the number of bytes. """
+
+        stream = self.stream or sys.stdout
+        encoding = getattr(stream, "encoding", None) or "utf-8"
+        errors = getattr(stream, "errors", None) or "strict"
+
+        buffer = self._buffer
+        del buffer[:]
+        for part in parts:
+            buffer += part.encode(encoding, errors)
+
+        if isinstance(stream, TextIOWrapper):
+            # Send any text already waiting in the stream first.
+            stream.flush()
+            stream.buffer.write(buffer)
+            stream.buffer.flush()
+        else:
+            stream.write("".join(parts))
+            stream.flush()
+
+        return len(buffer)
@@ -0,0 +1,63 @@
+""" Hosts the `FrozenLayout` class. """
+
+from typing import Any, Optional, Tuple
+
+from progrow.layout import Layout
+
+
+class FrozenLayout(Layout):
+    """
+    An immutable, hashable `Layout`, for use as a cache key. Create with
+    `Layout.freeze`.
+
+    Frozen layouts are equal when their lengths are equal.
+    """
+
+    __slots__ = ("key",)
+
+    def __init__(
+        self,
+        left_fraction_length: Optional[int] = None,
+        name_length: Optional[int] = None,
+        percent_length: Optional[int] = None,
+        right_fraction_length: Optional[int] = None,
+        rate_length: Optional[int] = None,
+        eta_length: Optional[int] = None,
+    ) -> None:
+        super().__init__(
+            left_fraction_length=left_fraction_length,
+            name_length=name_length,
+            percent_length=percent_length,
+            right_fraction_length=right_fraction_length,
+            rate_length=rate_length,
+            eta_length=eta_length,
+        )
+
+        key = (
+            left_fraction_length,
+            name_length,
+            percent_length,
+            right_fraction_length,
+            rate_length,
+            eta_length,
+        )
+
+        object.__setattr__(self, "key", key)
+
+    key: Tuple[Optional[int], ...]
+    """ Lengths that identify this layout. """
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, FrozenLayout) and self.key == other.key
+
+    def __hash__(self) -> int:
+        return hash(self.key)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if hasattr(self, "key"):
+            raise AttributeError(f"cannot set {name}: layout is frozen")
+        super().__setattr__(name, value)
+
+    def freeze(self) -> "FrozenLayout":
+        """ Returns this layout, which is already frozen. """
+        return self
@@ -0,0 +1,71 @@
+""" Hosts the `FrozenStyle` class. """
+
+from typing import Any, Optional, Tuple
+
+from progrow.style import Style
+
+
+class FrozenStyle(Style):
+    """
+    An immutable, hashable `Style`, for use as a cache key. Create with
+    `Style.freeze`.
+
+    Frozen styles are equal when their options are equal. A frozen style with
+    no `width` still renders to the terminal width, so cache keys should include
+    `Style.width` too.
+    """
+
+    __slots__ = ("key",)
+
+    def __init__(
+        self,
+        color: bool = True,
+        name_suffix: str = " ",
+        show_fraction: bool = False,
+        show_percent: bool = False,
+        width: Optional[int] = None,
+        width_ttl: Optional[float] = None,
+        show_rate: bool = False,
+        show_eta: bool = False,
+    ) -> None:
+        super().__init__(
+            color=color,
+            name_suffix=name_suffix,
+            show_fraction=show_fraction,
+            show_percent=show_percent,
+            width=width,
+            width_ttl=width_ttl,
+            show_rate=show_rate,
+            show_eta=show_eta,
+        )
+
+        key = (
+            color,
+            name_suffix,
+            show_fraction,
+            show_percent,
+            width,
+            width_ttl,
+            show_rate,
+            show_eta,
+        )
+
+        object.__setattr__(self, "key", key)
+
+    key: Tuple[bool, str, bool, bool, Optional[int], Optional[float], bool, bool]
+    """ Options that identify this style. """
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, FrozenStyle) and self.key == other.key
+
+    def __hash__(self) -> int:
+        return hash(self.key)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if hasattr(self, "key"):
+            raise AttributeError(f"cannot set {name}: style is frozen")
+        super().__setattr__(name, value)
+
+    def freeze(self) -> "FrozenStyle":
+        """ Returns this style, which is already frozen. """
+        return self
@@ -0,0 +1,101 @@
+""" Hosts the `Journal` class. """
+
+from threading import Lock
+from time import time
+from typing import BinaryIO, Callable, Iterator, Tuple
+
+from progrow.columnar_rows import ColumnarRows
+from progrow.row import Row
+from progrow.rows import Rows
+
+Entry = Tuple[float, str, float, float]
+""" Time of an update, and the row's name, current and maximum progress. """
+
+
+class Journal:
+    """
+    Appends timestamped updates of rows to a stream, to restore or replay with
+    `Replay`.
+
+    Each update is one line holding a JSON array of the time, the row's name,
+    current progress and maximum progress. Lines are only ever appended, so a
+    journal cut short, for example by a crash, loses at most its last line.
+
+    `stream` describes the binary stream to append to. For example, a file
+    opened with mode `"ab"`. Call `Journal.flush` to push buffered updates to
+    the file.
+
+    `clock` describes the clock to timestamp updates with, in seconds.
+    """
+
+    def __init__(
+        self,
+        stream: BinaryIO,
+        clock: Callable[[], float] = time,
+    ) -> None:
+        self.stream = stream
+        """ Binary stream to append to. """
+
+        self.clock = clock
+        """ Clock to timestamp updates with, in seconds. """
+
+        self.entries = 0
+        """ Number of updates recorded. """
+
+        # json is imported on use, so that importing progrow stays fast.
+        from json import JSONEncoder
+
+        self._encode = JSONEncoder(ensure_ascii=False).encode
+        self._lock = Lock()
+
+    @staticmethod
+    def read(stream: BinaryIO) -> Iterator[Entry]:
+        """
+        Reads the updates in a journal, in the order they were recorded. Lines
+        that cannot be read, such as a last line cut short, are skipped.
+        """
+
+        from json import loads
+
+        for line in stream:
+            try:
+                at, name, current, maximum = loads(line)
+            except (TypeError, ValueError):
+                continue
+            yield at, name, current, maximum
+
+    def flush(self) -> None:
+        """ Pushes buffered updates to the stream's file. """
+        with self._lock:
+            self.stream.flush()
+
+    def record(self, row: Row) -> None:
+        """ Appends the current values of `row`. """
+
+        with row.lock:
+            current = row.current
+            maximum = row.maximum
+
+        entry = [self.clock(), row.name, current, maximum]
+        line = (self._encode(entry) + "\n").encode("utf-8")
+
+        with self._lock:
+            self.stream.write(line)
+            self.entries += 1
+
+    def watch(self, rows: Rows) -> None:
+        """
+        Records every row in `rows` now, and then every row that is appended or
+        changed.
+
+        Rows stored in columns don't report their changes, so a `ColumnarRows`
+        cannot be watched. Call `Journal.record` for each change instead.
+        """
+
+        if isinstance(rows, ColumnarRows):
+            raise TypeError("ColumnarRows do not report changes to watch")
+
+        for row in rows.rows:
+            self.record(row)
+
+        rows.watchers.append(self.record)
@@ -1,7 +1,12 @@
 """ Hosts the `Layout` class. """
 
+from typing import TYPE_CHECKING, Optional
 
-from typing import Optional
+from progrow.rate_text import ETA_LENGTH, RATE_LENGTH
+from progrow.style import Style
+
+if TYPE_CHECKING:
+    from progrow.frozen_layout import FrozenLayout
 
 
 class Layout:
@@ -25,14 +30,30 @@ class Layout:
 
     `right_fraction_length` describes the length to reserve for the denominator
     part of the fraction. For example, `3` to accommodate a three-digit value.
+
+    `rate_length` describes the length to reserve for the rate of progress.
+
+    `eta_length` describes the length to reserve for the estimated time
+    remaining.
     """
 
+    __slots__ = (
+        "eta_length",
+        "left_fraction_length",
+        "name_length",
+        "percent_length",
+        "rate_length",
+        "right_fraction_length",
+    )
+
     def __init__(
         self,
         left_fraction_length: Optional[int] = None,
         name_length: Optional[int] = None,
         percent_length: Optional[int] = None,
         right_fraction_length: Optional[int] = None,
+        rate_length: Optional[int] = None,
+        eta_length: Optional[int] = None,
     ) -> None:
         self.left_fraction_length = left_fraction_length
         """
@@ -63,6 +84,12 @@ class Layout:
         For example, `3` to accommodate a three-digit value.
         """
 
+        self.rate_length = rate_length
+        """ Length to reserve for the rate of progress. """
+
+        self.eta_length = eta_length
+        """ Length to reserve for the estimated time remaining. """
+
     def consider_left_fraction(self, length: int) -> None:
         """
         Sets `Layout.left_fraction_length` to `length` if `length` is larger.
@@ -86,3 +113,58 @@ class Layout:
         Sets `Layout.right_fraction_length` to `length` if `length` is larger.
         """
         self.right_fraction_length = max(self.right_fraction_length or 0, length)
+
+    @classmethod
+    def from_widths(
+        cls,
+        style: Style,
+        name: Optional[int] = None,
+        left_fraction: Optional[int] = None,
+        right_fraction: Optional[int] = None,
+        percent: Optional[int] = None,
+    ) -> "Layout":
+        """
+        Creates a layout to align rows in `style`, given the widest unpadded
+        parts of those rows as measured by `Row.measure`.
+
+        `name`, `left_fraction`, `right_fraction` and `percent` describe the
+        widest name, enumerator, denominator and percentage, if any.
+
+        Rates and estimated times are formatted to fixed maximum lengths, so
+        they are sized without measuring any rows.
+        """
+
+        layout = cls()
+
+        if name is not None:
+            layout.name_length = name + len(style.name_suffix)
+
+        if style.show_fraction:
+            layout.left_fraction_length = left_fraction
+            layout.right_fraction_length = right_fraction
+
+        if style.show_percent and percent is not None:
+            layout.percent_length = percent + len(style.percent_prefix)
+
+        if style.show_rate:
+            layout.rate_length = RATE_LENGTH + len(style.rate_prefix)
+
+        if style.show_eta:
+            layout.eta_length = ETA_LENGTH + len(style.eta_prefix)
+
+        return layout
+
+    def freeze(self) -> "FrozenLayout":
+        """
+        Gets an immutable, hashable copy of this layout. See `FrozenLayout`.
+        """
+        from progrow.frozen_layout import FrozenLayout
+
+        return FrozenLayout(
+            left_fraction_length=self.left_fraction_length,
+            name_length=self.name_length,
+            percent_length=self.percent_length,
+            right_fraction_length=self.right_fraction_length,
+            rate_length=self.rate_length,
+            eta_length=self.eta_length,
+        )
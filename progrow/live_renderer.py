@@ -0,0 +1,187 @@
+""" Hosts the `LiveRenderer` class. """
+
+import sys
+from itertools import islice
+from os import get_terminal_size
+from typing import List, Optional, TextIO, Union
+
+from progrow.frame_writer import FrameWriter
+from progrow.rows import Rows
+from progrow.style import Style
+from progrow.terminal_width import terminal_width
+from progrow.viewport import Viewport
+
+CURSOR_DOWN = "\x1b[{}B"
+""" Moves the cursor down a number of lines. """
+
+CURSOR_UP = "\x1b[{}A"
+""" Moves the cursor up a number of lines. """
+
+ERASE_DOWN = "\x1b[J"
+""" Erases from the cursor to the end of the screen. """
+
+ERASE_LINE_END = "\x1b[K"
+""" Erases from the cursor to the end of the line. """
+
+
+class LiveRenderer:
+    """
+    Renders rows in place in a terminal, redrawing only the lines that changed
+    since the previous frame.
+
+    Create the renderer on the main thread, so that it can watch for terminal
+    resizes even if frames are drawn from other threads. See `TerminalWidth`.
+
+    Lines that scroll off the top of the terminal can't be redrawn, so frames
+    are cropped to fit the terminal's height. Render through a `Viewport` to
+    choose which rows to show.
+
+    `rows` describes the rows to render, or a `Viewport` onto them.
+
+    `stream` describes the terminal stream to write to. Defaults to standard
+    output. Ignored if `writer` is set.
+
+    `style` describes the style to render with.
+
+    `writer` describes the writer to send frames through, for example to use
+    synchronized output or hide the cursor. Defaults to a plain `FrameWriter`.
+
+    `height` describes the maximum number of lines to draw. Defaults to one
+    less than the height of the stream's terminal, and no limit if the stream
+    is not a terminal.
+    """
+
+    def __init__(
+        self,
+        rows: Union[Rows, Viewport],
+        stream: Optional[TextIO] = None,
+        style: Optional[Style] = None,
+        writer: Optional[FrameWriter] = None,
+        height: Optional[int] = None,
+    ) -> None:
+        self.rows = rows
+        """ Rows to render. """
+
+        self.writer = writer or FrameWriter(stream)
+        """ Writer to send frames through. """
+
+        self.style = style or Style()
+        """ Style to render with. """
+
+        self.height = height
+        """
+        Maximum number of lines to draw, or `None` to fit the stream's terminal.
+        """
+
+        self.lines: List[str] = []
+        """ Lines of the previous frame, as they are on the screen. """
+
+        terminal_width.watch()
+
+    @property
+    def stream(self) -> Optional[TextIO]:
+        """ Terminal stream to write to. Standard output if not set. """
+        return self.writer.stream
+
+    @stream.setter
+    def stream(self, value: Optional[TextIO]) -> None:
+        self.writer.stream = value
+
+    def close(self) -> None:
+        """ Restores the terminal after the final frame. See `FrameWriter.close`. """
+        self.writer.close()
+
+    def forget(self) -> None:
+        """
+        Forgets the previous frame so the next frame is drawn in full below the
+        cursor.
+
+        Call this if anything else has written to the terminal since the last
+        frame.
+        """
+        self.lines = []
+
+    def next_frame(self) -> str:
+        """
+        Renders the rows and returns the escape codes and lines that update the
+        previous frame, without writing them. Pass the result to
+        `LiveRenderer.write`.
+        """
+        lines = islice(self.rows.iter_render(self.style), self._max_lines())
+        return self.render_frame(list(lines))
+
+    def render(self) -> None:
+        """ Renders a frame in a single write. """
+        self.write(self.next_frame())
+
+    def write(self, frame: str) -> int:
+        """
+        Writes `frame` to the stream in a single write, if it is not empty.
+        Returns the number of bytes written.
+        """
+        return self.writer.write(frame)
+
+    def render_frame(self, lines: List[str]) -> str:
+        """
+        Returns the escape codes and lines that turn the previous frame into
+        `lines`, and remembers `lines` as the previous frame. Lines that don't
+        fit the terminal's height are dropped.
+
+        The cursor is expected at the start of the line below the previous frame
+        and is left at the start of the line below the new frame.
+        """
+
+        max_lines = self._max_lines()
+        if max_lines is not None:
+            lines = lines[:max_lines]
+
+        previous = self.lines
+        height = len(previous)
+        cursor = height
+        at_line_start = True
+        out: List[str] = []
+
+        for index, line in enumerate(lines[:height]):
+            if line == previous[index]:
+                continue
+            if index < cursor:
+                out.append(CURSOR_UP.format(cursor - index))
+            elif index > cursor:
+                out.append(CURSOR_DOWN.format(index - cursor))
+            out.append("\r" + line + ERASE_LINE_END)
+            cursor = index
+            at_line_start = False
+
+        target = min(height, len(lines))
+
+        if cursor < target:
+            out.append(CURSOR_DOWN.format(target - cursor))
+        elif cursor > target:
+            out.append(CURSOR_UP.format(cursor - target))
+        if not at_line_start:
+            out.append("\r")
+
+        if len(lines) > height:
+            out.extend(line + "\n" for line in lines[height:])
+        elif len(lines) < height:
+            out.append(ERASE_DOWN)
+
+        self.lines = lines
+        return "".join(out)
+
+    def _max_lines(self) -> Optional[int]:
+        """ Gets the maximum number of lines to draw, or `None` for no limit. """
+
+        if self.height is not None:
+            return self.height
+
+        stream = self.stream or sys.stdout
+
+        try:
+            lines = get_terminal_size(stream.fileno()).lines
+        except (AttributeError, OSError, ValueError):
+            # Not a terminal, so no line can scroll out of reach.
+            return None
+
+        # Leave the line below the frame for the cursor.
+        return max(lines - 1, 1)
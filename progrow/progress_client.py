@@ -0,0 +1,163 @@
+""" Hosts the `ProgressClient` class. """
+
+from threading import Lock
+from time import monotonic
+from types import TracebackType
+from typing import TYPE_CHECKING, Callable, Dict, Optional, Tuple, Type
+
+from progrow.progress_packets import encode_packet
+
+if TYPE_CHECKING:
+    from socket import socket
+
+
+class ProgressClient:
+    """
+    Sends progress to a `ProgressServer` over a Unix domain socket.
+
+    Updates are held and coalesced by row name, so only the latest values of
+    each row are sent. Pending updates are sent together in a single packet at
+    most once every `interval` seconds, so a process that updates a row for
+    every item sends only a handful of packets per second. Pending updates are
+    also sent by `ProgressClient.flush` and when the client is closed.
+
+    Updates are only sent while the process is updating rows, so close the
+    client, or use it as a context manager, to send the final values.
+
+    If the server can't be reached, the client counts the failure in
+    `ProgressClient.errors`, keeps the pending updates and tries again with the
+    next packet, so a stopped server never raises into the process.
+
+    `path` describes the path of the server's socket.
+
+    `interval` describes the minimum number of seconds between packets.
+
+    `clock` describes the monotonic clock, in seconds, used to space packets.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        interval: float = 0.2,
+        clock: Callable[[], float] = monotonic,
+    ) -> None:
+        self.path = path
+        """ Path of the server's socket. """
+
+        self.interval = interval
+        """ Minimum number of seconds between packets. """
+
+        self.clock = clock
+        """ Monotonic clock, in seconds. """
+
+        self.errors = 0
+        """ Number of packets that could not be sent. """
+
+        self.packets = 0
+        """ Number of packets sent. """
+
+        self._lock = Lock()
+        self._next_send = clock()
+        self._pending: Dict[str, Tuple[float, float]] = {}
+        self._socket: Optional["socket"] = None
+        self._values: Dict[str, Tuple[float, float]] = {}
+
+    def __enter__(self) -> "ProgressClient":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+    def advance(self, name: str, amount: float = 1) -> float:
+        """
+        Adds `amount` to the current progress of the row named `name`, which
+        must have been sent by `ProgressClient.update` first. Returns the new
+        value.
+        """
+
+        with self._lock:
+            current, maximum = self._values[name]
+            current += amount
+            self._set(name, current, maximum)
+
+        return current
+
+    def close(self) -> None:
+        """ Sends any pending updates and disconnects. """
+
+        self.flush()
+
+        with self._lock:
+            if self._socket:
+                self._socket.close()
+                self._socket = None
+
+    def flush(self) -> None:
+        """ Sends any pending updates now. """
+
+        with self._lock:
+            self._send()
+
+    def update(self, name: str, current: float, maximum: float) -> None:
+        """
+        Sets the progress of the row named `name`. The update is sent with the
+        next packet.
+        """
+
+        with self._lock:
+            self._set(name, current, maximum)
+
+    def _connect(self) -> "socket":
+        # The socket module is imported on use, so that importing progrow
+        # stays fast.
+        from socket import AF_UNIX, SOCK_STREAM, socket
+
+        connection = socket(AF_UNIX, SOCK_STREAM)
+        try:
+            connection.connect(self.path)
+        except OSError:
+            connection.close()
+            raise
+        return connection
+
+    def _send(self) -> None:
+        pending = self._pending
+
+        if not pending:
+            return
+
+        packet = encode_packet(
+            (name, current, maximum) for name, (current, maximum) in pending.items()
+        )
+
+        # Whether or not the packet is sent, wait for the next interval so that
+        # an unreachable server isn't retried on every update.
+        self._next_send = self.clock() + self.interval
+
+        try:
+            if not self._socket:
+                self._socket = self._connect()
+            self._socket.sendall(packet)
+        except OSError:
+            if self._socket:
+                self._socket.close()
+                self._socket = None
+            self.errors += 1
+            return
+
+        self._pending = {}
+        self.packets += 1
+
+    def _set(self, name: str, current: float, maximum: float) -> None:
+        """ Records an update. Must be called with the lock held. """
+
+        self._values[name] = (current, maximum)
+        self._pending[name] = (current, maximum)
+
+        if self.clock() >= self._next_send:
+            self._send()
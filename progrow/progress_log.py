@@ -0,0 +1,199 @@
+""" Hosts the `ProgressLog` class. """
+
+import sys
+from array import array
+from math import floor
+from threading import Lock
+from time import monotonic
+from typing import Callable, Dict, MutableSequence, Optional, TextIO, Union
+
+from progrow.columnar_rows import ColumnarRows
+from progrow.live_renderer import LiveRenderer
+from progrow.rate_text import format_eta, format_rate
+from progrow.row import Row, percent_of
+from progrow.rows import Rows
+from progrow.striped_lock import StripedLock
+from progrow.style import Style
+
+UNSEEN = -(2**63)
+""" Step recorded for a row that has not been checked yet. """
+
+
+class ProgressLog:
+    """
+    Writes a line for a row whenever it reaches a new percentage step, for
+    output that is not a terminal, such as a service log.
+
+    Rows are checked as they change, in constant time per change. The last step
+    and line time of each row are kept in compact arrays. Rows that don't change
+    write nothing.
+
+    Rows stored in columns don't report their changes, so call
+    `ProgressLog.poll` to check a `ColumnarRows`.
+
+    `rows` describes the rows to log.
+
+    `stream` describes the stream to write to. Defaults to standard output.
+
+    `step` describes the percentage step to log at. For example, `10` to log
+    each row at 10%, 20% and so on.
+
+    `interval` describes an optional number of seconds after which a row that
+    has changed is logged even if it has not reached a new step.
+
+    `clock` describes the monotonic clock, in seconds.
+    """
+
+    def __init__(
+        self,
+        rows: Rows,
+        stream: Optional[TextIO] = None,
+        step: float = 10,
+        interval: Optional[float] = None,
+        clock: Callable[[], float] = monotonic,
+    ) -> None:
+        if not 0 < step <= 100:
+            raise ValueError(f"step must be between 0 and 100, not {step}")
+
+        self.rows = rows
+        """ Rows to log. """
+
+        self.stream = stream
+        """ Stream to write to. Standard output if not set. """
+
+        self.step = step
+        """ Percentage step to log at. """
+
+        self.interval = interval
+        """ Seconds after which a changed row is logged regardless of step. """
+
+        self.clock = clock
+        """ Monotonic clock, in seconds. """
+
+        self.lines = 0
+        """ Number of lines written. """
+
+        self._slots: Dict[Row, int] = {}
+        self._steps: MutableSequence[int] = array("q")
+        self._times: MutableSequence[float] = array("d")
+
+        # Rows are checked under striped locks, so that threads updating
+        # different rows rarely wait on each other. This lock is only taken to
+        # add rows and to write lines.
+        self._lock = Lock()
+        self._locks = StripedLock()
+
+        if isinstance(rows, ColumnarRows):
+            for index in range(len(rows)):
+                self._check(index, rows.row(index), write=False)
+        else:
+            for row in rows.rows:
+                self._check(self._slot(row), row, write=False)
+            rows.watchers.append(self.update)
+
+    def format(self, row: Row) -> str:
+        """
+        Formats the line to log for `row`. For example,
+        `apple harvest 23 / 100 (23%)`. Rows with a `Row.rate_estimator` include
+        their rate and estimated time remaining.
+        """
+
+        current = row.current
+        maximum = row.maximum
+        percent = floor(percent_of(current, maximum) * 100)
+        line = f"{row.name} {current:,} / {maximum:,} ({percent}%)"
+
+        if row.rate_estimator is not None:
+            line += f" {format_rate(row.rate)} {format_eta(row.eta)}"
+
+        return line
+
+    def poll(self) -> None:
+        """
+        Checks every row and logs those that reached a new step. Only needed
+        for a `ColumnarRows`, whose rows don't report their changes.
+        """
+
+        if isinstance(self.rows, ColumnarRows):
+            for index in range(len(self.rows)):
+                self._check(index, self.rows.row(index))
+        else:
+            for row in self.rows.rows:
+                self.update(row)
+
+    def update(self, row: Row) -> None:
+        """
+        Logs `row` if it reached a new step. `Rows` calls this whenever a row is
+        appended or changed.
+        """
+        self._check(self._slot(row), row)
+
+    def _check(self, slot: int, row: Row, write: bool = True) -> None:
+        with row.lock:
+            current = row.current
+            maximum = row.maximum
+
+        step = floor(percent_of(current, maximum) * 100 / self.step)
+        now = self.clock()
+
+        if slot >= len(self._steps):
+            self._reserve(slot)
+
+        with self._locks[slot]:
+            interval = self.interval
+            due = interval is not None and now - self._times[slot] >= interval
+            known = self._steps[slot]
+
+            if known == UNSEEN:
+                # First sight of this row: remember where it started.
+                write = False
+            elif step == known and not due:
+                return
+
+            self._steps[slot] = step
+            self._times[slot] = now
+
+        if write:
+            line = self.format(row.snapshot()) + "\n"
+            with self._lock:
+                stream = self.stream or sys.stdout
+                stream.write(line)
+                self.lines += 1
+
+    def _reserve(self, slot: int) -> None:
+        """ Makes room to record rows up to and including `slot`. """
+
+        with self._lock:
+            while len(self._steps) <= slot:
+                self._steps.append(UNSEEN)
+                self._times.append(0.0)
+
+    def _slot(self, row: Row) -> int:
+        slot = self._slots.get(row)
+        if slot is None:
+            with self._lock:
+                slot = self._slots.setdefault(row, len(self._slots))
+        return slot
+
+
+def progress_output(
+    rows: Rows,
+    stream: Optional[TextIO] = None,
+    style: Optional[Style] = None,
+    step: float = 10,
+    interval: Optional[float] = None,
+) -> Union[LiveRenderer, ProgressLog]:
+    """
+    Creates a `LiveRenderer` for `rows` if `stream` is a terminal, or a
+    `ProgressLog` otherwise.
+
+    `stream` describes the stream to write to. Defaults to standard output.
+
+    `style` describes the style to render with in a terminal.
+
+    `step` and `interval` describe when to log a row when not in a terminal.
+    """
+
+    if (stream or sys.stdout).isatty():
+        return LiveRenderer(rows, stream=stream, style=style)
+    return ProgressLog(rows, stream=stream, step=step, interval=interval)
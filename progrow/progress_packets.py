@@ -0,0 +1,73 @@
+""" Encodes and decodes the packets sent to a `ProgressServer`. """
+
+from struct import Struct
+from typing import Iterable, List, Tuple
+
+from progrow.row_view import unbox
+
+HEADER = Struct("!I")
+""" Length of the body that follows, in bytes. """
+
+RECORD = Struct("!ddH")
+""" Current progress, maximum progress and length of the name that follows. """
+
+MAX_BODY = 16 * 1024 * 1024
+""" Largest body a server accepts, in bytes. """
+
+MAX_NAME = 0xFFFF
+""" Longest name that can be sent, in UTF-8 bytes. """
+
+Update = Tuple[str, float, float]
+""" A row's name, current progress and maximum progress. """
+
+
+def decode_body(body: bytes) -> List[Update]:
+    """
+    Decodes the body of a packet. Whole-number values are returned as `int`, so
+    that they render as they would have in the sending process.
+
+    Raises `ValueError` if the body is malformed.
+    """
+
+    updates: List[Update] = []
+    offset = 0
+    end = len(body)
+
+    while offset < end:
+        if offset + RECORD.size > end:
+            raise ValueError("packet ends part-way through an update")
+
+        current, maximum, length = RECORD.unpack_from(body, offset)
+        offset += RECORD.size
+
+        if offset + length > end:
+            raise ValueError("packet ends part-way through a name")
+
+        name = body[offset : offset + length].decode("utf-8")
+        offset += length
+        updates.append((name, unbox(current), unbox(maximum)))
+
+    return updates
+
+
+def encode_packet(updates: Iterable[Update]) -> bytes:
+    """
+    Encodes a batch of updates as a packet: a header describing the length of
+    the body, and then each update's values and name.
+    """
+
+    parts: List[bytes] = [b""]
+
+    for name, current, maximum in updates:
+        encoded = name.encode("utf-8")
+        if len(encoded) > MAX_NAME:
+            raise ValueError(f"name is too long to send: {len(encoded)} bytes")
+        parts.append(RECORD.pack(current, maximum, len(encoded)))
+        parts.append(encoded)
+
+    body_length = sum(map(len, parts))
+    if body_length > MAX_BODY:
+        raise ValueError(f"batch is too large to send: {body_length} bytes")
+
+    parts[0] = HEADER.pack(body_length)
+    return b"".join(parts)
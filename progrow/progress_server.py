@@ -0,0 +1,294 @@
+""" Hosts the `ProgressServer` class. """
+
+from threading import Event, Lock, Thread
+from types import TracebackType
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple, Type, cast
+
+from progrow.live_renderer import LiveRenderer
+from progrow.progress_packets import HEADER, MAX_BODY, Update, decode_body
+from progrow.refresh_scheduler import RefreshScheduler
+from progrow.rows import Rows
+
+if TYPE_CHECKING:
+    from selectors import BaseSelector
+    from socket import socket
+
+
+class ProgressServer:
+    """
+    Gathers progress from many processes over a Unix domain socket and renders
+    it as one live view.
+
+    Each process sends batches of updates with a `ProgressClient`. Rows are
+    added the first time their name is seen and updated by name after that, and
+    each batch is applied to `ProgressServer.rows` in one step. Frames are
+    drawn by a `RefreshScheduler`, so busy clients cannot make the view redraw
+    more than `fps` times per second.
+
+    Start the server with `ProgressServer.start` to serve from a background
+    thread, or `ProgressServer.serve` to serve from the calling thread. When
+    used as a context manager, the server is started on entry and closed on
+    exit. Requires a platform with Unix domain sockets.
+
+    `path` describes the path to create the socket at.
+
+    `rows` describes the rows to merge updates into.
+
+    `renderer` describes the renderer to draw frames with. Defaults to a
+    `LiveRenderer` writing to standard output.
+
+    `fps` describes the maximum number of frames to render per second.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        rows: Optional[Rows] = None,
+        renderer: Optional[LiveRenderer] = None,
+        fps: float = 10.0,
+    ) -> None:
+        self.path = path
+        """ Path of the socket. """
+
+        self.rows = Rows() if rows is None else rows
+        """ Rows that updates are merged into. """
+
+        self.scheduler = RefreshScheduler(self.rows, renderer=renderer, fps=fps)
+        """ Scheduler that draws frames of the rows. """
+
+        self.packets = 0
+        """ Number of packets received. """
+
+        self.updates = 0
+        """ Number of updates received. """
+
+        self._buffers: Dict["socket", bytearray] = {}
+        self._listener: Optional["socket"] = None
+        self._selector: Optional["BaseSelector"] = None
+        self._serving = Lock()
+        self._stop = Event()
+        self._thread: Optional[Thread] = None
+
+    def __enter__(self) -> "ProgressServer":
+        self.start()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+    def apply(self, updates: List[Update]) -> None:
+        """
+        Merges a batch of updates into the rows. Rows are appended if their
+        name is new.
+        """
+
+        rows = self.rows
+        currents: List[Tuple[str, float]] = []
+
+        for name, current, maximum in updates:
+            try:
+                row = rows[name]
+            except KeyError:
+                rows.append(name, current=current, maximum=maximum)
+                continue
+
+            if row.maximum != maximum:
+                row.maximum = maximum
+
+            currents.append((name, current))
+
+        rows.update_many(currents)
+        self.packets += 1
+        self.updates += len(updates)
+        self.scheduler.touch()
+
+    def close(self) -> None:
+        """
+        Stops serving, disconnects every client, renders a final frame and
+        removes the socket.
+        """
+
+        self._stop.set()
+
+        thread = self._thread
+        if thread:
+            thread.join()
+            self._thread = None
+
+        # Wait for any other thread serving clients to notice and stop.
+        with self._serving:
+            pass
+
+        for client in list(self._buffers):
+            self._disconnect(client)
+
+        if self._selector:
+            self._selector.close()
+            self._selector = None
+
+        if self._listener:
+            from os import unlink
+
+            self._listener.close()
+            self._listener = None
+            unlink(self.path)
+
+        self.scheduler.close()
+
+    def listen(self) -> None:
+        """
+        Creates the socket, if it hasn't been created already. A socket left
+        behind by a server that has stopped is replaced.
+        """
+
+        if self._listener:
+            return
+
+        # The socket modules are imported on use, so that importing progrow
+        # stays fast.
+        from selectors import EVENT_READ, DefaultSelector
+        from socket import AF_UNIX, SOCK_STREAM, socket
+
+        listener = socket(AF_UNIX, SOCK_STREAM)
+        try:
+            try:
+                listener.bind(self.path)
+            except OSError:
+                if not self._stale():
+                    raise
+                from os import unlink
+
+                unlink(self.path)
+                listener.bind(self.path)
+        except OSError:
+            listener.close()
+            raise
+
+        listener.listen()
+        listener.setblocking(False)
+
+        self._selector = DefaultSelector()
+        self._selector.register(listener, EVENT_READ)
+        self._listener = listener
+        self._stop.clear()
+
+    def serve(self, poll_interval: float = 0.1) -> None:
+        """
+        Serves clients from the calling thread until `ProgressServer.close` is
+        called from another thread.
+
+        `poll_interval` describes the maximum number of seconds to wait before
+        checking whether to stop, and rendering any frame that has fallen due.
+        """
+
+        self.listen()
+        selector = self._selector
+
+        with self._serving:
+            while selector and not self._stop.is_set():
+                for key, _ in selector.select(poll_interval):
+                    if key.fileobj is self._listener:
+                        self._accept()
+                    else:
+                        self._receive(cast("socket", key.fileobj))
+
+                self.scheduler.tick()
+
+    def start(self) -> None:
+        """ Creates the socket and serves clients from a background thread. """
+
+        if self._thread:
+            return
+
+        self.listen()
+        self._thread = Thread(target=self.serve, daemon=True)
+        self._thread.start()
+
+    def _accept(self) -> None:
+        from selectors import EVENT_READ
+
+        if not self._listener or not self._selector:
+            return
+
+        try:
+            client, _ = self._listener.accept()
+        except BlockingIOError:
+            return
+
+        client.setblocking(False)
+        self._buffers[client] = bytearray()
+        self._selector.register(client, EVENT_READ)
+
+    def _disconnect(self, client: "socket") -> None:
+        if self._selector:
+            self._selector.unregister(client)
+        del self._buffers[client]
+        client.close()
+
+    def _receive(self, client: "socket") -> None:
+        try:
+            data = client.recv(65536)
+        except BlockingIOError:
+            return
+        except OSError:
+            data = b""
+
+        if not data:
+            self._disconnect(client)
+            return
+
+        buffer = self._buffers[client]
+        buffer += data
+
+        while len(buffer) >= HEADER.size:
+            (length,) = HEADER.unpack_from(buffer)
+
+            if length > MAX_BODY:
+                # Not one of our clients, or hopelessly out of step.
+                self._disconnect(client)
+                return
+
+            end = HEADER.size + length
+            if len(buffer) < end:
+                return
+
+            body = bytes(buffer[HEADER.size : end])
+            del buffer[:end]
+
+            try:
+                updates = decode_body(body)
+            except ValueError:
+                self._disconnect(client)
+                return
+
+            self.apply(updates)
+
+    def _stale(self) -> bool:
+        """
+        Checks whether the path is a socket that no server is listening on.
+        """
+
+        from os import stat
+        from socket import AF_UNIX, SOCK_STREAM, socket
+        from stat import S_ISSOCK
+
+        try:
+            if not S_ISSOCK(stat(self.path).st_mode):
+                return False
+        except OSError:
+            return False
+
+        with socket(AF_UNIX, SOCK_STREAM) as probe:
+            try:
+                probe.connect(self.path)
+            except ConnectionRefusedError:
+                return True
+            except OSError:
+                return False
+
+        return False
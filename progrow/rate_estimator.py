@@ -0,0 +1,93 @@
+""" Hosts the `RateEstimator` class. """
+
+from math import exp, log
+from time import monotonic
+from typing import Callable, Optional, Tuple
+
+
+class RateEstimator:
+    """
+    Estimates the rate of progress as an exponentially weighted moving average.
+
+    Each update costs the same and the estimator holds a fixed handful of
+    values, however long the work runs. Recent progress counts for more than
+    older progress, and time without progress counts as progress at a rate of
+    zero, so a stalled row's rate falls away.
+
+    `half_life` describes the number of seconds after which progress counts
+    for half as much.
+
+    `clock` describes the monotonic clock, in seconds.
+    """
+
+    __slots__ = ("clock", "half_life", "state", "_tau")
+
+    def __init__(
+        self,
+        half_life: float = 10.0,
+        clock: Callable[[], float] = monotonic,
+    ) -> None:
+        if half_life <= 0:
+            raise ValueError(f"half_life must be positive, not {half_life}")
+
+        self.clock = clock
+        """ Monotonic clock, in seconds. """
+
+        self.half_life = half_life
+        """ Number of seconds after which progress counts for half as much. """
+
+        self.state: Optional[Tuple[float, float, float, float]] = None
+        """
+        Weighted rate, total weight, time and value of the latest update, or
+        `None` before the first update. Replaced in a single step, so readers
+        always see a consistent state.
+        """
+
+        self._tau = half_life / log(2)
+
+    def rate(self) -> Optional[float]:
+        """
+        Gets the estimated progress per second, or `None` until progress has
+        been recorded over some time.
+        """
+
+        state = self.state
+
+        if state is None:
+            return None
+
+        weighted, weight, at, _ = state
+        decay = exp(-(self.clock() - at) / self._tau)
+        weight = decay * weight + (1.0 - decay)
+
+        if weight <= 0:
+            return None
+
+        return (decay * weighted) / weight
+
+    def update(self, value: float) -> None:
+        """ Records that the progress is now `value`. """
+
+        now = self.clock()
+        state = self.state
+
+        if state is None:
+            self.state = (0.0, 0.0, now, value)
+            return
+
+        weighted, weight, at, previous = state
+        elapsed = now - at
+
+        if elapsed <= 0:
+            # Fold progress made within the same tick into the next update.
+            return
+
+        decay = exp(-elapsed / self._tau)
+        instant = (value - previous) / elapsed
+
+        self.state = (
+            decay * weighted + (1.0 - decay) * instant,
+            decay * weight + (1.0 - decay),
+            now,
+            value,
+        )
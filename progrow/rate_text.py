@@ -0,0 +1,58 @@
+""" Hosts the rate and ETA formatting functions. """
+
+from math import isfinite
+from typing import Optional
+
+ETA_LENGTH = 12
+""" Maximum length of a formatted ETA. For example, `ETA 99:59:59`. """
+
+RATE_LENGTH = 7
+""" Maximum length of a formatted rate. For example, `99.9k/s`. """
+
+RATE_UNITS = ("", "k", "M", "G", "T", "P")
+""" Suffixes for each thousandfold of a rate. """
+
+
+def format_eta(seconds: Optional[float]) -> str:
+    """
+    Formats an estimated number of seconds remaining. For example, `ETA 1:05`
+    or `ETA 2:01:05`. Unknown and very long estimates are formatted as `ETA -`
+    and `ETA >99h`.
+    """
+
+    if seconds is None or not isfinite(seconds):
+        return "ETA -"
+
+    whole = max(0, int(seconds + 0.5))
+
+    if whole >= 100 * 3600:
+        return "ETA >99h"
+
+    hours, remainder = divmod(whole, 3600)
+    minutes, seconds = divmod(remainder, 60)
+
+    if hours:
+        return f"ETA {hours}:{minutes:02}:{seconds:02}"
+
+    return f"ETA {minutes}:{seconds:02}"
+
+
+def format_rate(rate: Optional[float]) -> str:
+    """
+    Formats a rate of progress per second in at most `RATE_LENGTH` characters.
+    For example, `0.5/s`, `123/s` or `12.3k/s`. Unknown rates are formatted as
+    `-/s`, and falling progress as `0.0/s`.
+    """
+
+    if rate is None or not isfinite(rate):
+        return "-/s"
+
+    value = max(0.0, rate)
+    unit = 0
+
+    while value >= 999.5 and unit < len(RATE_UNITS) - 1:
+        value /= 1000
+        unit += 1
+
+    number = f"{value:.1f}" if value < 99.95 else f"{value:.0f}"
+    return f"{number}{RATE_UNITS[unit]}/s"
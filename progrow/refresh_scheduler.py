@@ -0,0 +1,143 @@
+""" Hosts the `RefreshScheduler` class. """
+
+from threading import Event, Thread
+from time import monotonic
+from types import TracebackType
+from typing import Callable, Optional, Type
+
+from progrow.live_renderer import LiveRenderer
+from progrow.row import Row
+from progrow.rows import Rows
+
+
+class RefreshScheduler:
+    """
+    Coalesces any number of row updates into at most `fps` rendered frames per
+    second.
+
+    `rows` describes the rows to render.
+
+    `renderer` describes the renderer to draw frames with. Defaults to a
+    `LiveRenderer` writing to standard output.
+
+    `fps` describes the maximum number of frames to render per second.
+
+    `clock` describes the monotonic clock, in seconds, used to space frames.
+
+    When used as a context manager, a background thread renders pending updates
+    on time and a final frame is always rendered on exit. Otherwise, frames are
+    rendered by `RefreshScheduler.update` when they fall due and by
+    `RefreshScheduler.close`.
+    """
+
+    def __init__(
+        self,
+        rows: Rows,
+        renderer: Optional[LiveRenderer] = None,
+        fps: float = 10.0,
+        clock: Callable[[], float] = monotonic,
+    ) -> None:
+        if fps <= 0:
+            raise ValueError(f"fps must be positive, not {fps}")
+
+        self.rows = rows
+        """ Rows to render. """
+
+        self.renderer = renderer or LiveRenderer(rows)
+        """ Renderer to draw frames with. """
+
+        self.interval = 1.0 / fps
+        """ Minimum number of seconds between frames. """
+
+        self.clock = clock
+        """ Monotonic clock, in seconds. """
+
+        self.frames = 0
+        """ Number of frames rendered. """
+
+        self.pending = False
+        """ Whether any update has not been rendered yet. """
+
+        self.next_frame = clock()
+        """ Clock time at which the next frame may be rendered. """
+
+        self._stop = Event()
+        self._thread: Optional[Thread] = None
+
+    def __enter__(self) -> "RefreshScheduler":
+        self.start()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Stops the background thread, if any, renders a final frame and closes
+        the renderer.
+        """
+
+        thread = self._thread
+
+        if thread:
+            self._stop.set()
+            thread.join()
+            self._thread = None
+
+        self.render()
+        self.renderer.close()
+
+    def render(self) -> None:
+        """ Renders a frame immediately, whether or not one is due. """
+
+        self.pending = False
+        self.next_frame = self.clock() + self.interval
+        self.renderer.render()
+        self.frames += 1
+
+    def start(self) -> None:
+        """ Starts a background thread that renders pending updates on time. """
+
+        if self._thread:
+            return
+
+        self._stop.clear()
+        self._thread = Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def tick(self) -> bool:
+        """
+        Renders a frame if any update is pending and a frame is due. Returns
+        `True` if a frame was rendered.
+        """
+
+        if not self.pending or self.clock() < self.next_frame:
+            return False
+
+        self.render()
+        return True
+
+    def touch(self) -> None:
+        """ Records that rows have changed and need to be rendered. """
+
+        self.pending = True
+
+        if not self._thread:
+            self.tick()
+
+    def update(self, row: Row, current: float) -> None:
+        """
+        Sets `row`'s current progress to `current` and schedules a render.
+        """
+
+        row.current = current
+        self.touch()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.tick()
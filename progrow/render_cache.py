@@ -0,0 +1,148 @@
+""" Hosts the `RenderCache` class. """
+
+from collections import OrderedDict
+from itertools import islice
+from threading import Lock
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, cast
+
+from progrow.frozen_layout import FrozenLayout
+from progrow.frozen_style import FrozenStyle
+from progrow.rate_estimator import RateEstimator
+from progrow.rate_text import format_eta, format_rate
+from progrow.row import Row
+
+BATCH_SIZE = 256
+""" Number of rows to look up in the cache at once. """
+
+Key = Tuple[str, float, type, float, type, object, Optional[str], Optional[str]]
+"""
+Row's name, current progress and its type, maximum progress and its type, the
+frame's layout, style and width, and the rendered rate and estimated time.
+"""
+
+
+class RenderCache:
+    """
+    A bounded, least-recently-used cache of rendered rows.
+
+    Rows are keyed on their name, values, layout and style, so a row that has
+    not changed since the last frame is not rendered again. Values are keyed
+    with their types too, since `1` and `1.0` render differently. Rates and
+    estimated times change as time passes, so they are keyed as they render.
+
+    Pass a cache to `Rows` to use it for every render.
+
+    `maxsize` describes the maximum number of rendered rows to keep.
+    """
+
+    def __init__(self, maxsize: int = 4096) -> None:
+        if maxsize <= 0:
+            raise ValueError(f"maxsize must be positive, not {maxsize}")
+
+        self.maxsize = maxsize
+        """ Maximum number of rendered rows to keep. """
+
+        self.hits = 0
+        """ Number of renders answered from the cache. """
+
+        self.misses = 0
+        """ Number of renders that were not cached. """
+
+        self._lines: "OrderedDict[Key, str]" = OrderedDict()
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._lines)
+
+    def clear(self) -> None:
+        """ Discards every rendered row and resets the counts. """
+        with self._lock:
+            self._lines.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def render(self, row: Row, layout: FrozenLayout, style: FrozenStyle) -> str:
+        """
+        Renders `row`, or returns its previous render if nothing has changed.
+
+        `row` should not change during the call; render a copy of rows that
+        other threads update.
+        """
+        return next(self.render_many((row,), layout, style))
+
+    def render_many(
+        self,
+        rows: Iterable[Row],
+        layout: FrozenLayout,
+        style: FrozenStyle,
+    ) -> Iterator[str]:
+        """
+        Renders each of `rows`, or returns its previous render if nothing has
+        changed. Yields each rendered row without a line break.
+
+        Rows are looked up in batches, so the cache is locked twice for each
+        batch rather than for each row. Each row is read once, as it is
+        reached, so `rows` may yield the same row refilled with each row's
+        values, for example with `Row.copy_from`.
+        """
+
+        frame = (layout, style, style.width)
+        show_rate = style.show_rate
+        show_eta = style.show_eta
+        lines = self._lines
+        remaining = iter(rows)
+
+        while True:
+            keys: List[Key] = []
+            estimators: List[Optional[RateEstimator]] = []
+
+            for row in islice(remaining, BATCH_SIZE):
+                current = row.current
+                maximum = row.maximum
+                keys.append(
+                    (
+                        row.name,
+                        current,
+                        type(current),
+                        maximum,
+                        type(maximum),
+                        frame,
+                        format_rate(row.rate) if show_rate else None,
+                        format_eta(row.eta) if show_eta else None,
+                    )
+                )
+                estimators.append(row.rate_estimator)
+
+            if not keys:
+                return
+
+            with self._lock:
+                found = [lines.get(key) for key in keys]
+                for key, line in zip(keys, found):
+                    if line is not None:
+                        lines.move_to_end(key)
+
+            rendered: Dict[Key, str] = {}
+
+            for index, line in enumerate(found):
+                if line is None:
+                    key = keys[index]
+                    line = rendered.get(key)
+                    if line is None:
+                        # Render from the values in the key, since the row may
+                        # have been refilled since.
+                        name, current, _, maximum = key[:4]
+                        row = Row(name, current, maximum)
+                        row.rate_estimator = estimators[index]
+                        line = row.render(layout, style)
+                        rendered[key] = line
+                    found[index] = line
+
+            with self._lock:
+                self.hits += len(keys) - len(rendered)
+                self.misses += len(rendered)
+                lines.update(rendered)
+                while len(lines) > self.maxsize:
+                    lines.popitem(last=False)
+
+            yield from cast(List[str], found)
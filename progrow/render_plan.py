@@ -0,0 +1,174 @@
+""" Hosts the `RenderPlan` class. """
+
+from math import floor
+
+from progrow.bar import render_bar
+from progrow.colors import get_colors
+from progrow.layout import Layout
+from progrow.rate_text import format_eta, format_rate
+from progrow.row import Row
+from progrow.style import Style
+
+
+class RenderPlan:
+    """
+    A `Layout` and `Style` compiled once to render many rows.
+
+    Everything that is the same for every row is worked out when the plan is
+    created: which parts to render, their prefixes, colour codes and padding,
+    and the width to fill. Rendering a row then costs a few number formats and
+    a join. Rows render exactly as `Row.render` renders them with the same
+    layout and style.
+
+    The width is read from the style once, so create a new plan for each frame
+    if the width may change.
+
+    `layout` describes the layout to render with.
+
+    `style` describes the style to render with.
+    """
+
+    __slots__ = (
+        "_bar_close",
+        "_bar_open",
+        "_eta_length",
+        "_eta_pad",
+        "_eta_post",
+        "_eta_pre",
+        "_fraction_fixed",
+        "_fraction_mid",
+        "_fraction_post",
+        "_fraction_pre",
+        "_left_length",
+        "_name_close",
+        "_name_length",
+        "_name_open",
+        "_name_suffix",
+        "_name_tail",
+        "_percent_fixed",
+        "_percent_pad",
+        "_percent_post",
+        "_percent_pre",
+        "_rate_length",
+        "_rate_pad",
+        "_rate_post",
+        "_rate_pre",
+        "_right_length",
+        "_show_eta",
+        "_show_fraction",
+        "_show_percent",
+        "_show_rate",
+        "_width",
+    )
+
+    def __init__(self, layout: Layout, style: Style) -> None:
+        if style.color:
+            colors = get_colors()
+            bar, fraction, name = colors.bar, colors.fraction, colors.name
+            percent, rate, reset = colors.percent, colors.rate, colors.reset
+        else:
+            bar = fraction = name = percent = rate = reset = ""
+
+        self._width = style.width
+        self._bar_open = bar
+        self._bar_close = reset
+
+        suffix = style.name_suffix
+        self._name_length = layout.name_length or 0
+        self._name_suffix = suffix
+        # Whatever the name leaves of the reserved length is filled by the
+        # suffix and then by spaces.
+        self._name_tail = suffix + " " * self._name_length
+        self._name_open = name
+        self._name_close = reset
+
+        self._show_fraction = style.show_fraction
+        prefix = style.fraction_prefix
+        self._fraction_pre = prefix + fraction
+        self._fraction_mid = reset + style.fraction_separator + fraction
+        self._fraction_post = reset
+        self._fraction_fixed = len(prefix) + len(style.fraction_separator)
+        self._left_length = layout.left_fraction_length or 0
+        self._right_length = layout.right_fraction_length or 0
+
+        self._show_percent = style.show_percent
+        prefix = style.percent_prefix
+        length = layout.percent_length
+        self._percent_pre = prefix + percent
+        self._percent_post = reset
+        self._percent_fixed = len(prefix)
+        self._percent_pad = length - len(prefix) if length else None
+
+        self._show_rate = style.show_rate
+        prefix = style.rate_prefix
+        length = layout.rate_length
+        self._rate_pre = prefix + rate
+        self._rate_post = reset
+        self._rate_length = len(prefix)
+        self._rate_pad = length - len(prefix) if length else 0
+
+        self._show_eta = style.show_eta
+        prefix = style.eta_prefix
+        length = layout.eta_length
+        self._eta_pre = prefix + rate
+        self._eta_post = reset
+        self._eta_length = len(prefix)
+        self._eta_pad = length - len(prefix) if length else 0
+
+    def render(self, row: Row) -> str:
+        """
+        Renders `row`. Rows that other threads are changing should be passed as
+        snapshots.
+        """
+
+        name = row.name
+        percent = row.percent
+        length = self._name_length
+
+        if length:
+            if len(name) >= length:
+                name, tail = name[:length], ""
+            else:
+                tail = self._name_tail[: length - len(name)]
+            used = length
+        else:
+            tail = self._name_suffix
+            used = len(name) + len(tail)
+
+        parts = [self._name_open, name, self._name_close, tail, "", ""]
+
+        if self._show_fraction:
+            left = f"{row.current:,}".rjust(self._left_length)
+            right = f"{row.maximum:,}".rjust(self._right_length)
+            parts += (
+                self._fraction_pre,
+                left,
+                self._fraction_mid,
+                right,
+                self._fraction_post,
+            )
+            used += self._fraction_fixed + len(left) + len(right)
+
+        if self._show_percent:
+            text = str(floor(percent * 100)) + "%"
+            pad = self._percent_pad
+            if pad is not None:
+                text = text[0:pad].rjust(pad)
+            parts += (self._percent_pre, text, self._percent_post)
+            used += self._percent_fixed + len(text)
+
+        if self._show_rate:
+            text = format_rate(row.rate).rjust(self._rate_pad)
+            parts += (self._rate_pre, text, self._rate_post)
+            used += self._rate_length + len(text)
+
+        if self._show_eta:
+            text = format_eta(row.eta).rjust(self._eta_pad)
+            parts += (self._eta_pre, text, self._eta_post)
+            used += self._eta_length + len(text)
+
+        # The bar fills whatever width the other parts leave.
+        parts[4] = self._bar_open + render_bar(percent, self._width - used)
+        parts[5] = self._bar_close
+
+        return "".join(parts).rstrip()
@@ -0,0 +1,152 @@
+""" Hosts the `Replay` class. """
+
+from time import monotonic, sleep
+from typing import BinaryIO, Callable, Optional, Sequence
+
+from progrow.journal import Journal
+from progrow.live_renderer import LiveRenderer
+from progrow.refresh_scheduler import RefreshScheduler
+from progrow.rows import Rows
+from progrow.style import Style
+
+
+class Replay:
+    """
+    Re-renders the updates recorded by a `Journal`, at any speed.
+
+    Rows are added the first time their name is seen and updated by name after
+    that. Frames are drawn by a `RefreshScheduler`, so a fast replay of a busy
+    journal still draws at most `fps` frames per second.
+
+    To replay a journal file from the command line, run `python -m progrow`
+    with the path of the file.
+
+    `stream` describes the binary stream to read the journal from.
+
+    `rows` describes the rows to apply the updates to.
+
+    `renderer` describes the renderer to draw frames with. Defaults to a
+    `LiveRenderer` writing to standard output.
+
+    `speed` describes how many times faster than recorded to replay. For
+    example, `10` to replay a minute in six seconds, or `0` to apply every
+    update as quickly as possible.
+
+    `fps` describes the maximum number of frames to render per second.
+
+    `clock` describes the monotonic clock, in seconds.
+
+    `sleep` describes the function to wait a number of seconds with.
+    """
+
+    def __init__(
+        self,
+        stream: BinaryIO,
+        rows: Optional[Rows] = None,
+        renderer: Optional[LiveRenderer] = None,
+        speed: float = 1.0,
+        fps: float = 10.0,
+        clock: Callable[[], float] = monotonic,
+        sleep: Callable[[float], None] = sleep,
+    ) -> None:
+        if speed < 0:
+            raise ValueError(f"speed must not be negative, not {speed}")
+
+        self.stream = stream
+        """ Binary stream to read the journal from. """
+
+        self.rows = Rows() if rows is None else rows
+        """ Rows that updates are applied to. """
+
+        self.scheduler = RefreshScheduler(
+            self.rows,
+            renderer=renderer,
+            fps=fps,
+            clock=clock,
+        )
+        """ Scheduler that draws frames of the rows. """
+
+        self.speed = speed
+        """ How many times faster than recorded to replay. """
+
+        self.clock = clock
+        """ Monotonic clock, in seconds. """
+
+        self.sleep = sleep
+        """ Function to wait a number of seconds with. """
+
+    def run(self) -> None:
+        """ Replays the whole journal, and then renders a final frame. """
+
+        started: Optional[float] = None
+        first = 0.0
+
+        for at, name, current, maximum in Journal.read(self.stream):
+            if started is None:
+                started = self.clock()
+                first = at
+
+            if self.speed:
+                self._wait(started + (at - first) / self.speed)
+
+            try:
+                row = self.rows[name]
+            except KeyError:
+                self.rows.append(name, current=current, maximum=maximum)
+                self.scheduler.touch()
+                continue
+
+            if row.maximum != maximum:
+                row.maximum = maximum
+
+            self.scheduler.update(row, current)
+
+        self.scheduler.close()
+
+    def _wait(self, due: float) -> None:
+        """ Waits until `due`, rendering any frame that falls due meanwhile. """
+
+        scheduler = self.scheduler
+
+        while True:
+            now = self.clock()
+            if now >= due:
+                return
+
+            wait = due - now
+            if scheduler.pending:
+                wait = max(0.0, min(wait, scheduler.next_frame - now))
+
+            self.sleep(wait)
+            scheduler.tick()
+
+
+def main(args: Optional[Sequence[str]] = None) -> int:
+    """ Replays a journal file from the command line. Returns the exit code. """
+
+    from argparse import ArgumentParser
+
+    parser = ArgumentParser(
+        prog="python -m progrow",
+        description="Replays a progrow journal.",
+    )
+    parser.add_argument("journal", help="path of the journal to replay")
+    parser.add_argument("--speed", default=1.0, type=float)
+    parser.add_argument("--fps", default=10.0, type=float)
+    parser.add_argument("--fraction", action="store_true", help="show fractions")
+    parser.add_argument("--percent", action="store_true", help="show percentages")
+    parser.add_argument("--no-color", action="store_true", help="render plain text")
+    options = parser.parse_args(args)
+
+    rows = Rows()
+    style = Style(
+        color=not options.no_color,
+        show_fraction=options.fraction,
+        show_percent=options.percent,
+    )
+    renderer = LiveRenderer(rows, style=style)
+
+    with open(options.journal, "rb") as stream:
+        Replay(stream, rows, renderer, options.speed, options.fps).run()
+
+    return 0
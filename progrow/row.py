@@ -1,14 +1,27 @@
 """ Hosts the `Row` class. """
 
 from math import floor
-from typing import Optional, Tuple
-
-import colorama
+from threading import Lock
+from typing import Callable, Optional, Tuple
 
+from progrow.bar import render_bar
+from progrow.colors import get_colors
 from progrow.layout import Layout
+from progrow.rate_estimator import RateEstimator
+from progrow.rate_text import format_eta, format_rate
+from progrow.segment import Segment
+from progrow.striped_lock import row_locks
 from progrow.style import Style
 
 
+def percent_of(current: float, maximum: float) -> float:
+    """
+    Gets the progress percentage of `current` out of `maximum`, or `0.0` if
+    `maximum` is `0`, such as for a parent row with no children yet.
+    """
+    return (1.0 / maximum) * current if maximum else 0.0
+
+
 class Row:
     """
     Describes a single row. To create a list of rows, use `Rows` instead.
@@ -22,32 +35,189 @@ class Row:
     out of 7 units of work are complete.
     """
 
+    __slots__ = (
+        "_current",
+        "_maximum",
+        "_name",
+        "listeners",
+        "rate_estimator",
+    )
+
     def __init__(self, name: str, current: float, maximum: float) -> None:
-        self.name = name
-        """ Name of this row """
+        self._name = name
+        self._maximum = maximum
+        self._current = current
+
+        self.listeners: Tuple[Callable[["Row"], None], ...] = ()
+        """
+        Functions to call with this row whenever its name or values change. Add
+        and remove listeners with `Row.add_listener` and `Row.remove_listener`.
 
-        self.maximum = maximum
+        Each `Rows` that holds this row listens to keep its layout up to date.
+        """
+
+        self.rate_estimator: Optional[RateEstimator] = None
+        """
+        Estimator to record changes in the current progress with, to render the
+        rate of progress and estimated time remaining. Rates are not estimated
+        if not set.
+        """
+
+    @property
+    def current(self) -> float:
         """
         Current progress.
 
         For example, `3` if 3 out of 7 units of work are complete.
         """
+        return self._current
+
+    @current.setter
+    def current(self, value: float) -> None:
+        self.set(value)
 
-        self.current = current
+    @property
+    def eta(self) -> Optional[float]:
+        """
+        Estimated number of seconds until the work is complete, or `None` if it
+        cannot be estimated.
+        """
+
+        remaining = self.maximum - self.current
+
+        if remaining <= 0:
+            return 0.0
+
+        rate = self.rate
+
+        if not rate or rate <= 0:
+            return None
+
+        return remaining / rate
+
+    @property
+    def lock(self) -> Lock:
+        """
+        Lock that guards changes to this row's values. The lock is shared with
+        other rows, so hold it only briefly.
+        """
+        return row_locks.for_object(self)
+
+    @property
+    def maximum(self) -> float:
         """
         Potential maximum progress.
 
         For example, `7` if 3 out of 7 units of work are complete.
         """
+        return self._maximum
+
+    @maximum.setter
+    def maximum(self, value: float) -> None:
+        with self.lock:
+            self._maximum = value
+        for listener in self.listeners:
+            listener(self)
+
+    @property
+    def name(self) -> str:
+        """ Name of this row. """
+        return self._name
+
+    @name.setter
+    def name(self, value: str) -> None:
+        self._name = value
+        for listener in self.listeners:
+            listener(self)
+
+    def add_listener(self, listener: Callable[["Row"], None]) -> None:
+        """
+        Adds `listener` to the functions to call whenever this row's name or
+        values change.
+        """
+        with self.lock:
+            self.listeners = self.listeners + (listener,)
+
+    def advance(self, amount: float = 1) -> float:
+        """
+        Adds `amount` to the current progress and returns the new value.
+
+        This is safe to call from many threads at once. Threads advancing
+        different rows rarely wait on each other.
+        """
+        with self.lock:
+            value = self._current + amount
+            self._current = value
+            if self.rate_estimator is not None:
+                self.rate_estimator.update(value)
+        for listener in self.listeners:
+            listener(self)
+        return value
+
+    def advance_maximum(self, amount: float) -> float:
+        """
+        Adds `amount` to the maximum progress and returns the new value.
+
+        This is safe to call from many threads at once.
+        """
+        with self.lock:
+            value = self._maximum + amount
+            self._maximum = value
+        for listener in self.listeners:
+            listener(self)
+        return value
+
+    def copy_from(self, source: "Row") -> None:
+        """
+        Copies the name and values of `source` into this row, consistently even
+        while other threads are changing them. Listeners are not notified.
+
+        Reusing one row to render many is quicker than taking a
+        `Row.snapshot` of each.
+        """
+        with source.lock:
+            self._name = source.name
+            self._current = source.current
+            self._maximum = source.maximum
+        self.rate_estimator = source.rate_estimator
+
+    def measure(self) -> Tuple[int, int, int, int]:
+        """
+        Measures the unpadded parts of this row without rendering them. Returns
+        a tuple describing the lengths of the name, enumerator, denominator and
+        percentage, excluding any style prefix or suffix.
+        """
+
+        with self.lock:
+            name = self.name
+            current = self.current
+            maximum = self.maximum
+
+        return (
+            len(name),
+            len(f"{current:,}"),
+            len(f"{maximum:,}"),
+            len(str(floor(percent_of(current, maximum) * 100))) + 1,
+        )
 
     @property
     def percent(self) -> float:
         """
         Progress percentage.
 
-        For example, `0.5` if `Row.current` is `5` and `Row.maximum` is `10`.
+        For example, `0.5` if `Row.current` is `5` and `Row.maximum` is `10`, or
+        `0.0` if `Row.maximum` is `0`.
+        """
+        return percent_of(self.current, self.maximum)
+
+    @property
+    def rate(self) -> Optional[float]:
         """
-        return (1.0 / self.maximum) * self.current
+        Estimated progress per second, or `None` if there is no
+        `Row.rate_estimator` or not enough progress has been recorded.
+        """
+        estimator = self.rate_estimator
+        return None if estimator is None else estimator.rate()
 
     def render(
         self,
@@ -87,12 +257,37 @@ class Row:
             percent = ""
             percent_len = 0
 
+        if style.show_rate:
+            rate, rate_len = self.render_rate(
+                color=style.color,
+                prefix=style.rate_prefix,
+                length=layout.rate_length,
+            )
+        else:
+            rate = ""
+            rate_len = 0
+
+        if style.show_eta:
+            eta, eta_len = self.render_eta(
+                color=style.color,
+                prefix=style.eta_prefix,
+                length=layout.eta_length,
+            )
+        else:
+            eta = ""
+            eta_len = 0
+
         bar = self.render_bar(
             color=style.color,
-            length=style.width - name_len - fraction_len - percent_len,
+            length=style.width
+            - name_len
+            - fraction_len
+            - percent_len
+            - rate_len
+            - eta_len,
         )
 
-        return (name + bar + fraction + percent).rstrip()
+        return (name + bar + fraction + percent + rate + eta).rstrip()
 
     def render_bar(self, color: bool, length: int) -> str:
         """
@@ -104,23 +299,33 @@ class Row:
         `length` describes the maximum character length of the bar.
         """
 
-        s = ""
+        bar = render_bar(self.percent, length)
 
         if color:
-            s += str(colorama.Fore.GREEN)
+            colors = get_colors()
+            return colors.bar + bar + colors.reset
+
+        return bar
 
-        pc_per_block = 1.0 / length
-        remaining_percent = self.percent
+    def render_eta(
+        self,
+        color: bool,
+        prefix: str,
+        length: Optional[int] = None,
+    ) -> Segment:
+        """
+        Renders the estimated time remaining. Returns a segment describing the
+        estimate and its unformatted length.
 
-        for _ in range(length):
-            this_pc = min(1.0, (1.0 / pc_per_block) * remaining_percent)
-            remaining_percent -= min(remaining_percent, pc_per_block)
-            s += " " if this_pc == 0.0 else chr(0x258F - floor(this_pc / (1.0 / 7)))
+        To render the entire row, call `Row.render`.
 
-        if color:
-            s += str(colorama.Fore.RESET)
+        `color` describes whether to render in colour or plain text.
 
-        return s
+        `prefix` describes the string to prepend to the estimate.
+
+        `length` describes the length to pad the estimate to.
+        """
+        return self._render_estimate(format_eta(self.eta), color, prefix, length)
 
     def render_fraction(
         self,
@@ -129,9 +334,9 @@ class Row:
         separator: str,
         left_length: Optional[int] = None,
         right_length: Optional[int] = None,
-    ) -> Tuple[str, int]:
+    ) -> Segment:
         """
-        Renders the fraction part of the row. Returns a tuple describing the
+        Renders the fraction part of the row. Returns a segment describing the
         rendered fraction and its unformatted length.
 
         To render the entire row, call `Row.render`.
@@ -150,33 +355,21 @@ class Row:
         `prefix` describes the string to render before the enumerator.
         """
 
-        s = (
-            prefix
-            + self.render_left_fraction(color=color, length=left_length)[0]
-            + separator
-            + self.render_right_fraction(color=color, length=right_length)[0]
-        )
-
-        if color:
-            length = self.render_fraction(
-                color=False,
-                prefix=prefix,
-                separator=separator,
-                left_length=left_length,
-                right_length=right_length,
-            )[1]
-        else:
-            length = len(s)
+        left = self.render_left_fraction(color=color, length=left_length)
+        right = self.render_right_fraction(color=color, length=right_length)
 
-        return (s, length)
+        return Segment(
+            prefix + left.text + separator + right.text,
+            len(prefix) + left.length + len(separator) + right.length,
+        )
 
     def render_left_fraction(
         self,
         color: bool,
         length: Optional[int] = None,
-    ) -> Tuple[str, int]:
+    ) -> Segment:
         """
-        Renders the enumerator part of the row. Returns a tuple describing the
+        Renders the enumerator part of the row. Returns a segment describing the
         rendered enumerator and its unformatted length.
 
         To render the entire row, call `Row.render`.
@@ -186,34 +379,24 @@ class Row:
         `length` describes the length to pad the enumerator to.
         """
 
-        s = ""
-
-        if color:
-            s += str(colorama.Fore.LIGHTBLUE_EX)
+        s = f"{self.current:,}"
 
         if length:
-            s += f"{self.current:,}".rjust(length)
-        else:
-            s += f"{self.current:,}"
-
-        if color:
-            s += str(colorama.Fore.RESET)
+            s = s.rjust(length)
 
         if color:
-            length = self.render_left_fraction(color=False)[1]
-        else:
-            length = len(s)
+            return Segment.paint(s, get_colors().fraction)
 
-        return (s, length)
+        return Segment.plain(s)
 
     def render_name(
         self,
         color: bool,
         suffix: str,
         length: Optional[int] = None,
-    ) -> Tuple[str, int]:
+    ) -> Segment:
         """
-        Renders the name part of the row. Returns a tuple describing the name
+        Renders the name part of the row. Returns a segment describing the name
         and its unformatted length.
 
         To render the entire row, call `Row.render`.
@@ -225,8 +408,6 @@ class Row:
         `length` describes the length to pad the name to.
         """
 
-        s = ""
-
         if length and len(self.name + suffix) > length:
             if len(self.name) < length:
                 inc_suffix = suffix[0 : length - len(self.name)]
@@ -238,34 +419,24 @@ class Row:
             inc_name = self.name
             inc_suffix = suffix
 
-        if color:
-            s += str(colorama.Fore.YELLOW)
-
-        s += inc_name
+        if length:
+            inc_suffix += " " * (length - len(inc_name) - len(inc_suffix))
 
         if color:
-            s += str(colorama.Fore.RESET)
-
-        s += inc_suffix
-
-        if length:
-            padding = length - len(inc_name) - len(inc_suffix)
-            s += " " * padding
-        elif color:
-            length = self.render_name(color=False, suffix=suffix)[1]
+            name = Segment.paint(inc_name, get_colors().name)
         else:
-            length = len(s)
+            name = Segment.plain(inc_name)
 
-        return (s, length)
+        return Segment(name.text + inc_suffix, name.length + len(inc_suffix))
 
     def render_percent(
         self,
         color: bool,
         prefix: str,
         length: Optional[int] = None,
-    ) -> Tuple[str, int]:
+    ) -> Segment:
         """
-        Renders the percentage part of the row. Returns a tuple describing the
+        Renders the percentage part of the row. Returns a segment describing the
         percentage and its unformatted length.
 
         To render the entire row, call `Row.render`.
@@ -277,37 +448,47 @@ class Row:
         `length` describes the length to pad the percentage to.
         """
 
-        s = prefix
-
-        if color:
-            s += str(colorama.Fore.CYAN)
-
         percent = str(floor(self.percent * 100)) + "%"
 
         if length:
             numeric_pad = length - len(prefix)
-            s += percent[0:numeric_pad].rjust(numeric_pad)
-        else:
-            s += percent
+            percent = percent[0:numeric_pad].rjust(numeric_pad)
 
         if color:
-            s += str(colorama.Fore.RESET)
-
-        if color:
-            length = self.render_percent(color=False, prefix=prefix, length=length)[1]
+            value = Segment.paint(percent, get_colors().percent)
         else:
-            length = len(s)
+            value = Segment.plain(percent)
+
+        return Segment(prefix + value.text, len(prefix) + value.length)
+
+    def render_rate(
+        self,
+        color: bool,
+        prefix: str,
+        length: Optional[int] = None,
+    ) -> Segment:
+        """
+        Renders the rate of progress. Returns a segment describing the rate and
+        its unformatted length.
 
-        return (s, length)
+        To render the entire row, call `Row.render`.
+
+        `color` describes whether to render in colour or plain text.
+
+        `prefix` describes the string to prepend to the rate.
+
+        `length` describes the length to pad the rate to.
+        """
+        return self._render_estimate(format_rate(self.rate), color, prefix, length)
 
     def render_right_fraction(
         self,
         color: bool,
         length: Optional[int] = None,
-    ) -> Tuple[str, int]:
+    ) -> Segment:
         """
-        Renders the denominator part of the row. Returns a tuple describing the
-        rendered denominator and its unformatted length.
+        Renders the denominator part of the row. Returns a segment describing
+        the rendered denominator and its unformatted length.
 
         To render the entire row, call `Row.render`.
 
@@ -316,22 +497,75 @@ class Row:
         `length` describes the length to pad the denominator to.
         """
 
-        s = ""
-
-        if color:
-            s += str(colorama.Fore.LIGHTBLUE_EX)
+        s = f"{self.maximum:,}"
 
         if length:
-            s += f"{self.maximum:,}".rjust(length)
-        else:
-            s += f"{self.maximum:,}"
+            s = s.rjust(length)
 
         if color:
-            s += str(colorama.Fore.RESET)
+            return Segment.paint(s, get_colors().fraction)
+
+        return Segment.plain(s)
+
+    def remove_listener(self, listener: Callable[["Row"], None]) -> None:
+        """ Removes the first occurrence of `listener`, if it was added. """
+        with self.lock:
+            listeners = list(self.listeners)
+            if listener in listeners:
+                listeners.remove(listener)
+                self.listeners = tuple(listeners)
+
+    def reset(self, current: float, maximum: float) -> None:
+        """
+        Sets the current and maximum progress together without notifying
+        `Row.listeners`, for example to resume from a snapshot. Any rate
+        estimate starts again from `current`.
+        """
+        with self.lock:
+            self._current = current
+            self._maximum = maximum
+            if self.rate_estimator is not None:
+                self.rate_estimator.state = None
+                self.rate_estimator.update(current)
+
+    def set(self, current: float, notify: bool = True) -> None:
+        """
+        Sets the current progress.
+
+        `notify` describes whether to call `Row.listeners`. `Rows.update_many`
+        clears this to notify once for a whole batch of updates.
+        """
+        with self.lock:
+            self._current = current
+            if self.rate_estimator is not None:
+                self.rate_estimator.update(current)
+        if notify:
+            for listener in self.listeners:
+                listener(self)
+
+    def snapshot(self) -> "Row":
+        """
+        Gets a detached copy of this row with a consistent name and values, even
+        while other threads are changing them.
+        """
+        with self.lock:
+            snapshot = Row(self.name, self.current, self.maximum)
+        snapshot.rate_estimator = self.rate_estimator
+        return snapshot
+
+    def _render_estimate(
+        self,
+        text: str,
+        color: bool,
+        prefix: str,
+        length: Optional[int],
+    ) -> Segment:
+        if length:
+            text = text.rjust(length - len(prefix))
 
         if color:
-            length = self.render_right_fraction(color=False)[1]
+            value = Segment.paint(text, get_colors().rate)
         else:
-            length = len(s)
+            value = Segment.plain(text)
 
-        return (s, length)
+        return Segment(prefix + value.text, len(prefix) + value.length)
@@ -0,0 +1,138 @@
+""" Hosts the `RowView` class. """
+
+from threading import Lock
+from typing import List, MutableSequence
+
+from progrow.row import Row, percent_of
+from progrow.striped_lock import row_locks
+
+
+def unbox(value: float) -> float:
+    """
+    Returns `value` as an `int` if it is a whole number, so that it renders
+    exactly as a `Row` created with an `int` would.
+    """
+    return int(value) if value.is_integer() else value
+
+
+class RowView(Row):
+    """
+    A `Row` whose name and values live in the columns of a `ColumnarRows`.
+
+    Views hold no values of their own, so they are cheap to create on demand.
+    Whole-number values are presented as `int`.
+
+    `names`, `currents` and `maximums` describe the columns.
+
+    `index` describes the position of this row in the columns.
+    """
+
+    __slots__ = ("currents", "index", "maximums", "names")
+
+    def __init__(
+        self,
+        names: List[str],
+        currents: MutableSequence[float],
+        maximums: MutableSequence[float],
+        index: int,
+    ) -> None:
+        self.names = names
+        self.currents = currents
+        self.maximums = maximums
+
+        self.index = index
+        """ Position of this row in the columns. """
+
+        self.listeners = ()
+        self.rate_estimator = None
+
+    @property
+    def current(self) -> float:
+        """
+        Current progress.
+
+        For example, `3` if 3 out of 7 units of work are complete.
+        """
+        return unbox(self.currents[self.index])
+
+    @current.setter
+    def current(self, value: float) -> None:
+        self.set(value)
+
+    @property
+    def lock(self) -> Lock:
+        """
+        Lock that guards changes to this row's values. The lock is shared with
+        other rows, so hold it only briefly.
+        """
+        return row_locks[(id(self.currents) >> 4) + self.index]
+
+    @property
+    def maximum(self) -> float:
+        """
+        Potential maximum progress.
+
+        For example, `7` if 3 out of 7 units of work are complete.
+        """
+        return unbox(self.maximums[self.index])
+
+    @maximum.setter
+    def maximum(self, value: float) -> None:
+        with self.lock:
+            self.maximums[self.index] = value
+
+    @property
+    def name(self) -> str:
+        """ Name of this row. """
+        return self.names[self.index]
+
+    @name.setter
+    def name(self, value: str) -> None:
+        self.names[self.index] = value
+
+    def advance(self, amount: float = 1) -> float:
+        """
+        Adds `amount` to the current progress and returns the new value.
+
+        This is safe to call from many threads at once. Threads advancing
+        different rows rarely wait on each other.
+        """
+        with self.lock:
+            value = self.currents[self.index] + amount
+            self.currents[self.index] = value
+        return unbox(value)
+
+    def advance_maximum(self, amount: float) -> float:
+        """
+        Adds `amount` to the maximum progress and returns the new value.
+
+        This is safe to call from many threads at once.
+        """
+        with self.lock:
+            value = self.maximums[self.index] + amount
+            self.maximums[self.index] = value
+        return unbox(value)
+
+    @property
+    def percent(self) -> float:
+        """
+        Progress percentage.
+
+        For example, `0.5` if `Row.current` is `5` and `Row.maximum` is `10`, or
+        `0.0` if `Row.maximum` is `0`.
+        """
+        return percent_of(self.currents[self.index], self.maximums[self.index])
+
+    def reset(self, current: float, maximum: float) -> None:
+        """ Sets the current and maximum progress together. """
+        with self.lock:
+            self.currents[self.index] = current
+            self.maximums[self.index] = maximum
+
+    def set(self, current: float, notify: bool = True) -> None:
+        """
+        Sets the current progress. Views never notify `Row.listeners`, so
+        `notify` is ignored.
+        """
+        with self.lock:
+            self.currents[self.index] = current
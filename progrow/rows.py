@@ -1,17 +1,134 @@
 """ Hosts the `Rows` class. """
 
-from typing import List, Optional
+from array import array
+from threading import Lock
+from typing import (
+    TYPE_CHECKING,
+    BinaryIO,
+    Callable,
+    Collection,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Sized,
+    TextIO,
+    Tuple,
+)
 
+from progrow.column_widths import ColumnWidths
 from progrow.layout import Layout
+from progrow.rate_estimator import RateEstimator
+from progrow.render_cache import RenderCache
+from progrow.render_plan import RenderPlan
 from progrow.row import Row
 from progrow.style import Style
 
+if TYPE_CHECKING:
+    from progrow.columnar_rows import ColumnarRows
+
+Widths = Tuple[int, int, int, int]
+""" Lengths of a row's name, enumerator, denominator and percentage. """
+
 
 class Rows:
-    """ Describes a collection of rows. """
+    """
+    Describes a collection of rows.
+
+    The widths needed to align the rows are maintained as rows are appended and
+    changed, so rendering only measures the rows that changed since the last
+    render.
+
+    Rows can be looked up by name, for example `rows["apple harvest"]`, without
+    searching the collection.
+
+    `rows` describes the initial rows.
+
+    `render_cache` describes an optional cache to render through, so that rows
+    that have not changed since the last render are not rendered again.
+
+    `rate_half_life` describes the half-life, in seconds, with which to estimate
+    each row's rate of progress. Rates are not estimated if not set.
+    """
+
+    def __init__(
+        self,
+        rows: Optional[List[Row]] = None,
+        render_cache: Optional[RenderCache] = None,
+        rate_half_life: Optional[float] = None,
+    ) -> None:
+        self.rows = [] if rows is None else rows
+        """
+        Rows in this collection. Rows added, removed or replaced in this list
+        directly are noticed at the next layout, but `Rows.append` is quicker.
+        """
+
+        self.render_cache = render_cache
+        """ Cache to render through, if any. """
+
+        self.rate_half_life = rate_half_life
+        """
+        Half-life, in seconds, with which to estimate the rate of progress of
+        rows that don't already have a `Row.rate_estimator`.
+        """
+
+        self.watchers: List[Callable[[Row], None]] = []
+        """
+        Functions to call with each row that is appended or changed, for example
+        to maintain a `TopRows`.
+        """
 
-    def __init__(self, rows: List[Row] = []) -> None:
-        self.rows = rows
+        self._name_widths = ColumnWidths()
+        self._left_fraction_widths = ColumnWidths()
+        self._right_fraction_widths = ColumnWidths()
+        self._percent_widths = ColumnWidths()
+
+        self._measure_lock = Lock()
+        self._names: Dict[str, Row] = {}
+        self._positions: Dict[Row, int] = {}
+        self._stale: Set[Row] = set()
+        self._watched: List[Row] = []
+        self._widths: Dict[Row, Widths] = {}
+
+        for row in self.rows:
+            self._watch(row)
+
+    def __getitem__(self, name: str) -> Row:
+        """
+        Gets the row named `name`. If several rows share the name, gets the
+        first. Raises `KeyError` if no row has the name.
+        """
+
+        rows = self.rows
+        row = self._names.get(name)
+
+        if row is None:
+            # Rows are indexed as they change, so a missing name can only have
+            # been added by changing the list directly. Rows don't define
+            # equality, so this compares identities.
+            if rows == self._watched:
+                raise KeyError(name)
+        elif row.name == name:
+            index = self._positions.get(row)
+            if index is not None and index < len(rows) and rows[index] is row:
+                return row
+
+        with self._measure_lock:
+            if self.rows == self._watched:
+                # The row was renamed.
+                self._index_names()
+            else:
+                self._rewatch()
+
+        try:
+            return self._names[name]
+        except KeyError:
+            raise KeyError(name) from None
+
+    def __len__(self) -> int:
+        return len(self.rows)
 
     def append(self, name: str, current: float, maximum: float) -> None:
         """
@@ -25,38 +142,396 @@ class Rows:
         `maximum` describes the potential maximum progress. For example, `7` if
         3 out of 7 units of work are complete.
         """
-        self.rows.append(Row(name=name, maximum=maximum, current=current))
+        self._add(Row(name=name, maximum=maximum, current=current))
+
+    def dump(self, stream: BinaryIO, format: str = "binary") -> None:
+        """
+        Writes a snapshot of the rows' names and values to `stream`. Load the
+        snapshot with `Rows.load`.
+
+        `format` describes the snapshot format: `binary` for a compact snapshot
+        that loads without creating an object per row, or `jsonl` for one JSON
+        array per line.
+        """
+        from progrow.snapshot_file import dump_columns
+
+        rows = list(self.rows)
+        dump_columns(
+            stream,
+            [row.name for row in rows],
+            array("d", [row.current for row in rows]),
+            array("d", [row.maximum for row in rows]),
+            format,
+        )
+
+    @staticmethod
+    def from_columns(
+        names: Iterable[str],
+        currents: Iterable[float],
+        maximums: Iterable[float],
+    ) -> "ColumnarRows":
+        """
+        Creates rows from columns of names, current progress and potential
+        maximum progress, which must be the same length.
+
+        The rows are stored in columns rather than as `Row` instances, which
+        suits very large collections. See `ColumnarRows`.
+        """
+        from progrow.columnar_rows import ColumnarRows
+
+        return ColumnarRows(names, currents, maximums)
 
     def calculate_layout(self, style: Style) -> Layout:
         """ Calculates a layout to align all rows. """
 
-        layout = Layout()
+        with self._measure_lock:
+            self._measure()
 
-        for row in self.rows:
-            name_len = row.render_name(color=False, suffix=style.name_suffix)[1]
-            layout.consider_name(name_len)
+        return Layout.from_widths(
+            style,
+            name=self._name_widths.maximum,
+            left_fraction=self._left_fraction_widths.maximum,
+            right_fraction=self._right_fraction_widths.maximum,
+            percent=self._percent_widths.maximum,
+        )
 
-            if style.show_fraction:
-                left_len = row.render_left_fraction(color=False)[1]
-                layout.consider_left_fraction(left_len)
-                right_len = row.render_right_fraction(color=False)[1]
-                layout.consider_right_fraction(right_len)
+    def invalidate(self, row: Row) -> None:
+        """
+        Marks `row` to be measured again before the next layout, and passes it
+        to each of `Rows.watchers`.
+        """
+        self._names.setdefault(row.name, row)
+        self._stale.add(row)
+        for watcher in self.watchers:
+            watcher(row)
 
-            if style.show_percent:
-                pc_len = row.render_percent(color=False, prefix=style.percent_prefix)[1]
-                layout.consider_percent(pc_len)
+    def invalidate_many(self, rows: Collection[Row]) -> None:
+        """
+        Marks every row in `rows` to be measured again before the next layout,
+        and passes them to each of `Rows.watchers`, in one step.
+        """
+        for row in rows:
+            self._names.setdefault(row.name, row)
+        self._stale.update(rows)
+        for watcher in self.watchers:
+            for row in rows:
+                watcher(row)
 
-        return layout
+    def iter_render(self, style: Optional[Style] = None) -> Iterator[str]:
+        """
+        Renders the rows one at a time. Yields each rendered row without a line
+        break.
+        """
+
+        style = style or Style()
+        layout = self.calculate_layout(style)
+        return self.render_rows(self._iter_copies(self.rows), layout, style)
+
+    @staticmethod
+    def load(stream: BinaryIO) -> "ColumnarRows":
+        """
+        Reads a snapshot written by `Rows.dump`, in either format. The rows are
+        stored in columns, so loading creates no `Row` instances. See
+        `ColumnarRows`. To read a snapshot into an existing collection, see
+        `Rows.restore`.
+        """
+        from progrow.snapshot_file import load_columns
+
+        return load_columns(stream)
+
+    def measure(self, row: Row) -> Tuple[int, int, int, int]:
+        """
+        Measures the unpadded parts of `row` as this collection renders it. See
+        `Row.measure`.
+        """
+        return row.measure()
 
     def render(self, style: Optional[Style] = None) -> str:
         """ Renders the rows. """
+        return "\n".join(self.iter_render(style)).rstrip()
 
-        style = style or Style()
+    def render_rows(
+        self,
+        rows: Iterable[Row],
+        layout: Layout,
+        style: Style,
+    ) -> Iterator[str]:
+        """
+        Renders `rows` through `Rows.render_cache`, if set, or else through a
+        `RenderPlan` compiled once for all of them. Yields each rendered row
+        without a line break.
 
-        layout = self.calculate_layout(style)
-        rendered = ""
+        The cache is bypassed if it cannot hold every row, since each full
+        render would then evict the rows the next render needs.
 
-        for row in self.rows:
-            rendered += row.render(layout, style) + "\n"
+        Rows that other threads are changing should be passed as copies, for
+        example with `Row.copy_from`.
+        """
+
+        cache = self.render_cache
+        count = len(rows) if isinstance(rows, Sized) else len(self)
+
+        if cache is None or count > cache.maxsize:
+            render = RenderPlan(layout, style).render
+            for row in rows:
+                yield render(row)
+            return
+
+        yield from cache.render_many(rows, layout.freeze(), style.freeze())
+
+    def render_to(
+        self,
+        stream: TextIO,
+        style: Optional[Style] = None,
+        chunk_size: int = 65536,
+    ) -> None:
+        """
+        Renders the rows to `stream`, each followed by a line break.
+
+        Rows are written as they are rendered, in chunks of about `chunk_size`
+        characters, so memory use does not grow with the number of rows.
+        """
+
+        chunk: List[str] = []
+        length = 0
+
+        for line in self.iter_render(style):
+            chunk.append(line)
+            length += len(line) + 1
+            if length >= chunk_size:
+                chunk.append("")
+                stream.write("\n".join(chunk))
+                chunk = []
+                length = 0
+
+        if chunk:
+            chunk.append("")
+            stream.write("\n".join(chunk))
+
+    def restore(self, stream: BinaryIO) -> None:
+        """
+        Reads a snapshot written by `Rows.dump`, in either format, into these
+        rows. Unlike `Rows.load`, the collection keeps its own type.
+
+        Rows are matched by name and given the snapshot's values. Rows in the
+        snapshot but not in this collection are appended, and rows not in the
+        snapshot are left as they are. A `TreeRows` parent takes its values,
+        including its children's, from the snapshot. Restore before other
+        threads start updating the rows.
+        """
+        from progrow.snapshot_file import load_columns
+
+        snapshot = load_columns(stream)
+
+        # The snapshot's columns are read directly, so no view is created and
+        # no lookup is made per row. Reversing keeps the first row of each name.
+        names = {row.name: row for row in reversed(self.rows)}
+        found = list(map(names.get, snapshot.names))
+
+        # Present whole numbers as `int`, as a `RowView` would.
+        currents = [int(v) if v.is_integer() else v for v in snapshot.currents]
+        maximums = [int(v) if v.is_integer() else v for v in snapshot.maximums]
+        values = zip(found, currents, maximums)
+
+        # Missing rows are appended first, so that any row summing them is then
+        # given its value from the snapshot.
+        if None in found:
+            self._append_many(
+                [
+                    (name, current, maximum)
+                    for name, (row, current, maximum) in zip(snapshot.names, values)
+                    if row is None
+                ]
+            )
+            values = zip(found, currents, maximums)
+
+        changed = [row for row in found if row is not None]
+
+        for row, current, maximum in values:
+            if row is not None:
+                self._reset(row, current, maximum)
+
+        self.invalidate_many(changed)
+
+    def row(self, index: int) -> Row:
+        """ Gets the row at `index`. """
+        return self.rows[index]
+
+    def set(self, name: str, current: float) -> None:
+        """ Sets the current progress of the row named `name`. """
+        self[name].current = current
+
+    def update_many(self, updates: Iterable[Tuple[str, float]]) -> None:
+        """
+        Sets the current progress of many rows in one pass.
+        Raises `KeyError`, and changes no rows, if any name is unknown.
+
+        The changed rows are marked to be measured again and passed to
+        `Rows.watchers` once for the whole batch, rather than once per update.
+
+        `updates` describes pairs of row names and current progress.
+        """
+
+        # Find every row before changing any.
+        found = [(self[name], current) for name, current in updates]
+        changed: Dict[Row, None] = {}
+
+        for row, current in found:
+            row.set(current, notify=False)
+            changed[row] = None
+
+        self.invalidate_many(changed.keys())
+
+    def _add(self, row: Row) -> None:
+        """ Appends and watches `row`, which must not be in any collection yet. """
+
+        self._estimate(row)
+
+        # Nothing else can be listening to a new row, so there's no need to
+        # take the row's lock to listen.
+        row.listeners = (self.invalidate,)
+
+        with self._measure_lock:
+            self.rows.append(row)
+            self._positions[row] = len(self._watched)
+            self._watched.append(row)
+
+        self.invalidate(row)
+
+    def _adopt(self, row: Row) -> None:
+        self._estimate(row)
+        row.add_listener(self.invalidate)
+
+    def _append_many(self, values: List[Tuple[str, float, float]]) -> None:
+        """
+        Appends a row for each name, current and maximum progress in `values`,
+        watching them all in one step.
+        """
+
+        rows = [Row(name, current, maximum) for name, current, maximum in values]
+
+        for row in rows:
+            self._estimate(row)
+            row.listeners = (self.invalidate,)
+
+        with self._measure_lock:
+            positions = self._positions
+            for position, row in enumerate(rows, len(self._watched)):
+                positions[row] = position
+            self.rows.extend(rows)
+            self._watched.extend(rows)
+
+        self.invalidate_many(rows)
+
+    def _estimate(self, row: Row) -> None:
+        if self.rate_half_life is not None and row.rate_estimator is None:
+            row.rate_estimator = RateEstimator(self.rate_half_life)
+            row.rate_estimator.update(row.current)
+
+    def _forget_widths(self, widths: Widths) -> None:
+        self._name_widths.remove(widths[0])
+        self._left_fraction_widths.remove(widths[1])
+        self._right_fraction_widths.remove(widths[2])
+        self._percent_widths.remove(widths[3])
+
+    def _index_names(self) -> None:
+        """ Indexes the watched rows by name, keeping the first of each name. """
+
+        names: Dict[str, Row] = {}
+        for row in self._watched:
+            names.setdefault(row.name, row)
+        self._names = names
+
+    @staticmethod
+    def _iter_copies(rows: Iterable[Row]) -> Iterator[Row]:
+        """
+        Copies each of `rows` in turn into the same row and yields it, so that
+        the rows can be rendered without taking a snapshot of each.
+        """
+
+        copy = Row("", 0, 0)
+
+        for row in rows:
+            copy.copy_from(row)
+            yield copy
+
+    def _measure(self) -> None:
+        """ Measures every row that changed since the last measurement. """
+
+        self._rewatch()
+
+        # Other threads may mark rows stale while we measure. Copying and then
+        # discarding the marks are each atomic, and marks added after the copy
+        # are kept for the next measurement.
+        stale = list(self._stale)
+        self._stale.difference_update(stale)
+
+        for row in stale:
+            if row not in self._positions:
+                # Removed from the list since it was marked.
+                continue
+
+            widths = self.measure(row)
+            previous = self._widths.get(row)
+
+            if widths == previous:
+                continue
+
+            if previous:
+                self._forget_widths(previous)
+
+            self._name_widths.add(widths[0])
+            self._left_fraction_widths.add(widths[1])
+            self._right_fraction_widths.add(widths[2])
+            self._percent_widths.add(widths[3])
+            self._widths[row] = widths
+
+    def _register(self, row: Row) -> None:
+        """ Starts watching `row`, which was just appended to the list. """
+
+        if row in self._positions:
+            return
+
+        self._adopt(row)
+        self._positions[row] = len(self._watched)
+        self._watched.append(row)
+
+    def _reset(self, row: Row, current: float, maximum: float) -> None:
+        row.reset(current, maximum)
+
+    def _rewatch(self) -> None:
+        """
+        Catches up with any rows that were added, removed or replaced in the
+        list directly. Rows that are still in the list keep their measurements.
+        """
+
+        # Rows don't define equality, so this compares identities.
+        if self.rows == self._watched:
+            return
+
+        rows = list(self.rows)
+
+        known = self._positions
+        positions: Dict[Row, int] = {}
+
+        for index, row in enumerate(rows):
+            if row not in known and row not in positions:
+                self._adopt(row)
+                self._stale.add(row)
+            positions[row] = index
+
+        for row in known:
+            if row not in positions:
+                row.remove_listener(self.invalidate)
+                widths = self._widths.pop(row, None)
+                if widths:
+                    self._forget_widths(widths)
+
+        self._positions = positions
+        self._watched = rows
+        self._index_names()
 
-        return rendered.rstrip()
+    def _watch(self, row: Row) -> None:
+        with self._measure_lock:
+            self._register(row)
+        self.invalidate(row)
@@ -0,0 +1,36 @@
+""" Hosts the `Segment` class. """
+
+from typing import NamedTuple
+
+from progrow.colors import get_colors
+
+
+class Segment(NamedTuple):
+    """
+    A rendered part of a row.
+
+    `text` describes the rendered string, including any colour codes.
+
+    `length` describes the visible length of `text`, excluding colour codes.
+    """
+
+    text: str
+    """ Rendered string, including any colour codes. """
+
+    length: int
+    """ Visible length of `Segment.text`, excluding colour codes. """
+
+    @classmethod
+    def plain(cls, value: str) -> "Segment":
+        """ Creates an uncoloured segment. """
+        return cls(value, len(value))
+
+    @classmethod
+    def paint(cls, value: str, color: str) -> "Segment":
+        """
+        Creates a segment that renders `value` in the `color` colour code.
+
+        The visible length is measured from `value` alone, so no second,
+        uncoloured render is needed to find it.
+        """
+        return cls(color + value + get_colors().reset, len(value))
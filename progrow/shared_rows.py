@@ -0,0 +1,167 @@
+""" Hosts the `SharedRows` class. """
+
+from array import array
+from types import TracebackType
+from typing import (
+    TYPE_CHECKING,
+    Iterable,
+    List,
+    MutableSequence,
+    NamedTuple,
+    Optional,
+    Type,
+    cast,
+)
+
+from progrow.columnar_rows import ColumnarRows
+
+if TYPE_CHECKING:
+    from multiprocessing.shared_memory import SharedMemory
+
+VALUE_SIZE = 8
+""" Size in bytes of each value in shared memory. """
+
+
+class SharedRowsHandle(NamedTuple):
+    """
+    Picklable reference to a `SharedRows` block, to pass to child processes.
+
+    `name` describes the name of the shared memory block.
+
+    `length` describes the number of rows in the block.
+    """
+
+    name: str
+    """ Name of the shared memory block. """
+
+    length: int
+    """ Number of rows in the block. """
+
+
+class SharedRows(ColumnarRows):
+    """
+    Describes a collection of rows whose values are kept in a shared memory
+    block, so that other processes can advance rows without sending messages.
+
+    Create the rows in the parent process with `SharedRows.create` and pass
+    `SharedRows.handle` to each child process. A child calls `SharedRows.attach`
+    and advances its rows directly; the parent renders from the block at any
+    time. Each row should be written by only one process at a time.
+
+    Names stay in the parent process; attached rows are unnamed. Shared rows
+    cannot grow once created.
+
+    Requires Python 3.8 or later.
+    """
+
+    def __init__(
+        self,
+        memory: "SharedMemory",
+        names: List[str],
+        owner: bool,
+    ) -> None:
+        super().__init__()
+
+        count = len(names)
+        size = count * VALUE_SIZE
+
+        self.memory = memory
+        """ Shared memory block holding the values. """
+
+        self.owner = owner
+        """ Whether this process created the block and should unlink it. """
+
+        buffer = memory.buf
+        if buffer is None:
+            raise ValueError("shared memory block is closed")
+
+        self._current_bytes = buffer[0:size]
+        self._maximum_bytes = buffer[size : size * 2]
+        self._current_values = self._current_bytes.cast("d")
+        self._maximum_values = self._maximum_bytes.cast("d")
+
+        self.names = names
+        """ Names of the rows. """
+
+        self.currents = cast(MutableSequence[float], self._current_values)
+        """ Current progress of the rows, in shared memory. """
+
+        self.maximums = cast(MutableSequence[float], self._maximum_values)
+        """ Potential maximum progress of the rows, in shared memory. """
+
+    def __enter__(self) -> "SharedRows":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+    @classmethod
+    def attach(cls, handle: SharedRowsHandle) -> "SharedRows":
+        """ Attaches to rows created by another process. """
+
+        from multiprocessing.shared_memory import SharedMemory
+
+        memory = SharedMemory(name=handle.name)
+        return cls(memory, [""] * handle.length, owner=False)
+
+    @classmethod
+    def create(
+        cls,
+        names: Iterable[str],
+        currents: Iterable[float],
+        maximums: Iterable[float],
+    ) -> "SharedRows":
+        """
+        Creates rows in a new shared memory block. The block is freed when the
+        rows are closed.
+        """
+
+        from multiprocessing.shared_memory import SharedMemory
+
+        local = ColumnarRows(names, currents, maximums)
+        size = max(1, len(local) * VALUE_SIZE * 2)
+        memory = SharedMemory(create=True, size=size)
+        rows = cls(memory, local.names, owner=True)
+        rows.currents[:] = local.currents
+        rows.maximums[:] = local.maximums
+        return rows
+
+    @property
+    def handle(self) -> SharedRowsHandle:
+        """ Picklable reference to pass to child processes. """
+        return SharedRowsHandle(self.memory.name, len(self.names))
+
+    def append(self, name: str, current: float, maximum: float) -> None:
+        """ Not supported: shared rows cannot grow once created. """
+        raise TypeError("shared rows cannot grow once created")
+
+    def close(self) -> None:
+        """
+        Detaches from the shared memory block, and frees it if this process
+        created it.
+        """
+
+        # Every view must be released before the block can be closed.
+        self._current_values.release()
+        self._maximum_values.release()
+        self._current_bytes.release()
+        self._maximum_bytes.release()
+
+        self.memory.close()
+
+        if self.owner:
+            self.memory.unlink()
+
+    def snapshot(self) -> ColumnarRows:
+        """ Gets a detached copy of the rows, outside of shared memory. """
+
+        return ColumnarRows(
+            self.names,
+            array("d", self._current_bytes.tobytes()),
+            array("d", self._maximum_bytes.tobytes()),
+        )
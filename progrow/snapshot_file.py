@@ -0,0 +1,148 @@
+""" Writes and reads snapshots of rows. """
+
+import json
+from array import array
+from itertools import islice
+from json.encoder import encode_basestring
+from math import isfinite
+from operator import itemgetter
+from struct import Struct
+from sys import byteorder
+from typing import TYPE_CHECKING, BinaryIO, List, MutableSequence, Sequence
+
+if TYPE_CHECKING:
+    from progrow.columnar_rows import ColumnarRows
+
+FORMATS = ["binary", "jsonl"]
+""" Snapshot formats. """
+
+MAGIC = b"progrow\x01"
+""" First bytes of a binary snapshot, including the format version. """
+
+HEADER = Struct("<8sQQ")
+""" Magic bytes, number of rows and length of the names, in bytes. """
+
+NAME_SEPARATOR = "\x00"
+""" Separates names in a binary snapshot. """
+
+
+def dump_columns(
+    stream: BinaryIO,
+    names: Sequence[str],
+    currents: Sequence[float],
+    maximums: Sequence[float],
+    format: str = "binary",
+) -> None:
+    """
+    Writes columns of names, current progress and maximum progress to `stream`
+    as a snapshot.
+
+    A binary snapshot holds a header, each column of values as little-endian
+    doubles, and the names in UTF-8. A JSON lines snapshot holds one
+    `[name, current, maximum]` array per line.
+    """
+
+    if format == "jsonl":
+        lines = (
+            f"[{encode_basestring(name)}, {_number(current)}, {_number(maximum)}]"
+            for name, current, maximum in zip(names, currents, maximums)
+        )
+        for chunk in iter(lambda: list(islice(lines, 65536)), []):
+            chunk.append("")
+            stream.write("\n".join(chunk).encode("utf-8"))
+        return
+
+    if format != "binary":
+        raise ValueError(f"unknown snapshot format: {format}")
+
+    joined = NAME_SEPARATOR.join(names)
+    if joined.count(NAME_SEPARATOR) != max(0, len(names) - 1):
+        raise ValueError("names in a binary snapshot cannot contain NUL")
+
+    encoded = joined.encode("utf-8")
+    stream.write(HEADER.pack(MAGIC, len(names), len(encoded)))
+
+    for column in (currents, maximums):
+        values = column if isinstance(column, array) else array("d", column)
+        if byteorder == "big":
+            values = array("d", values)
+            values.byteswap()
+        stream.write(values.tobytes())
+
+    stream.write(encoded)
+
+
+def load_columns(stream: BinaryIO) -> "ColumnarRows":
+    """
+    Reads a snapshot written by `dump_columns`, in either format, as rows
+    stored in columns. Binary snapshots are read straight into the columns,
+    without creating an object for each row's values.
+    """
+
+    from progrow.columnar_rows import ColumnarRows
+
+    head = stream.read(HEADER.size)
+    prefix = head[: len(MAGIC) - 1]
+
+    if not head or prefix != MAGIC[: len(prefix)]:
+        return _load_json_lines(head + stream.read())
+
+    if len(head) < HEADER.size:
+        raise ValueError("snapshot is truncated")
+
+    magic, count, names_length = HEADER.unpack(head)
+    if magic != MAGIC:
+        raise ValueError("unsupported snapshot version")
+
+    columns: List[MutableSequence[float]] = []
+
+    for _ in range(2):
+        values = array("d")
+        data = stream.read(count * values.itemsize)
+        if len(data) != count * values.itemsize:
+            raise ValueError("snapshot is truncated")
+        values.frombytes(data)
+        if byteorder == "big":
+            values.byteswap()
+        columns.append(values)
+
+    encoded = stream.read(names_length)
+    if len(encoded) != names_length:
+        raise ValueError("snapshot is truncated")
+
+    names = encoded.decode("utf-8").split(NAME_SEPARATOR) if count else []
+
+    rows = ColumnarRows()
+    rows.names = names
+    rows.currents = columns[0]
+    rows.maximums = columns[1]
+    return rows
+
+
+def _load_json_lines(data: bytes) -> "ColumnarRows":
+    from progrow.columnar_rows import ColumnarRows
+
+    # Parsing every line in one call is far quicker than a call per line.
+    lines = [line for line in data.decode("utf-8").split("\n") if line.strip()]
+    parsed = json.loads("[" + ",".join(lines) + "]")
+
+    rows = ColumnarRows()
+    rows.names = list(map(itemgetter(0), parsed))
+    rows.currents = array("d", map(itemgetter(1), parsed))
+    rows.maximums = array("d", map(itemgetter(2), parsed))
+    return rows
+
+
+def _number(value: float) -> str:
+    """ Formats `value` as a JSON number, without a decimal point if whole. """
+
+    value = float(value)
+
+    if value.is_integer():
+        return str(int(value))
+
+    if isfinite(value):
+        return repr(value)
+
+    # JSON has no infinity or NaN, but Python reads and writes them as these.
+    return json.dumps(value)
@@ -0,0 +1,33 @@
+""" Hosts the `StripedLock` class. """
+
+from threading import Lock
+from typing import List
+
+
+class StripedLock:
+    """
+    A fixed pool of locks shared between many objects.
+
+    Each object is guarded by one lock chosen from its key, so updates to
+    different objects rarely wait on each other, without the memory cost of a
+    lock per object.
+
+    `stripes` describes the number of locks in the pool.
+    """
+
+    def __init__(self, stripes: int = 64) -> None:
+        self.locks: List[Lock] = [Lock() for _ in range(stripes)]
+        """ Locks in the pool. """
+
+    def __getitem__(self, key: int) -> Lock:
+        """ Gets the lock that guards `key`. """
+        return self.locks[key % len(self.locks)]
+
+    def for_object(self, obj: object) -> Lock:
+        """ Gets the lock that guards `obj`. """
+        # Object addresses are aligned, so their low bits carry no information.
+        return self[id(obj) >> 4]
+
+
+row_locks = StripedLock()
+""" Locks that guard the values of `Row` instances. """
@@ -1,7 +1,11 @@
 """ Hosts the `Style` class. """
 
-from shutil import get_terminal_size
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
+
+from progrow.terminal_width import terminal_width
+
+if TYPE_CHECKING:
+    from progrow.frozen_style import FrozenStyle
 
 
 class Style:
@@ -17,8 +21,28 @@ class Style:
     `show_percent` describes whether or not to include percentages.
 
     `width` describes the width to render to.
+
+    `width_ttl` describes how long, in seconds, to reuse the terminal width when
+    no `width` is set. The terminal width is otherwise reused until the terminal
+    is resized, on platforms that signal resizes.
+
+    `show_rate` describes whether or not to include the rate of progress. Rates
+    are estimated only for rows with a `Row.rate_estimator`.
+
+    `show_eta` describes whether or not to include the estimated time remaining.
     """
 
+    __slots__ = (
+        "color",
+        "force_width",
+        "name_suffix",
+        "show_eta",
+        "show_fraction",
+        "show_percent",
+        "show_rate",
+        "width_ttl",
+    )
+
     def __init__(
         self,
         color: bool = True,
@@ -26,6 +50,9 @@ class Style:
         show_fraction: bool = False,
         show_percent: bool = False,
         width: Optional[int] = None,
+        width_ttl: Optional[float] = None,
+        show_rate: bool = False,
+        show_eta: bool = False,
     ) -> None:
         self.color = color
         """ Whether to render in colour or plain text. """
@@ -42,6 +69,22 @@ class Style:
         self.force_width = width
         """ Width to render to. """
 
+        self.width_ttl = width_ttl
+        """ Number of seconds to reuse the terminal width for. """
+
+        self.show_rate = show_rate
+        """ Whether or not to include the rate of progress. """
+
+        self.show_eta = show_eta
+        """ Whether or not to include the estimated time remaining. """
+
+    @property
+    def eta_prefix(self) -> str:
+        """ String to inject before the estimated time remaining. """
+        if self.show_fraction or self.show_percent or self.show_rate:
+            return " • "
+        return " "
+
     @property
     def fraction_prefix(self) -> str:
         """ String to inject before the fraction. """
@@ -52,11 +95,33 @@ class Style:
         """ String to inject between the enumerator and denominator. """
         return " / "
 
+    def freeze(self) -> "FrozenStyle":
+        """
+        Gets an immutable, hashable copy of this style. See `FrozenStyle`.
+        """
+        from progrow.frozen_style import FrozenStyle
+
+        return FrozenStyle(
+            color=self.color,
+            name_suffix=self.name_suffix,
+            show_fraction=self.show_fraction,
+            show_percent=self.show_percent,
+            width=self.force_width,
+            width_ttl=self.width_ttl,
+            show_rate=self.show_rate,
+            show_eta=self.show_eta,
+        )
+
     @property
     def percent_prefix(self) -> str:
         """ String to inject before percentages. """
         return " • " if self.show_fraction else " "
 
+    @property
+    def rate_prefix(self) -> str:
+        """ String to inject before the rate of progress. """
+        return " • " if self.show_fraction or self.show_percent else " "
+
     @property
     def width(self) -> int:
         """
@@ -65,5 +130,4 @@ class Style:
         """
         if self.force_width:
             return self.force_width
-        (width, _) = get_terminal_size((80, 20))
-        return width
+        return terminal_width.get(self.width_ttl)
@@ -0,0 +1,142 @@
+""" Hosts the `TerminalWidth` class. """
+
+import signal
+from threading import current_thread, main_thread
+from time import monotonic
+from types import FrameType
+from typing import Any, Callable, Optional
+
+
+def lookup_terminal_width() -> int:
+    """ Looks up the terminal width, or `80` if it cannot be determined. """
+    # shutil is slow to import and only needed once a render needs the width.
+    from shutil import get_terminal_size
+
+    (width, _) = get_terminal_size((80, 20))
+    return width
+
+
+class TerminalWidth:
+    """
+    Caches the terminal width.
+
+    The cached width is forgotten whenever the terminal is resized, if the
+    platform raises `SIGWINCH` and the handler could be installed. Otherwise,
+    the width is cached for `fallback_ttl` seconds unless a time-to-live is
+    given.
+
+    Signal handlers can only be installed from the main thread, so a read from
+    any other thread uses the fallback until a read or `TerminalWidth.watch`
+    call on the main thread installs the handler.
+
+    `lookup` describes the function that looks up the actual width.
+
+    `clock` describes the monotonic clock, in seconds, used to age the cache.
+
+    `fallback_ttl` describes the maximum age, in seconds, of a cached width
+    while no `SIGWINCH` handler watches for resizes.
+    """
+
+    def __init__(
+        self,
+        lookup: Callable[[], int] = lookup_terminal_width,
+        clock: Callable[[], float] = monotonic,
+        fallback_ttl: float = 0.5,
+    ) -> None:
+        self.lookup = lookup
+        """ Function that looks up the actual width. """
+
+        self.clock = clock
+        """ Monotonic clock, in seconds. """
+
+        self.fallback_ttl = fallback_ttl
+        """
+        Maximum age, in seconds, of a cached width while no `SIGWINCH` handler
+        watches for resizes.
+        """
+
+        self.cached: Optional[int] = None
+        """ Cached width, if any. """
+
+        self.cached_at = 0.0
+        """ Clock time at which the width was cached. """
+
+        self.watching: Optional[bool] = None
+        """
+        Whether a `SIGWINCH` handler invalidates the cache. `None` if it has not
+        been installed from the main thread yet.
+        """
+
+    def get(self, ttl: Optional[float] = None) -> int:
+        """
+        Gets the terminal width.
+
+        `ttl` describes the maximum age, in seconds, of a cached width. If not
+        set, a cached width is used for as long as a `SIGWINCH` handler watches
+        for resizes, or else for `TerminalWidth.fallback_ttl` seconds.
+        """
+
+        if self.watching is None:
+            self.watch()
+
+        cached = self.cached
+
+        if cached is not None:
+            if ttl is None:
+                if self.watching:
+                    return cached
+                ttl = self.fallback_ttl
+            if self.clock() - self.cached_at < ttl:
+                return cached
+
+        width = self.lookup()
+        self.cached = width
+        self.cached_at = self.clock()
+        return width
+
+    def invalidate(self) -> None:
+        """ Forgets the cached width. """
+        self.cached = None
+
+    def watch(self) -> bool:
+        """
+        Installs a `SIGWINCH` handler that invalidates the cache, chaining to any
+        existing handler. Returns `True` if the cache is being watched.
+
+        The handler cannot be installed on platforms without `SIGWINCH`. Calls
+        from any thread other than the main thread install nothing, and leave
+        the handler to be installed by a later call from the main thread.
+        """
+
+        if self.watching:
+            return True
+
+        sigwinch = getattr(signal, "SIGWINCH", None)
+
+        if sigwinch is None:
+            self.watching = False
+            return False
+
+        if current_thread() is not main_thread():
+            return False
+
+        try:
+            previous = signal.getsignal(sigwinch)
+
+            def on_resize(signum: int, frame: Optional[FrameType]) -> Any:
+                self.invalidate()
+                if callable(previous):
+                    previous(signum, frame)
+
+            signal.signal(sigwinch, on_resize)
+        except ValueError:
+            # Signals are unavailable, for example in a subinterpreter.
+            self.watching = False
+            return False
+
+        self.watching = True
+        return True
+
+
+terminal_width = TerminalWidth()
+""" Width of the terminal attached to this process. """
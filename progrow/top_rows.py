@@ -0,0 +1,137 @@
+""" Hosts the `TopRows` class. """
+
+from heapq import heapify, heappop, heappush, nlargest, nsmallest
+from itertools import count as counter
+from typing import Dict, List, Tuple
+
+from progrow.columnar_rows import ColumnarRows
+from progrow.row import Row
+from progrow.rows import Rows
+from progrow.striped_lock import StripedLock
+from progrow.viewport import Viewport
+
+Entry = Tuple[float, int, Row]
+""" Heap entry describing a row's sort key, insertion order and the row. """
+
+
+class TopRows(Viewport):
+    """
+    A `Viewport` that shows the least complete rows, or the most complete rows,
+    kept in order as rows change.
+
+    Rows are held in heaps that are updated as each row changes, so finding the
+    rows to show costs in proportion to the number shown rather than to the
+    number of rows. Rows that finish or fall behind move in and out of the view
+    without the whole collection being sorted. Each row belongs to one of
+    `stripes` heaps, each with its own lock, so threads updating different rows
+    rarely wait on each other.
+
+    Rows stored in columns don't report their changes, so the rows shown from a
+    `ColumnarRows` are selected from the columns on every render instead.
+
+    `rows` describes the rows to choose from.
+
+    `count` describes the number of rows to show.
+
+    `most` describes whether to show the most complete rows rather than the
+    least complete.
+
+    `fit_visible` describes whether to align only the visible rows rather than
+    every row.
+
+    `stripes` describes the number of heaps to spread the rows across.
+    """
+
+    def __init__(
+        self,
+        rows: Rows,
+        count: int,
+        most: bool = False,
+        fit_visible: bool = False,
+        stripes: int = 16,
+    ) -> None:
+        super().__init__(rows, height=count, fit_visible=fit_visible)
+
+        self.most = most
+        """ Whether to show the most complete rows rather than the least. """
+
+        self._entries: List[Dict[Row, Entry]] = [{} for _ in range(stripes)]
+        self._heaps: List[List[Entry]] = [[] for _ in range(stripes)]
+        self._locks = StripedLock(stripes)
+        self._pushed = counter()
+
+        if not isinstance(rows, ColumnarRows):
+            rows.watchers.append(self.update)
+            self._rebuild()
+
+    def update(self, row: Row) -> None:
+        """
+        Moves `row` to its new place in the order. `Rows` calls this whenever a
+        row is appended or changed.
+        """
+
+        stripe = self._stripe(row)
+
+        with self._locks[stripe]:
+            # Read the row inside the lock so that the newest entry always
+            # holds the newest value, whichever thread pushes last.
+            key = -row.percent if self.most else row.percent
+            entry = (key, next(self._pushed), row)
+            entries = self._entries[stripe]
+            entries[row] = entry
+            heap = self._heaps[stripe]
+            heappush(heap, entry)
+
+            # Replaced entries are only discarded as they reach the top, so
+            # compact the heap if they start to outnumber the rows.
+            if len(heap) > 2 * len(entries) + 64:
+                heap = list(entries.values())
+                heapify(heap)
+                self._heaps[stripe] = heap
+
+    def visible(self) -> List[Row]:
+        """ Gets the rows in the window, in order. """
+
+        end = self.offset + self.height
+
+        if isinstance(self.rows, ColumnarRows):
+            percents = self.rows.percents()
+            select = nlargest if self.most else nsmallest
+            indexes = select(end, range(len(percents)), key=percents.__getitem__)
+            return [self.rows.row(index) for index in indexes[self.offset :]]
+
+        if sum(map(len, self._entries)) != len(self.rows):
+            # The list was changed directly, so start over.
+            self._rebuild()
+
+        found: List[Entry] = []
+
+        for stripe, entries in enumerate(self._entries):
+            with self._locks[stripe]:
+                heap = self._heaps[stripe]
+                top: List[Entry] = []
+
+                while heap and len(top) < end:
+                    entry = heappop(heap)
+                    if entries.get(entry[2]) is entry:
+                        top.append(entry)
+
+                for entry in top:
+                    heappush(heap, entry)
+
+            found.extend(top)
+
+        return [entry[2] for entry in nsmallest(end, found)[self.offset :]]
+
+    def _rebuild(self) -> None:
+        for stripe, entries in enumerate(self._entries):
+            with self._locks[stripe]:
+                entries.clear()
+                self._heaps[stripe].clear()
+
+        for row in self.rows.rows:
+            self.update(row)
+
+    def _stripe(self, row: Row) -> int:
+        # Object addresses are aligned, so their low bits carry no information.
+        return (id(row) >> 4) % len(self._heaps)
@@ -0,0 +1,240 @@
+""" Hosts the `TreeRows` class. """
+
+from threading import RLock
+from typing import Collection, Dict, Iterator, List, Optional, Tuple
+
+from progrow.layout import Layout
+from progrow.render_cache import RenderCache
+from progrow.row import Row
+from progrow.rows import Rows
+from progrow.style import Style
+
+
+class TreeRows(Rows):
+    """
+    Describes a tree of rows, where each parent row's progress includes the
+    progress of its children.
+
+    Add rows with `TreeRows.add`. A row's values are its own plus the sums of
+    its children's values, so parent rows are usually added with no progress of
+    their own. When a row changes, the difference is added to each of its
+    ancestors in turn; the rest of the tree is not visited.
+
+    Rows are rendered depth-first and indented by depth. Set `max_depth` to
+    render only the top levels of the tree; hidden rows are never visited, and
+    don't widen the columns.
+
+    `indent` describes the string to indent each level by.
+
+    `max_depth` describes the number of levels to render, or `None` for all.
+
+    `total` describes the name of an optional footer row that sums every
+    top-level row.
+
+    `render_cache` describes an optional cache to render through.
+
+    `rate_half_life` describes the half-life, in seconds, with which to estimate
+    each row's rate of progress. Rates are not estimated if not set.
+    """
+
+    def __init__(
+        self,
+        indent: str = "  ",
+        max_depth: Optional[int] = None,
+        total: Optional[str] = None,
+        render_cache: Optional[RenderCache] = None,
+        rate_half_life: Optional[float] = None,
+    ) -> None:
+        self.indent = indent
+        """ String to indent each level by. """
+
+        self.max_depth = max_depth
+        """ Number of levels to render, or `None` for all. """
+
+        self._children: Dict[Optional[Row], List[Row]] = {None: []}
+        self._depths: Dict[Row, int] = {}
+        self._known: Dict[Row, Tuple[float, float]] = {}
+        self._measured_depth = max_depth
+        self._parents: Dict[Row, Row] = {}
+        self._tree_lock = RLock()
+
+        super().__init__(render_cache=render_cache, rate_half_life=rate_half_life)
+
+        self.total: Optional[Row] = None
+        """ Footer row that sums every top-level row, if any. """
+
+        if total is not None:
+            self.total = Row(total, current=0, maximum=0)
+            self._depths[self.total] = 0
+            self._add(self.total)
+
+    def add(
+        self,
+        name: str,
+        current: float = 0,
+        maximum: float = 0,
+        parent: Optional[Row] = None,
+    ) -> Row:
+        """
+        Adds a row and returns it.
+
+        `name` describes the name of the row.
+
+        `current` describes the row's own current progress.
+
+        `maximum` describes the row's own potential maximum progress.
+
+        `parent` describes the row to add this row beneath. Top-level rows are
+        added if not set.
+        """
+
+        row = Row(name=name, current=current, maximum=maximum)
+
+        with self._tree_lock:
+            self._children.setdefault(parent, []).append(row)
+            self._depths[row] = 0 if parent is None else self._depths[parent] + 1
+            ancestor = parent or self.total
+            if ancestor:
+                self._parents[row] = ancestor
+
+            self._add(row)
+
+        return row
+
+    def append(self, name: str, current: float, maximum: float) -> None:
+        """
+        Appends a top-level row.
+
+        `name` describes the name of the row.
+
+        `current` describes the current progress. For example, `3` if 3 out of 7
+        units of work are complete.
+
+        `maximum` describes the potential maximum progress. For example, `7` if
+        3 out of 7 units of work are complete.
+        """
+        self.add(name, current=current, maximum=maximum)
+
+    def calculate_layout(self, style: Style) -> Layout:
+        """ Calculates a layout to align the visible rows. """
+
+        if self.max_depth != self._measured_depth:
+            # Rows may have been shown or hidden, so measure them all again.
+            self._measured_depth = self.max_depth
+            self._stale.update(self.rows)
+
+        return super().calculate_layout(style)
+
+    def children(self, row: Optional[Row] = None) -> List[Row]:
+        """ Gets the children of `row`, or the top-level rows if not set. """
+        return list(self._children.get(row, []))
+
+    def depth(self, row: Row) -> int:
+        """ Gets the depth of `row`, where top-level rows are `0`. """
+        return self._depths.get(row, 0)
+
+    def invalidate(self, row: Row) -> None:
+        """
+        Marks `row` to be measured again before the next layout, and adds any
+        change in its values to its parent.
+        """
+
+        super().invalidate(row)
+        self._propagate(row)
+
+    def invalidate_many(self, rows: Collection[Row]) -> None:
+        """
+        Marks every row in `rows` to be measured again before the next layout,
+        and adds any changes in their values to their parents.
+        """
+        super().invalidate_many(rows)
+        for row in rows:
+            self._propagate(row)
+
+    def iter_render(self, style: Optional[Style] = None) -> Iterator[str]:
+        """
+        Renders the tree one row at a time, depth-first. Yields each rendered
+        row without a line break.
+        """
+
+        style = style or Style()
+        layout = self.calculate_layout(style)
+        return self.render_rows(self._iter_visible_copies(), layout, style)
+
+    def measure(self, row: Row) -> Tuple[int, int, int, int]:
+        """
+        Measures the unpadded parts of `row` as this collection renders it,
+        including its indentation. Rows hidden by `max_depth` measure nothing.
+        See `Row.measure`.
+        """
+
+        depth = self.depth(row)
+
+        if depth and self.max_depth is not None and depth >= self.max_depth:
+            return (0, 0, 0, 0)
+
+        name, left, right, percent = row.measure()
+        return (name + len(self.indent) * depth, left, right, percent)
+
+    def _append_many(self, values: List[Tuple[str, float, float]]) -> None:
+        for name, current, maximum in values:
+            self.append(name, current, maximum)
+
+    def _iter_visible_copies(self) -> Iterator[Row]:
+        """
+        Yields indented copies of the visible rows, depth-first. The same row is
+        reused for every copy.
+        """
+
+        with self._tree_lock:
+            stack = list(reversed(self._children[None]))
+
+        copy = Row("", 0, 0)
+
+        while stack:
+            row = stack.pop()
+            depth = self.depth(row)
+            copy.copy_from(row)
+            copy.name = self.indent * depth + copy.name
+            yield copy
+
+            if self.max_depth is None or depth + 1 < self.max_depth:
+                with self._tree_lock:
+                    stack.extend(reversed(self._children.get(row, [])))
+
+        if self.total:
+            copy.copy_from(self.total)
+            yield copy
+
+    def _propagate(self, row: Row) -> None:
+        """ Adds any change in the values of `row` to its parent. """
+
+        # Reading the row and recording what was read happen together under
+        # the row's own lock, so each change is passed on exactly once without
+        # serialising updates to unrelated rows.
+        with row.lock:
+            current = row.current
+            maximum = row.maximum
+            known_current, known_maximum = self._known.get(row, (0, 0))
+            self._known[row] = (current, maximum)
+
+        parent = self._parents.get(row)
+
+        if parent is None:
+            return
+
+        # Each change reaches the parent's own invalidation in turn, so the
+        # difference climbs the tree one ancestor at a time.
+        if current != known_current:
+            parent.advance(current - known_current)
+
+        if maximum != known_maximum:
+            parent.advance_maximum(maximum - known_maximum)
+
+    def _reset(self, row: Row, current: float, maximum: float) -> None:
+        super()._reset(row, current, maximum)
+
+        # A snapshot's values already include each row's children, so the new
+        # values are not added to the row's ancestors.
+        with row.lock:
+            self._known[row] = (current, maximum)
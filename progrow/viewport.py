@@ -0,0 +1,128 @@
+""" Hosts the `Viewport` class. """
+
+from heapq import nlargest, nsmallest
+from itertools import islice
+from typing import Any, Callable, Iterator, List, Optional
+
+from progrow.layout import Layout
+from progrow.row import Row
+from progrow.rows import Rows
+from progrow.style import Style
+
+
+class Viewport:
+    """
+    A window onto `Rows` that renders only the rows that fit on screen.
+
+    Refreshing the window formats only the visible rows, so a screen of a very
+    large collection costs no more to draw than a screen of a small one.
+
+    By default, visible rows are aligned with `Rows.calculate_layout`, which is
+    maintained as rows change, so columns don't shift as the window scrolls. To
+    align only the visible rows instead, set `fit_visible`.
+
+    `rows` describes the rows to show.
+
+    `height` describes the number of rows to show.
+
+    `offset` describes the number of rows to skip before the first shown row.
+
+    `key` describes an optional function to sort the rows by before the offset
+    is applied. For example, `lambda row: row.percent` to show the least
+    complete rows first. Only the rows up to the bottom of the window are
+    sorted.
+
+    `reverse` describes whether to sort in descending order.
+
+    `fit_visible` describes whether to align only the visible rows rather than
+    every row.
+    """
+
+    def __init__(
+        self,
+        rows: Rows,
+        height: int,
+        offset: int = 0,
+        key: Optional[Callable[[Row], Any]] = None,
+        reverse: bool = False,
+        fit_visible: bool = False,
+    ) -> None:
+        if height <= 0:
+            raise ValueError(f"height must be positive, not {height}")
+
+        self.rows = rows
+        """ Rows to show. """
+
+        self.height = height
+        """ Number of rows to show. """
+
+        self.offset = max(0, offset)
+        """ Number of rows to skip before the first shown row. """
+
+        self.key = key
+        """ Function to sort the rows by, if any. """
+
+        self.reverse = reverse
+        """ Whether to sort in descending order. """
+
+        self.fit_visible = fit_visible
+        """ Whether to align only the visible rows rather than every row. """
+
+    def calculate_layout(self, style: Style, visible: List[Row]) -> Layout:
+        """
+        Calculates a layout to align the `visible` rows, measuring only those
+        rows if `Viewport.fit_visible` is set.
+        """
+
+        if not self.fit_visible:
+            return self.rows.calculate_layout(style)
+
+        if not visible:
+            return Layout()
+
+        widths = [row.measure() for row in visible]
+
+        return Layout.from_widths(
+            style,
+            name=max(w[0] for w in widths),
+            left_fraction=max(w[1] for w in widths),
+            right_fraction=max(w[2] for w in widths),
+            percent=max(w[3] for w in widths),
+        )
+
+    def iter_render(self, style: Optional[Style] = None) -> Iterator[str]:
+        """
+        Renders the visible rows one at a time. Yields each rendered row without
+        a line break.
+        """
+
+        style = style or Style()
+        visible = [row.snapshot() for row in self.visible()]
+        layout = self.calculate_layout(style, visible)
+        return self.rows.render_rows(visible, layout, style)
+
+    def render(self, style: Optional[Style] = None) -> str:
+        """ Renders the visible rows. """
+        return "\n".join(self.iter_render(style)).rstrip()
+
+    def scroll(self, lines: int) -> None:
+        """
+        Scrolls the window by `lines`, which is negative to scroll up. The
+        window stops at the first and last rows.
+        """
+        bottom = max(0, len(self.rows) - self.height)
+        self.offset = max(0, min(self.offset + lines, bottom))
+
+    def visible(self) -> List[Row]:
+        """ Gets the rows in the window. """
+
+        end = self.offset + self.height
+        count = len(self.rows)
+
+        if self.key is None:
+            indexes = range(self.offset, min(end, count))
+            return [self.rows.row(index) for index in indexes]
+
+        every = map(self.rows.row, range(count))
+        select = nlargest if self.reverse else nsmallest
+        return list(islice(select(end, every, key=self.key), self.offset, None))
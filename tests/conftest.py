@@ -0,0 +1,21 @@
+from typing import List
+
+from pytest import fixture
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.sleeps: List[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@fixture
+def clock() -> Clock:
+    return Clock()
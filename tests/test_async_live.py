@@ -0,0 +1,130 @@
+import asyncio
+from io import StringIO
+from threading import Thread, current_thread, main_thread
+from typing import Any, Dict, List
+
+from pytest import raises
+
+from progrow.async_live import AsyncLive, live
+from progrow.live_renderer import LiveRenderer
+from progrow.row import Row
+from progrow.rows import Rows
+from progrow.style import Style
+
+
+def make_rows() -> Rows:
+    return Rows([Row("foo", current=0, maximum=4)])
+
+
+def test_init__invalid_fps() -> None:
+    with raises(ValueError):
+        AsyncLive(make_rows(), fps=0)
+
+
+def test_live() -> None:
+    rows = make_rows()
+    stream = StringIO()
+    style = Style(color=False, width=8)
+
+    async def work() -> None:
+        async with live(rows, fps=100, stream=stream, style=style):
+            for _ in range(4):
+                await asyncio.sleep(0.02)
+                rows.rows[0].advance()
+
+    asyncio.run(work())
+
+    assert stream.getvalue().startswith("foo\n")
+    assert stream.getvalue().endswith("\x1b[1A\rfoo ████\x1b[K\x1b[1B\r")
+
+
+def test_live__final_frame() -> None:
+    rows = make_rows()
+    stream = StringIO()
+    renderer = LiveRenderer(rows, stream=stream, style=Style(color=False, width=8))
+
+    async def work() -> AsyncLive:
+        async with AsyncLive(rows, renderer, fps=1) as driver:
+            await asyncio.sleep(0)
+            rows.rows[0].current = 4
+        return driver
+
+    driver = asyncio.run(work())
+    assert renderer.lines == ["foo ████"]
+    assert driver.frames == 2
+
+
+def test_live__cancelled() -> None:
+    rows = make_rows()
+    stream = StringIO()
+    renderer = LiveRenderer(rows, stream=stream, style=Style(color=False, width=8))
+
+    async def work() -> None:
+        async with AsyncLive(rows, renderer, fps=1):
+            rows.rows[0].current = 2
+            await asyncio.sleep(10)
+
+    async def cancel() -> None:
+        task = asyncio.ensure_future(work())
+        await asyncio.sleep(0.05)
+        rows.rows[0].current = 4
+        task.cancel()
+        with raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(cancel())
+    assert renderer.lines == ["foo ████"]
+
+
+class FailingRenderer(LiveRenderer):
+    def __init__(self, rows: Rows, stream: StringIO, failures: int) -> None:
+        super().__init__(rows, stream=stream, style=Style(color=False, width=8))
+        self.failures = failures
+        self.closed_from: List[Thread] = []
+
+    def close(self) -> None:
+        self.closed_from.append(current_thread())
+        super().close()
+
+    def next_frame(self) -> str:
+        if self.failures:
+            self.failures -= 1
+            raise RuntimeError("draw failed")
+        return super().next_frame()
+
+
+def test_live__draw_failed() -> None:
+    rows = make_rows()
+    renderer = FailingRenderer(rows, StringIO(), failures=1)
+
+    async def work() -> None:
+        async with AsyncLive(rows, renderer, fps=100):
+            await asyncio.sleep(0.05)
+            rows.rows[0].current = 4
+
+    with raises(RuntimeError):
+        asyncio.run(work())
+
+    assert renderer.lines == ["foo ████"]
+    assert renderer.closed_from and renderer.closed_from[0] is not main_thread()
+
+
+def test_live__body_error_wins() -> None:
+    rows = make_rows()
+    renderer = FailingRenderer(rows, StringIO(), failures=2)
+    handled: List[BaseException] = []
+
+    def handle(loop: asyncio.AbstractEventLoop, context: Dict[str, Any]) -> None:
+        handled.append(context["exception"])
+
+    async def work() -> None:
+        asyncio.get_running_loop().set_exception_handler(handle)
+        async with AsyncLive(rows, renderer, fps=100):
+            await asyncio.sleep(0.05)
+            raise ValueError("body failed")
+
+    with raises(ValueError):
+        asyncio.run(work())
+
+    assert [str(error) for error in handled] == ["draw failed"]
+    assert renderer.closed_from
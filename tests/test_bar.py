@@ -0,0 +1,59 @@
+from math import floor
+
+from pytest import mark
+
+from progrow.bar import render_bar, render_boundary_bar
+
+
+def legacy_render_bar(percent: float, length: int) -> str:
+    """ The original column-by-column implementation of `Row.render_bar`. """
+
+    s = ""
+    pc_per_block = 1.0 / length
+    remaining_percent = percent
+
+    for _ in range(length):
+        this_pc = min(1.0, (1.0 / pc_per_block) * remaining_percent)
+        remaining_percent -= min(remaining_percent, pc_per_block)
+        s += " " if this_pc == 0.0 else chr(0x258F - floor(this_pc / (1.0 / 7)))
+
+    return s
+
+
+@mark.parametrize(
+    "percent, length, expect",
+    [
+        (0.5, 0, ""),
+        (0.5, -1, ""),
+        (0.0, 3, "   "),
+        (1.0, 3, "███"),
+        (2.0, 3, "███"),
+        (0.5, 3, "█▌ "),
+        (0.3, 3, "▉  "),
+    ],
+)
+def test_render_bar(percent: float, length: int, expect: str) -> None:
+    assert render_bar(percent, length) == expect
+
+
+@mark.parametrize("maximum", [1, 2, 3, 7, 9, 11, 16, 19, 99, 119, 1000, 12345])
+def test_render_bar__matches_legacy(maximum: int) -> None:
+    step = max(1, maximum // 30)
+    for length in range(1, 301, 7):
+        for current in list(range(0, maximum + 2, step)) + [maximum]:
+            percent = (1.0 / maximum) * current
+            expect = legacy_render_bar(percent, length)
+            assert render_bar(percent, length) == expect, (current, maximum, length)
+
+
+@mark.parametrize(
+    "percent, length",
+    [
+        (1.0, 20),
+        ((1.0 / 9) * 2, 36),
+        (0.5, 7),
+        (-0.1, 10),
+    ],
+)
+def test_render_boundary_bar(percent: float, length: int) -> None:
+    assert render_boundary_bar(percent, length) == legacy_render_bar(percent, length)
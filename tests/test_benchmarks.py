@@ -0,0 +1,74 @@
+from pathlib import Path
+from typing import List, Tuple
+
+from pytest import MonkeyPatch, mark
+
+from benchmarks.benchmark import Case, cases, compare, main, measure, prepare
+from progrow import Row, Rows
+
+
+def test_cases() -> None:
+    assert len(list(cases())) == (3 * 3 * 3 * 8) + (3 * 3)
+
+
+def test_cases__unstyled() -> None:
+    assert list(cases(["rows.append"], [10], [40, 80])) == [
+        Case("rows.append", 10, 40, False, False, False),
+    ]
+
+
+@mark.parametrize(
+    "kind",
+    [
+        "row.render",
+        "rows.render",
+        "rows.calculate_layout",
+        "rows.append",
+        "rows.restore",
+        "columnar_rows.restore",
+    ],
+)
+def test_measure(kind: str) -> None:
+    case = Case(kind, 10, 80, True, True, True)
+    measurement = measure(case, min_time=0)
+    assert measurement["seconds_per_row"] > 0
+    assert measurement["peak_bytes"] > 0
+
+
+def test_prepare__cold_layout(monkeypatch: MonkeyPatch) -> None:
+    measured: List[Row] = []
+    measure_row = Rows.measure
+
+    def counting_measure(rows: Rows, row: Row) -> Tuple[int, int, int, int]:
+        measured.append(row)
+        return measure_row(rows, row)
+
+    monkeypatch.setattr(Rows, "measure", counting_measure)
+    run = prepare(Case("rows.calculate_layout", 10, 80, False, True, True))
+    run()
+    run()
+    assert len(measured) == 20
+
+
+def test_compare() -> None:
+    baseline = {
+        "a": {"seconds_per_row": 1.0, "peak_bytes": 100.0},
+        "b": {"seconds_per_row": 1.0, "peak_bytes": 100.0},
+    }
+    results = {
+        "a": {"seconds_per_row": 1.2, "peak_bytes": 200.0},
+        "b": {"seconds_per_row": 2.0, "peak_bytes": 100.0},
+        "c": {"seconds_per_row": 9.0, "peak_bytes": 900.0},
+    }
+    assert compare(baseline, results, tolerance=0.25) == [
+        "a: peak_bytes +100%",
+        "b: seconds_per_row +100%",
+    ]
+
+
+def test_main(tmp_path: Path) -> None:
+    baseline = tmp_path.joinpath("baseline.json")
+    args = ["--kinds", "rows.render", "--rows", "5", "--widths", "40"]
+    args.extend(["--min-time", "0"])
+    assert main(args + ["--save", str(baseline)]) == 0
+    assert main(args + ["--compare", str(baseline), "--tolerance", "1000"]) == 0
@@ -0,0 +1,16 @@
+from progrow.colors import Colors, get_colors
+
+
+def test_get_colors() -> None:
+    assert get_colors() == Colors(
+        bar="\x1b[32m",
+        fraction="\x1b[94m",
+        name="\x1b[33m",
+        percent="\x1b[36m",
+        rate="\x1b[35m",
+        reset="\x1b[39m",
+    )
+
+
+def test_get_colors__cached() -> None:
+    assert get_colors() is get_colors()
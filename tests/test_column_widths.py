@@ -0,0 +1,34 @@
+from progrow.column_widths import ColumnWidths
+
+
+def test_empty() -> None:
+    assert ColumnWidths().maximum is None
+
+
+def test_add() -> None:
+    widths = ColumnWidths()
+    widths.add(2)
+    widths.add(5)
+    widths.add(3)
+    assert widths.maximum == 5
+
+
+def test_remove__shrinks() -> None:
+    widths = ColumnWidths()
+    widths.add(2)
+    widths.add(5)
+    widths.add(5)
+    widths.remove(5)
+    assert widths.maximum == 5
+    widths.remove(5)
+    assert widths.maximum == 2
+    widths.remove(2)
+    assert widths.maximum is None
+
+
+def test_clear() -> None:
+    widths = ColumnWidths()
+    widths.add(2)
+    widths.clear()
+    assert widths.maximum is None
+    assert widths.counts == {}
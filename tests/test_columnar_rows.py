@@ -0,0 +1,240 @@
+from random import Random
+from threading import Thread
+from typing import Generic, Iterator, List, TypeVar
+
+from pytest import mark, raises
+
+from progrow.columnar_rows import ColumnarRows, column_width
+from progrow.render_cache import RenderCache
+from progrow.row import Row
+from progrow.row_view import unbox
+from progrow.rows import Rows
+from progrow.style import Style
+
+T = TypeVar("T")
+
+styles = [
+    Style(color=False, width=40),
+    Style(color=False, show_fraction=True, width=40),
+    Style(color=False, show_percent=True, width=40),
+    Style(color=True, show_fraction=True, show_percent=True, width=60),
+    Style(color=False, name_suffix=": ", show_fraction=True, show_percent=True),
+]
+
+
+def make_columns(seed: int, whole: bool) -> List[List[float]]:
+    random = Random(seed)
+    maximums: List[float] = [
+        random.randint(1, 10 ** random.randint(0, 7)) for _ in range(50)
+    ]
+    currents: List[float] = [random.randint(-5, int(m) * 2) for m in maximums]
+    if not whole:
+        currents = [float(c) / 7 for c in currents]
+    return [currents, maximums]
+
+
+@mark.parametrize("style", styles)
+@mark.parametrize("whole", [True, False])
+def test_render__matches_rows(style: Style, whole: bool) -> None:
+    currents, maximums = make_columns(1, whole)
+    names = [f"row-{'x' * (index % 9)}" for index in range(len(currents))]
+
+    columnar = Rows.from_columns(names, currents, maximums)
+    # Whole numbers are expected to render as ints.
+    rows = Rows(
+        [
+            Row(n, unbox(float(c)), unbox(float(m)))
+            for n, c, m in zip(names, currents, maximums)
+        ]
+    )
+
+    assert columnar.render(style) == rows.render(style)
+
+
+class ArrayLike(Generic[T]):
+    """ Iterable without a truth value, like a NumPy array. """
+
+    def __init__(self, values: List[T]) -> None:
+        self.values = values
+
+    def __bool__(self) -> bool:
+        raise ValueError("truth value is ambiguous")
+
+    def __iter__(self) -> Iterator[T]:
+        return iter(self.values)
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+
+def test_init__array_like() -> None:
+    names = ArrayLike(["foo", "bar"])
+    rows = ColumnarRows(names, ArrayLike([3.0, 4.0]), ArrayLike([5.0, 6.0]))
+    assert rows.names == ["foo", "bar"]
+    assert list(rows.currents) == [3, 4]
+    assert list(rows.maximums) == [5, 6]
+
+
+def test_init__inherited_attributes() -> None:
+    rows = ColumnarRows(["foo"], [1], [2])
+    seen: List[Row] = []
+    rows.watchers.append(seen.append)
+    rows.invalidate(rows.row(0))
+    rows.invalidate_many(rows.rows)
+    assert [row.name for row in seen] == ["foo", "foo"]
+    assert rows.rate_half_life is None
+
+
+def test_rows__assigned() -> None:
+    rows = ColumnarRows()
+    rows.rows = [Row("foo", 1, 2), Row("bar", 3, 4)]
+    assert rows.names == ["foo", "bar"]
+    assert rows["bar"].current == 3
+
+
+def test_init__mismatched() -> None:
+    with raises(ValueError):
+        ColumnarRows(["foo"], [1, 2], [3])
+
+
+def test_append() -> None:
+    rows = ColumnarRows()
+    rows.append("foo", current=1, maximum=9)
+    rows.append("bar", current=2, maximum=9)
+    style = Style(color=False, width=40)
+    assert len(rows) == 2
+    assert rows.render(style) == "foo ████\nbar ███████▉"
+
+
+def test_render__empty() -> None:
+    assert ColumnarRows().render(Style(show_fraction=True, show_percent=True)) == ""
+
+
+def test_render__cache() -> None:
+    cache = RenderCache()
+    rows = ColumnarRows(["foo", "bar"], [1, 3], [2, 4], render_cache=cache)
+    style = Style(color=False, show_percent=True, width=20)
+
+    expect = Rows([Row("foo", 1, 2), Row("bar", 3, 4)]).render(style)
+    assert rows.render(style) == expect
+    assert rows.render(style) == expect
+    assert cache.hits == 2
+    assert cache.misses == 2
+
+
+def test_rows__views() -> None:
+    rows = Rows.from_columns(["foo", "bar"], [1, 2.5], [9, 10])
+    views = rows.rows
+    assert [(r.name, r.current, r.maximum) for r in views] == [
+        ("foo", 1, 9),
+        ("bar", 2.5, 10),
+    ]
+    assert isinstance(views[0].current, int)
+
+    views[1].current = 5
+    views[1].maximum = 20
+    views[1].name = "baz"
+    assert rows.names == ["foo", "baz"]
+    assert list(rows.currents) == [1.0, 5.0]
+    assert list(rows.maximums) == [9.0, 20.0]
+    assert rows.row(-1).percent == 0.25
+
+
+@mark.parametrize("index", [2, -3])
+def test_row__out_of_range(index: int) -> None:
+    with raises(IndexError):
+        Rows.from_columns(["foo", "bar"], [1, 2], [9, 10]).row(index)
+
+
+def test_percents() -> None:
+    rows = Rows.from_columns(["foo", "bar"], [1, 2], [4, 3])
+    assert rows.percents() == [Row("", 1, 4).percent, Row("", 2, 3).percent]
+
+
+@mark.parametrize(
+    "values, expect",
+    [
+        ([], None),
+        ([1, 12345, 7], 6),
+        ([-12345, 1], 7),
+        ([1.5, 2], 3),
+    ],
+)
+def test_column_width(values: List[float], expect: int) -> None:
+    rows = ColumnarRows(["x"] * len(values), values, values)
+    assert column_width(rows.currents) == expect
+
+
+def test_iter_render() -> None:
+    rows = Rows.from_columns(["foo", "bar"], [1, 2], [9, 9])
+    style = Style(color=False, width=40)
+    assert list(rows.iter_render(style)) == ["foo ████", "bar ███████▉"]
+
+
+def test_advance__threads() -> None:
+    rows = Rows.from_columns([f"row-{i}" for i in range(8)], [0] * 8, [10_000] * 8)
+    views = rows.rows
+
+    def advance(index: int) -> None:
+        for _ in range(2_000):
+            views[index].advance()
+            views[0].advance()
+
+    threads = [Thread(target=advance, args=(index,)) for index in range(1, 8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert list(rows.currents) == [14_000] + [2_000] * 7
+    assert rows.row(0).advance(0.5) == 14_000.5
+
+
+def test_snapshot() -> None:
+    rows = Rows.from_columns(["foo"], [1], [2])
+    snapshot = rows.snapshot()
+    rows.row(0).advance()
+    assert list(snapshot.currents) == [1]
+    assert snapshot.names is not rows.names
+
+
+def test_row__slots() -> None:
+    assert not hasattr(ColumnarRows(["foo"], [1], [2]).row(0), "__dict__")
+
+
+def test_getitem() -> None:
+    rows = ColumnarRows(["foo", "bar", "foo"], [1, 2, 3], [4, 4, 4])
+    assert rows["bar"].current == 2
+    assert rows["foo"].current == 1
+    rows.append("baz", current=4, maximum=4)
+    assert rows["baz"].current == 4
+    with raises(KeyError):
+        rows["qux"]
+
+
+def test_getitem__renamed() -> None:
+    rows = ColumnarRows(["foo", "bar"], [1, 2], [4, 4])
+    assert rows["foo"].current == 1
+    rows.names[0] = "baz"
+    assert rows["baz"].current == 1
+    with raises(KeyError):
+        rows["foo"]
+
+
+def test_update_many() -> None:
+    rows = ColumnarRows(["foo", "bar"], [1, 2], [4, 4])
+    rows.set("foo", 2)
+    rows.update_many([("bar", 3), ("foo", 4)])
+    assert list(rows.currents) == [4, 3]
+
+
+def test_update_many__missing() -> None:
+    rows = ColumnarRows(["foo", "bar"], [1, 2], [4, 4])
+    with raises(KeyError):
+        rows.update_many([("bar", 3), ("baz", 1), ("foo", 4)])
+    assert list(rows.currents) == [1, 2]
+
+
+def test_percents__zero_maximum() -> None:
+    rows = ColumnarRows(["foo", "bar"], [0, 1], [0, 4])
+    assert rows.percents() == [0.0, 0.25]
@@ -0,0 +1,86 @@
+import sys
+from io import BytesIO, StringIO, TextIOWrapper
+
+from pytest import MonkeyPatch, mark
+
+from progrow.frame_writer import FrameWriter
+from progrow.live_renderer import LiveRenderer
+from progrow.rows import Rows
+from progrow.style import Style
+
+
+def test_write() -> None:
+    stream = StringIO()
+    writer = FrameWriter(stream)
+    assert writer.write("foo ██\n") == 11
+    assert writer.write("") == 0
+    assert stream.getvalue() == "foo ██\n"
+    assert writer.frames == 1
+    assert writer.last_bytes == 11
+    assert writer.total_bytes == 11
+
+
+def test_write__bytes() -> None:
+    writer = FrameWriter(StringIO())
+    writer.write("a\n")
+    writer.write("bcd\n")
+    assert writer.frames == 2
+    assert writer.last_bytes == 4
+    assert writer.total_bytes == 6
+    assert writer.average_bytes == 3
+
+
+def test_average_bytes__no_frames() -> None:
+    assert FrameWriter(StringIO()).average_bytes == 0
+
+
+@mark.parametrize(
+    "synchronized, hide_cursor, expect",
+    [
+        (False, False, "a\nb\n"),
+        (True, False, "\x1b[?2026ha\n\x1b[?2026l\x1b[?2026hb\n\x1b[?2026l"),
+        (False, True, "\x1b[?25la\nb\n\x1b[?25h"),
+        (
+            True,
+            True,
+            "\x1b[?25l\x1b[?2026ha\n\x1b[?2026l\x1b[?2026hb\n\x1b[?2026l\x1b[?25h",
+        ),
+    ],
+)
+def test_escapes(synchronized: bool, hide_cursor: bool, expect: str) -> None:
+    stream = StringIO()
+    with FrameWriter(stream, synchronized, hide_cursor) as writer:
+        writer.write("a\n")
+        writer.write("b\n")
+    writer.close()
+    assert stream.getvalue() == expect
+
+
+def test_write__binary_buffer() -> None:
+    raw = BytesIO()
+    stream = TextIOWrapper(raw, encoding="utf-8")
+    stream.write("before\n")
+    writer = FrameWriter(stream, synchronized=True)
+    assert writer.write("█\n") == 20
+    assert raw.getvalue() == "before\n\x1b[?2026h█\n\x1b[?2026l".encode()
+
+
+def test_live_renderer() -> None:
+    rows = Rows()
+    rows.append("foo", current=1, maximum=2)
+    stream = StringIO()
+    writer = FrameWriter(stream, hide_cursor=True)
+    renderer = LiveRenderer(rows, style=Style(color=False, width=8), writer=writer)
+    renderer.render()
+    renderer.close()
+    assert renderer.stream is stream
+    assert stream.getvalue() == "\x1b[?25lfoo ██\n\x1b[?25h"
+    assert writer.last_bytes == 17
+
+
+def test_write__redirected_stdout(monkeypatch: MonkeyPatch) -> None:
+    stream = StringIO()
+    writer = FrameWriter()
+    monkeypatch.setattr(sys, "stdout", stream)
+    writer.write("foo\n")
+    assert stream.getvalue() == "foo\n"
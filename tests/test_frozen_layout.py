@@ -0,0 +1,43 @@
+from pytest import raises
+
+from progrow.frozen_layout import FrozenLayout
+from progrow.layout import Layout
+
+
+def test_consider() -> None:
+    layout = Layout(name_length=3).freeze()
+    with raises(AttributeError):
+        layout.consider_name(9)
+    assert layout.name_length == 3
+
+
+def test_eq() -> None:
+    assert Layout(name_length=3).freeze() == FrozenLayout(name_length=3)
+    assert Layout(name_length=3).freeze() != FrozenLayout(name_length=4)
+    assert FrozenLayout(name_length=3) != Layout(name_length=3)
+
+
+def test_freeze() -> None:
+    layout = Layout(
+        left_fraction_length=1,
+        name_length=2,
+        percent_length=3,
+        right_fraction_length=4,
+    ).freeze()
+
+    assert layout.key == (1, 2, 3, 4, None, None)
+    assert layout.freeze() is layout
+
+
+def test_hash() -> None:
+    a = FrozenLayout(name_length=3)
+    b = FrozenLayout(name_length=3)
+    assert hash(a) == hash(b)
+    assert len({a, b}) == 1
+
+
+def test_setattr() -> None:
+    layout = FrozenLayout()
+    with raises(AttributeError) as ex:
+        layout.name_length = 3
+    assert str(ex.value) == "cannot set name_length: layout is frozen"
@@ -0,0 +1,40 @@
+from pytest import raises
+
+from progrow.frozen_style import FrozenStyle
+from progrow.style import Style
+
+
+def test_eq() -> None:
+    assert Style(show_percent=True).freeze() == FrozenStyle(show_percent=True)
+    assert Style(show_percent=True).freeze() != FrozenStyle(show_percent=False)
+    assert FrozenStyle() != Style()
+
+
+def test_freeze() -> None:
+    style = Style(
+        color=False,
+        name_suffix=": ",
+        show_fraction=True,
+        show_percent=True,
+        width=80,
+        width_ttl=1.5,
+    ).freeze()
+
+    assert style.key == (False, ": ", True, True, 80, 1.5, False, False)
+    assert style.percent_prefix == " • "
+    assert style.width == 80
+    assert style.freeze() is style
+
+
+def test_hash() -> None:
+    a = FrozenStyle(width=80)
+    b = FrozenStyle(width=80)
+    assert hash(a) == hash(b)
+    assert len({a, b}) == 1
+
+
+def test_setattr() -> None:
+    style = FrozenStyle()
+    with raises(AttributeError) as ex:
+        style.color = False
+    assert str(ex.value) == "cannot set color: style is frozen"
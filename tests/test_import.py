@@ -0,0 +1,48 @@
+from json import loads
+from subprocess import check_output
+from sys import executable
+from typing import Any, Dict
+
+MODULE_BUDGET = 70
+""" Maximum number of modules that `import progrow` may add. """
+
+SECONDS_BUDGET = 0.5
+""" Maximum number of seconds that `import progrow` may take. """
+
+SCRIPT = """
+import json
+import sys
+import time
+
+before = set(sys.modules)
+start = time.perf_counter()
+import progrow
+seconds = time.perf_counter() - start
+
+print(json.dumps({"modules": sorted(set(sys.modules) - before), "seconds": seconds}))
+"""
+
+
+def import_progrow() -> Dict[str, Any]:
+    result: Dict[str, Any] = loads(check_output([executable, "-c", SCRIPT]))
+    return result
+
+
+def test_import__budget() -> None:
+    result = import_progrow()
+    assert len(result["modules"]) <= MODULE_BUDGET
+    assert result["seconds"] <= SECONDS_BUDGET
+
+
+def test_import__deferred() -> None:
+    modules = import_progrow()["modules"]
+    deferred = [
+        "asyncio",
+        "colorama",
+        "progrow.version",
+        "selectors",
+        "shutil",
+        "socket",
+    ]
+    for name in deferred:
+        assert name not in modules
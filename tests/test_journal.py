@@ -0,0 +1,45 @@
+from io import BytesIO
+
+from pytest import raises
+
+from progrow.columnar_rows import ColumnarRows
+from progrow.journal import Journal
+from progrow.rows import Rows
+
+
+def test_watch() -> None:
+    rows = Rows()
+    rows.append("foo", current=0, maximum=2)
+    stream = BytesIO()
+    ticks = iter([1.0, 2.0, 3.5])
+    journal = Journal(stream, clock=lambda: next(ticks))
+    journal.watch(rows)
+    rows.append("bär", current=1, maximum=4)
+    rows.rows[0].advance(0.5)
+    journal.flush()
+
+    assert stream.getvalue().decode("utf-8").split("\n") == [
+        '[1.0, "foo", 0, 2]',
+        '[2.0, "bär", 1, 4]',
+        '[3.5, "foo", 0.5, 2]',
+        "",
+    ]
+    assert journal.entries == 3
+
+
+def test_watch__columnar() -> None:
+    with raises(TypeError) as ex:
+        Journal(BytesIO()).watch(ColumnarRows())
+    assert str(ex.value) == "ColumnarRows do not report changes to watch"
+
+
+def test_read() -> None:
+    stream = BytesIO(
+        b'[1.0, "foo", 0, 2]\n'
+        + b"\n"
+        + b"[1]\n"
+        + b"7\n"
+        + b'[2.0, "foo", 1, 2]\n'
+        + b'[3.0, "fo'
+    )
+    assert list(Journal.read(stream)) == [(1.0, "foo", 0, 2), (2.0, "foo", 1, 2)]
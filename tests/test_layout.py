@@ -1,8 +1,9 @@
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 from pytest import mark
 
 from progrow.layout import Layout
+from progrow.style import Style
 
 
 def test_init__left_fraction_length_empty() -> None:
@@ -87,3 +88,40 @@ def test_consider_right_fraction(
     for consideration in considerations:
         layout.consider_right_fraction(consideration)
     assert layout.right_fraction_length == expect
+
+
+def test_slots() -> None:
+    assert not hasattr(Layout(), "__dict__")
+    assert not hasattr(Layout().freeze(), "__dict__")
+
+
+@mark.parametrize(
+    "style, expect",
+    [
+        (Style(), (None, 4, None, None)),
+        (Style(name_suffix=": ", show_fraction=True), (2, 5, None, 3)),
+        (Style(show_percent=True), (None, 4, 6, None)),
+        (Style(show_fraction=True, show_percent=True), (2, 4, 8, 3)),
+        (Style(show_rate=True, show_eta=True), (None, 4, None, None, 8, 15)),
+    ],
+)
+def test_from_widths(
+    style: Style,
+    expect: Tuple[Optional[int], ...],
+) -> None:
+    layout = Layout.from_widths(
+        style,
+        name=3,
+        left_fraction=2,
+        right_fraction=3,
+        percent=5,
+    )
+    lengths = (
+        layout.left_fraction_length,
+        layout.name_length,
+        layout.percent_length,
+        layout.right_fraction_length,
+        layout.rate_length,
+        layout.eta_length,
+    )
+    assert lengths[: len(expect)] == expect
@@ -0,0 +1,188 @@
+import os
+import re
+import signal
+from io import StringIO
+from random import Random
+from typing import List
+
+from pytest import MonkeyPatch, mark
+
+from progrow import live_renderer
+from progrow.live_renderer import LiveRenderer
+from progrow.row import Row
+from progrow.rows import Rows
+from progrow.style import Style
+from progrow.terminal_width import TerminalWidth
+from progrow.viewport import Viewport
+
+escape = re.compile(r"\x1b\[(\d*)([ABJK])")
+
+
+def play(output: str) -> List[str]:
+    """ Plays `output` on a minimal virtual terminal and returns its lines. """
+
+    screen = [""]
+    row = 0
+    col = 0
+    index = 0
+
+    while index < len(output):
+        match = escape.match(output, index)
+        if match:
+            count = int(match.group(1) or 1)
+            code = match.group(2)
+            if code == "A":
+                row -= count
+            elif code == "B":
+                row += count
+            elif code == "J":
+                screen[row] = screen[row][:col]
+                del screen[row + 1 :]
+            else:
+                screen[row] = screen[row][:col]
+            assert 0 <= row < len(screen)
+            index = match.end()
+            continue
+
+        char = output[index]
+        if char == "\r":
+            col = 0
+        elif char == "\n":
+            row += 1
+            col = 0
+            if row == len(screen):
+                screen.append("")
+        else:
+            line = screen[row].ljust(col)
+            screen[row] = line[:col] + char + line[col + 1 :]
+            col += 1
+        index += 1
+
+    assert col == 0
+    assert row == len(screen) - 1
+    return screen[:-1]
+
+
+@mark.parametrize(
+    "previous, lines, expect",
+    [
+        ([], ["a", "b"], "a\nb\n"),
+        (["a", "b"], ["a", "b"], ""),
+        (["a", "b"], ["a", "c"], "\x1b[1A\rc\x1b[K\x1b[1B\r"),
+        (["a", "b"], ["c", "b"], "\x1b[2A\rc\x1b[K\x1b[2B\r"),
+        (["a", "b"], ["a", "b", "c"], "c\n"),
+        (["a", "b"], ["a"], "\x1b[1A\x1b[J"),
+    ],
+)
+def test_render_frame(previous: List[str], lines: List[str], expect: str) -> None:
+    renderer = LiveRenderer(Rows([]))
+    renderer.lines = previous
+    assert renderer.render_frame(lines) == expect
+    assert renderer.lines == lines
+
+
+def test_render_frame__replay() -> None:
+    random = Random(0)
+    renderer = LiveRenderer(Rows([]))
+    output = ""
+    for _ in range(500):
+        height = random.randint(0, 6)
+        lines = [random.choice(["a", "bb", "ccc", ""]) for _ in range(height)]
+        output += renderer.render_frame(lines)
+        assert play(output) == lines
+
+
+def test_render() -> None:
+    stream = StringIO()
+    rows = Rows([Row("foo", current=1, maximum=2), Row("bar", current=0, maximum=2)])
+    renderer = LiveRenderer(rows, stream=stream, style=Style(color=False, width=8))
+
+    renderer.render()
+    assert stream.getvalue() == "foo ██\nbar\n"
+
+    renderer.render()
+    assert stream.getvalue() == "foo ██\nbar\n"
+
+    rows.rows[1].current = 2
+    renderer.render()
+    assert play(stream.getvalue()) == ["foo ██", "bar ████"]
+    assert stream.getvalue().endswith("\x1b[1A\rbar ████\x1b[K\x1b[1B\r")
+
+
+def test_render__viewport() -> None:
+    stream = StringIO()
+    rows = Rows([Row("foo", current=1, maximum=2), Row("bar", current=0, maximum=2)])
+    viewport = Viewport(rows, height=1)
+    renderer = LiveRenderer(viewport, stream=stream, style=Style(color=False, width=8))
+
+    renderer.render()
+    viewport.scroll(1)
+    renderer.render()
+    assert play(stream.getvalue()) == ["bar"]
+
+
+def test_render__taller_than_terminal() -> None:
+    stream = StringIO()
+    rows = Rows([Row(str(index), current=0, maximum=2) for index in range(6)])
+    style = Style(color=False, width=6)
+    renderer = LiveRenderer(rows, stream=stream, style=style, height=3)
+
+    renderer.render()
+    rows.rows[5].current = 2
+    renderer.render()
+    rows.rows[0].current = 2
+    renderer.render()
+
+    assert play(stream.getvalue()) == ["0 ████", "1", "2"]
+    moves = [int(count) for count, _ in escape.findall(stream.getvalue()) if count]
+    assert max(moves) <= 3
+
+
+class Terminal(StringIO):
+    def fileno(self) -> int:
+        return 1
+
+
+def test_render_frame__terminal_height(monkeypatch: MonkeyPatch) -> None:
+    sizes: List[int] = []
+
+    def get_terminal_size(fd: int) -> os.terminal_size:
+        sizes.append(fd)
+        return os.terminal_size((80, 3))
+
+    monkeypatch.setattr(live_renderer, "get_terminal_size", get_terminal_size)
+    renderer = LiveRenderer(Rows(), stream=Terminal())
+    renderer.render_frame(["a", "b", "c", "d"])
+    assert renderer.lines == ["a", "b"]
+    assert sizes == [1]
+
+
+def test_render_frame__not_terminal() -> None:
+    renderer = LiveRenderer(Rows(), stream=StringIO())
+    lines = [str(index) for index in range(1000)]
+    renderer.render_frame(lines)
+    assert renderer.lines == lines
+
+
+def test_forget() -> None:
+    stream = StringIO()
+    rows = Rows([Row("foo", current=1, maximum=2)])
+    renderer = LiveRenderer(rows, stream=stream, style=Style(color=False, width=8))
+    renderer.render()
+    renderer.forget()
+    renderer.render()
+    assert stream.getvalue() == "foo ██\nfoo ██\n"
+
+
+@mark.skipif(not hasattr(signal, "SIGWINCH"), reason="SIGWINCH not supported")
+def test_init__watches_terminal_width(monkeypatch: MonkeyPatch) -> None:
+    sigwinch = getattr(signal, "SIGWINCH")
+    previous = signal.getsignal(sigwinch)
+    width = TerminalWidth()
+    monkeypatch.setattr(live_renderer, "terminal_width", width)
+
+    try:
+        LiveRenderer(Rows(), stream=StringIO())
+        assert width.watching
+    finally:
+        signal.signal(sigwinch, previous)
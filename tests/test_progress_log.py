@@ -0,0 +1,166 @@
+import sys
+from io import StringIO
+from typing import List
+
+from pytest import MonkeyPatch, mark, raises
+
+from progrow.columnar_rows import ColumnarRows
+from progrow.live_renderer import LiveRenderer
+from progrow.progress_log import ProgressLog, progress_output
+from progrow.rate_estimator import RateEstimator
+from progrow.row import Row
+from progrow.rows import Rows
+from progrow.tree_rows import TreeRows
+from tests.conftest import Clock
+
+
+def lines(stream: StringIO) -> List[str]:
+    return stream.getvalue().splitlines()
+
+
+def test_append__logged_after_first_step() -> None:
+    rows = Rows()
+    stream = StringIO()
+    log = ProgressLog(rows, stream=stream, step=50)
+    rows.append("foo", current=0, maximum=10)
+    assert lines(stream) == []
+    rows.rows[0].current = 5
+    assert lines(stream) == ["foo 5 / 10 (50%)"]
+    assert log.lines == 1
+
+
+def test_existing_rows__not_logged() -> None:
+    rows = Rows()
+    rows.append("foo", current=3, maximum=10)
+    stream = StringIO()
+    ProgressLog(rows, stream=stream)
+    assert lines(stream) == []
+
+
+@mark.parametrize(
+    "step, expect",
+    [
+        (10, ["foo 1 / 10 (10%)", "foo 2 / 10 (20%)", "foo 3 / 10 (30%)"]),
+        (25, ["foo 3 / 10 (30%)"]),
+        (50, []),
+    ],
+)
+def test_step(step: float, expect: List[str]) -> None:
+    rows = Rows()
+    rows.append("foo", current=0, maximum=10)
+    stream = StringIO()
+    ProgressLog(rows, stream=stream, step=step)
+    for _ in range(3):
+        rows.rows[0].advance(1)
+    assert lines(stream) == expect
+
+
+def test_step__within_step_not_logged() -> None:
+    rows = Rows()
+    rows.append("foo", current=0, maximum=1_000)
+    stream = StringIO()
+    ProgressLog(rows, stream=stream)
+    for _ in range(99):
+        rows.rows[0].advance(1)
+    assert lines(stream) == []
+    rows.rows[0].advance(1)
+    assert lines(stream) == ["foo 100 / 1,000 (10%)"]
+
+
+@mark.parametrize("step", [0, -1, 101])
+def test_step__invalid(step: float) -> None:
+    with raises(ValueError) as ex:
+        ProgressLog(Rows(), step=step)
+    assert str(ex.value) == f"step must be between 0 and 100, not {step}"
+
+
+def test_interval(clock: Clock) -> None:
+    rows = Rows()
+    rows.append("foo", current=0, maximum=1_000)
+    stream = StringIO()
+    ProgressLog(rows, stream=stream, interval=60, clock=clock)
+
+    clock.now = 30
+    rows.rows[0].advance(1)
+    assert lines(stream) == []
+
+    clock.now = 60
+    rows.rows[0].advance(1)
+    assert lines(stream) == ["foo 2 / 1,000 (0%)"]
+
+    clock.now = 90
+    rows.rows[0].advance(1)
+    assert lines(stream) == ["foo 2 / 1,000 (0%)"]
+
+
+def test_format__rate(clock: Clock) -> None:
+    row = Row("foo", current=0, maximum=100)
+    row.rate_estimator = RateEstimator(clock=clock)
+    row.rate_estimator.update(0)
+    clock.now = 1
+    row.current = 10
+    log = ProgressLog(Rows())
+    assert log.format(row) == "foo 10 / 100 (10%) 10.0/s ETA 0:09"
+
+
+def test_poll__columnar() -> None:
+    rows = ColumnarRows(["foo", "bar"], [0, 0], [10, 10])
+    stream = StringIO()
+    log = ProgressLog(rows, stream=stream, step=50)
+    rows.row(1).current = 6
+    assert lines(stream) == []
+    log.poll()
+    assert lines(stream) == ["bar 6 / 10 (60%)"]
+    log.poll()
+    assert lines(stream) == ["bar 6 / 10 (60%)"]
+
+
+def test_tree__empty_parent() -> None:
+    rows = TreeRows(total="total")
+    stream = StringIO()
+    ProgressLog(rows, stream=stream, step=50)
+    parent = rows.add("job")
+    rows.add("stage", current=0, maximum=4, parent=parent).advance(2)
+    assert lines(stream) == [
+        "stage 2 / 4 (50%)",
+        "job 2 / 4 (50%)",
+        "total 2 / 4 (50%)",
+    ]
+
+
+def test_redirected_stdout(monkeypatch: MonkeyPatch) -> None:
+    rows = Rows()
+    rows.append("foo", current=0, maximum=10)
+    ProgressLog(rows, step=50)
+    stream = StringIO()
+    monkeypatch.setattr(sys, "stdout", stream)
+    rows.rows[0].current = 5
+    assert lines(stream) == ["foo 5 / 10 (50%)"]
+
+
+class Terminal(StringIO):
+    def isatty(self) -> bool:
+        return True
+
+
+def test_progress_output__terminal() -> None:
+    rows = Rows()
+    stream = Terminal()
+    output = progress_output(rows, stream=stream)
+    assert isinstance(output, LiveRenderer)
+    assert output.stream is stream
+
+
+def test_progress_output__not_terminal() -> None:
+    rows = Rows()
+    stream = StringIO()
+    output = progress_output(rows, stream=stream, step=50, interval=60)
+    assert isinstance(output, ProgressLog)
+    assert output.stream is stream
+    assert output.step == 50
+    assert output.interval == 60
+
+
+def test_progress_output__stdout(monkeypatch: MonkeyPatch) -> None:
+    monkeypatch.setattr(sys, "stdout", StringIO())
+    assert isinstance(progress_output(Rows()), ProgressLog)
@@ -0,0 +1,39 @@
+from pytest import mark, raises
+
+from progrow.progress_packets import HEADER, decode_body, encode_packet
+
+
+def test_round_trip() -> None:
+    updates = [("foo", 1, 2), ("bär", 1.5, 3), ("", 0, 0)]
+    packet = encode_packet(updates)
+    (length,) = HEADER.unpack_from(packet)
+    assert length == len(packet) - HEADER.size
+    decoded = decode_body(packet[HEADER.size :])
+    assert decoded == updates
+    assert [type(update[1]) for update in decoded] == [int, float, int]
+
+
+def test_encode_packet__empty() -> None:
+    assert encode_packet([]) == HEADER.pack(0)
+
+
+def test_encode_packet__long_name() -> None:
+    with raises(ValueError) as ex:
+        encode_packet([("x" * 65536, 1, 2)])
+    assert str(ex.value) == "name is too long to send: 65536 bytes"
+
+
+@mark.parametrize(
+    "body, expect",
+    [
+        (b"\x00" * 10, "packet ends part-way through an update"),
+        (
+            encode_packet([("foo", 1, 2)])[HEADER.size : -1],
+            "packet ends part-way through a name",
+        ),
+    ],
+)
+def test_decode_body__malformed(body: bytes, expect: str) -> None:
+    with raises(ValueError) as ex:
+        decode_body(body)
+    assert str(ex.value) == expect
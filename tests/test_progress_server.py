@@ -0,0 +1,166 @@
+from io import StringIO
+from pathlib import Path
+from socket import AF_UNIX, SOCK_STREAM, socket
+from threading import Thread
+from time import monotonic, sleep
+from typing import Callable, List
+
+from pytest import raises
+
+from progrow.live_renderer import LiveRenderer
+from progrow.progress_client import ProgressClient
+from progrow.progress_packets import HEADER, encode_packet
+from progrow.progress_server import ProgressServer
+from progrow.row import Row
+from progrow.rows import Rows
+from progrow.style import Style
+
+
+def wait_for(condition: Callable[[], bool]) -> None:
+    deadline = monotonic() + 5
+    while not condition():
+        assert monotonic() < deadline
+        sleep(0.01)
+
+
+def values(rows: List[Row]) -> List[str]:
+    return [f"{row.name} {row.current}/{row.maximum}" for row in rows]
+
+
+def make_server(path: Path, stream: StringIO) -> ProgressServer:
+    rows = Rows()
+    renderer = LiveRenderer(rows, stream=stream, style=Style(color=False, width=12))
+    return ProgressServer(str(path), rows=rows, renderer=renderer)
+
+
+def test_apply() -> None:
+    server = ProgressServer("unused")
+    server.apply([("foo", 1, 4), ("bar", 2, 4)])
+    server.apply([("bar", 3, 5), ("baz", 0, 1), ("foo", 2, 4)])
+    assert values(server.rows.rows) == ["foo 2/4", "bar 3/5", "baz 0/1"]
+    assert server.packets == 2
+    assert server.updates == 5
+
+
+def test_clients(tmp_path: Path) -> None:
+    path = tmp_path / "progress.sock"
+    stream = StringIO()
+
+    with make_server(path, stream) as server:
+        with ProgressClient(str(path)) as first, ProgressClient(str(path)) as second:
+            first.update("foo", 0, 4)
+            second.update("bar", 1, 2)
+            for _ in range(4):
+                first.advance("foo")
+
+        wait_for(lambda: server.packets == 3)
+
+    assert values(server.rows.rows) == ["foo 4/4", "bar 1/2"]
+    assert server.scheduler.renderer.lines == ["foo ████████", "bar ████"]
+    assert stream.getvalue()
+    assert not path.exists()
+
+
+def test_client__coalesces(tmp_path: Path) -> None:
+    path = tmp_path / "progress.sock"
+    now = [0.0]
+
+    with make_server(path, StringIO()) as server:
+        with ProgressClient(str(path), interval=1, clock=lambda: now[0]) as client:
+            client.update("foo", 0, 100)
+            for _ in range(99):
+                client.advance("foo")
+            assert client.packets == 1
+
+            now[0] = 1
+            client.advance("foo")
+            assert client.packets == 2
+
+        wait_for(lambda: server.packets == 2)
+
+    assert values(server.rows.rows) == ["foo 100/100"]
+
+
+def test_client__server_stopped(tmp_path: Path) -> None:
+    path = tmp_path / "progress.sock"
+
+    with ProgressClient(str(path)) as client:
+        client.update("foo", 1, 4)
+        assert client.errors == 1
+        assert client.packets == 0
+
+        with make_server(path, StringIO()) as server:
+            client.flush()
+            assert client.packets == 1
+            wait_for(lambda: server.packets == 1)
+
+        client.update("foo", 2, 4)
+        client.flush()
+        assert client.errors >= 2
+
+    assert values(server.rows.rows) == ["foo 1/4"]
+
+
+def test_client__advance_threads(tmp_path: Path) -> None:
+    path = tmp_path / "progress.sock"
+
+    with make_server(path, StringIO()) as server:
+        with ProgressClient(str(path), interval=0) as client:
+            client.update("foo", 0, 4000)
+
+            def work() -> None:
+                for _ in range(1000):
+                    client.advance("foo")
+
+            threads = [Thread(target=work) for _ in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        wait_for(lambda: server.rows["foo"].current == 4000)
+
+
+def test_listen__stale_socket(tmp_path: Path) -> None:
+    path = tmp_path / "progress.sock"
+    with socket(AF_UNIX, SOCK_STREAM) as stale:
+        stale.bind(str(path))
+
+    with make_server(path, StringIO()) as server:
+        with ProgressClient(str(path)) as client:
+            client.update("foo", 1, 2)
+        wait_for(lambda: server.packets == 1)
+
+    assert not path.exists()
+
+
+def test_listen__server_running(tmp_path: Path) -> None:
+    path = tmp_path / "progress.sock"
+
+    with make_server(path, StringIO()):
+        with raises(OSError):
+            make_server(path, StringIO()).listen()
+        assert path.exists()
+
+
+def test_listen__not_socket(tmp_path: Path) -> None:
+    path = tmp_path / "progress.sock"
+    path.write_text("keep")
+
+    with raises(OSError):
+        make_server(path, StringIO()).listen()
+    assert path.read_text() == "keep"
+
+
+def test_malformed(tmp_path: Path) -> None:
+    path = tmp_path / "progress.sock"
+
+    with make_server(path, StringIO()) as server:
+        with socket(AF_UNIX, SOCK_STREAM) as client:
+            client.connect(str(path))
+            client.sendall(encode_packet([("foo", 1, 2)]))
+            client.sendall(HEADER.pack(3) + b"bad")
+            wait_for(lambda: client.recv(1) == b"")
+
+    assert server.packets == 1
+    assert values(server.rows.rows) == ["foo 1/2"]
@@ -0,0 +1,75 @@
+from math import isclose
+
+from pytest import raises
+
+from progrow.rate_estimator import RateEstimator
+from tests.conftest import Clock
+
+
+def test_init__half_life() -> None:
+    with raises(ValueError) as ex:
+        RateEstimator(half_life=0)
+    assert str(ex.value) == "half_life must be positive, not 0"
+
+
+def test_rate__empty() -> None:
+    assert RateEstimator().rate() is None
+
+
+def test_rate__single_update(clock: Clock) -> None:
+    estimator = RateEstimator(clock=clock)
+    estimator.update(5)
+    assert estimator.rate() is None
+    clock.now = 1
+    assert estimator.rate() == 0
+
+
+def test_rate__steady(clock: Clock) -> None:
+    estimator = RateEstimator(half_life=2, clock=clock)
+
+    for second in range(100):
+        clock.now = second
+        estimator.update(second * 3)
+
+    rate = estimator.rate()
+    assert rate is not None
+    assert isclose(rate, 3)
+
+
+def test_rate__stalled(clock: Clock) -> None:
+    estimator = RateEstimator(half_life=2, clock=clock)
+
+    for second in range(100):
+        clock.now = second
+        estimator.update(second * 3)
+
+    clock.now = 101
+    stalled = estimator.rate()
+    assert stalled is not None
+    assert isclose(stalled, 1.5)
+
+
+def test_rate__same_tick(clock: Clock) -> None:
+    folded = RateEstimator(half_life=2, clock=clock)
+    skipped = RateEstimator(half_life=2, clock=clock)
+
+    folded.update(0)
+    skipped.update(0)
+    clock.now = 1
+    folded.update(1)
+    skipped.update(1)
+    folded.update(2)
+    clock.now = 2
+    folded.update(4)
+    skipped.update(4)
+
+    assert folded.rate() == skipped.rate()
+
+
+def test_state__constant_size(clock: Clock) -> None:
+    estimator = RateEstimator(clock=clock)
+    for second in range(1_000):
+        clock.now = second
+        estimator.update(second)
+    assert estimator.state is not None
+    assert len(estimator.state) == 4
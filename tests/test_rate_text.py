@@ -0,0 +1,48 @@
+from typing import Optional
+
+from pytest import mark
+
+from progrow.rate_text import ETA_LENGTH, RATE_LENGTH, format_eta, format_rate
+
+
+@mark.parametrize(
+    "seconds, expect",
+    [
+        (None, "ETA -"),
+        (float("inf"), "ETA -"),
+        (0, "ETA 0:00"),
+        (5.4, "ETA 0:05"),
+        (65, "ETA 1:05"),
+        (3599.6, "ETA 1:00:00"),
+        (7265, "ETA 2:01:05"),
+        (359999, "ETA 99:59:59"),
+        (360000, "ETA >99h"),
+    ],
+)
+def test_format_eta(seconds: Optional[float], expect: str) -> None:
+    assert format_eta(seconds) == expect
+    assert len(format_eta(seconds)) <= ETA_LENGTH
+
+
+@mark.parametrize(
+    "rate, expect",
+    [
+        (None, "-/s"),
+        (float("nan"), "-/s"),
+        (-3.2, "0.0/s"),
+        (0, "0.0/s"),
+        (0.5, "0.5/s"),
+        (12.34, "12.3/s"),
+        (99.94, "99.9/s"),
+        (99.96, "100/s"),
+        (999.4, "999/s"),
+        (999.6, "1.0k/s"),
+        (99_949, "99.9k/s"),
+        (99_951, "100k/s"),
+        (999_999, "1.0M/s"),
+        (1e18, "1000P/s"),
+    ],
+)
+def test_format_rate(rate: Optional[float], expect: str) -> None:
+    assert format_rate(rate) == expect
+    assert len(format_rate(rate)) <= RATE_LENGTH
@@ -0,0 +1,69 @@
+from io import StringIO
+from time import sleep
+from typing import List
+
+from pytest import raises
+
+from progrow.live_renderer import LiveRenderer
+from progrow.refresh_scheduler import RefreshScheduler
+from progrow.row import Row
+from progrow.rows import Rows
+from progrow.style import Style
+from tests.conftest import Clock
+
+
+def make_scheduler(clock: Clock) -> RefreshScheduler:
+    rows = Rows([Row("foo", current=0, maximum=100)])
+    renderer = LiveRenderer(rows, StringIO(), Style(color=False, width=20))
+    return RefreshScheduler(rows, renderer=renderer, fps=10, clock=clock)
+
+
+def test_init__invalid_fps() -> None:
+    with raises(ValueError):
+        RefreshScheduler(Rows([]), fps=0)
+
+
+def test_update__coalesces(clock: Clock) -> None:
+    scheduler = make_scheduler(clock)
+    row = scheduler.rows.rows[0]
+
+    for current in range(100):
+        scheduler.update(row, current)
+
+    assert scheduler.frames == 1
+    assert scheduler.pending
+    assert row.current == 99
+
+    clock.now = 0.05
+    assert not scheduler.tick()
+
+    clock.now = 0.1
+    assert scheduler.tick()
+    assert scheduler.frames == 2
+    assert not scheduler.pending
+
+    clock.now = 1.0
+    assert not scheduler.tick()
+
+
+def test_close__forces_final_frame(clock: Clock) -> None:
+    scheduler = make_scheduler(clock)
+    scheduler.close()
+    assert scheduler.frames == 1
+
+
+def test_context__renders_pending() -> None:
+    rows = Rows([Row("foo", current=0, maximum=100)])
+    stream = StringIO()
+    renderer = LiveRenderer(rows, stream, Style(color=False, width=20))
+    frames: List[int] = []
+
+    with RefreshScheduler(rows, renderer=renderer, fps=100) as scheduler:
+        for current in range(1, 101):
+            scheduler.update(rows.rows[0], current)
+        sleep(0.1)
+        frames.append(scheduler.frames)
+
+    assert frames[0] >= 1
+    assert scheduler.frames > frames[0]
+    assert renderer.lines == ["foo ████████████████"]
@@ -0,0 +1,119 @@
+from typing import Iterator
+
+from pytest import raises
+
+from progrow.frozen_layout import FrozenLayout
+from progrow.frozen_style import FrozenStyle
+from progrow.rate_estimator import RateEstimator
+from progrow.render_cache import RenderCache
+from progrow.row import Row
+
+layout = FrozenLayout(name_length=6)
+style = FrozenStyle(color=False, show_fraction=True, width=20)
+
+
+def test_clear() -> None:
+    cache = RenderCache()
+    cache.render(Row("foo", 1, 2), layout, style)
+    cache.render(Row("foo", 1, 2), layout, style)
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.hits == 0
+    assert cache.misses == 0
+
+
+def test_init__maxsize() -> None:
+    with raises(ValueError) as ex:
+        RenderCache(maxsize=0)
+    assert str(ex.value) == "maxsize must be positive, not 0"
+
+
+def test_render() -> None:
+    cache = RenderCache()
+    row = Row("foo", 1, 2)
+
+    expect = row.render(layout, style)
+    assert cache.render(row, layout, style) == expect
+    assert cache.render(Row("foo", 1, 2), layout, style) == expect
+    assert cache.hits == 1
+    assert cache.misses == 1
+
+
+def test_render__changed() -> None:
+    cache = RenderCache()
+    row = Row("foo", 1, 2)
+    cache.render(row, layout, style)
+    row.current = 2
+    assert cache.render(row, layout, style) == row.render(layout, style)
+    assert cache.misses == 2
+
+
+def test_render__layout_and_style() -> None:
+    cache = RenderCache()
+    row = Row("foo", 1, 2)
+    cache.render(row, layout, style)
+    cache.render(row, FrozenLayout(name_length=8), style)
+    cache.render(row, layout, FrozenStyle(color=False, width=20))
+    assert cache.hits == 0
+    assert cache.misses == 3
+
+
+def test_render__lru() -> None:
+    cache = RenderCache(maxsize=2)
+    a = Row("a", 1, 2)
+    b = Row("b", 1, 2)
+    c = Row("c", 1, 2)
+
+    cache.render(a, layout, style)
+    cache.render(b, layout, style)
+    cache.render(a, layout, style)
+    cache.render(c, layout, style)
+    assert len(cache) == 2
+
+    cache.render(a, layout, style)
+    assert cache.hits == 2
+    cache.render(b, layout, style)
+    assert cache.misses == 4
+
+
+def test_render__types() -> None:
+    cache = RenderCache()
+    assert cache.render(Row("foo", 1, 2), layout, style).endswith("1 / 2")
+    assert cache.render(Row("foo", 1.0, 2), layout, style).endswith("1.0 / 2")
+    assert cache.hits == 0
+
+
+def test_render__rate() -> None:
+    now = [0.0]
+    cache = RenderCache()
+    row = Row("foo", 0, 100)
+    row.rate_estimator = RateEstimator(half_life=1, clock=lambda: now[0])
+    row.rate_estimator.update(0)
+    now[0] = 1
+    row.advance(10)
+    rate_style = FrozenStyle(color=False, show_rate=True, width=30)
+
+    first = cache.render(row, layout, rate_style)
+    assert cache.render(row, layout, rate_style) == first
+
+    now[0] = 5
+    assert cache.render(row, layout, rate_style) == row.render(layout, rate_style)
+    assert cache.hits == 1
+    assert cache.misses == 2
+
+
+def test_render_many__reused_row() -> None:
+    cache = RenderCache()
+    sources = [Row("foo", 1, 2), Row("bar", 2, 2), Row("foo", 1, 2)]
+    expect = [row.render(layout, style) for row in sources]
+    copy = Row("", 0, 0)
+
+    def copies() -> Iterator[Row]:
+        for row in sources:
+            copy.copy_from(row)
+            yield copy
+
+    assert list(cache.render_many(copies(), layout, style)) == expect
+    assert list(cache.render_many(copies(), layout, style)) == expect
+    assert cache.hits == 4
+    assert cache.misses == 2
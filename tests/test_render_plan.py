@@ -0,0 +1,63 @@
+from itertools import product
+
+from pytest import mark
+
+from progrow.layout import Layout
+from progrow.rate_estimator import RateEstimator
+from progrow.render_plan import RenderPlan
+from progrow.row import Row
+from progrow.style import Style
+
+
+def make_row(name: str, current: float, maximum: float, rated: bool) -> Row:
+    row = Row(name, current=current, maximum=maximum)
+    if rated:
+        ticks = [0.0]
+        row.rate_estimator = RateEstimator(clock=lambda: ticks[0])
+        row.rate_estimator.update(0)
+        ticks[0] = 2.0
+        row.rate_estimator.update(current)
+    return row
+
+
+rows = [
+    make_row("foo", 0, 10, False),
+    make_row("apple harvest", 3, 7, True),
+    make_row("a much longer name than fits", 1_234.5, 56_789, True),
+    make_row("done", 100, 100, False),
+]
+
+layouts = [
+    Layout(),
+    Layout(name_length=8),
+    Layout(name_length=4),
+    Layout(name_length=14, left_fraction_length=2, right_fraction_length=2),
+    Layout(name_length=30, left_fraction_length=8, right_fraction_length=6),
+    Layout(name_length=5, percent_length=2, rate_length=3, eta_length=5),
+    Layout(percent_length=6, rate_length=9, eta_length=14),
+]
+
+toggles = [False, True]
+
+styles = [
+    Style(
+        color=color,
+        name_suffix=suffix,
+        show_fraction=fraction,
+        show_percent=percent,
+        show_rate=rate,
+        show_eta=eta,
+        width=width,
+    )
+    for color, suffix, fraction, percent, rate, eta, width in product(
+        toggles, [" ", ": ", ""], toggles, toggles, toggles, toggles, [10, 60]
+    )
+]
+
+
+@mark.parametrize("layout", layouts)
+def test_render(layout: Layout) -> None:
+    for style in styles:
+        plan = RenderPlan(layout, style)
+        for row in rows:
+            assert plan.render(row) == row.render(layout, style)
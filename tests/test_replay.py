@@ -0,0 +1,68 @@
+from io import BytesIO, StringIO
+from pathlib import Path
+
+from pytest import CaptureFixture, mark, raises
+
+from progrow.live_renderer import LiveRenderer
+from progrow.replay import Replay, main
+from progrow.rows import Rows
+from progrow.style import Style
+from tests.conftest import Clock
+
+JOURNAL = (
+    b'[100.0, "foo", 0, 4]\n'
+    + b'[101.0, "bar", 1, 2]\n'
+    + b'[102.0, "foo", 2, 4]\n'
+    + b'[104.0, "foo", 4, 8]\n'
+)
+
+
+def replay(speed: float, clock: Clock) -> Replay:
+    rows = Rows()
+    renderer = LiveRenderer(rows, StringIO(), Style(color=False, width=12))
+    result = Replay(
+        BytesIO(JOURNAL),
+        rows,
+        renderer,
+        speed=speed,
+        fps=1,
+        clock=clock,
+        sleep=clock.sleep,
+    )
+    result.run()
+    return result
+
+
+@mark.parametrize(
+    "speed, elapsed",
+    [
+        (0, 0),
+        (1, 4),
+        (4, 1),
+    ],
+)
+def test_run(speed: float, elapsed: float, clock: Clock) -> None:
+    result = replay(speed, clock)
+    assert clock.now == elapsed
+    assert result.rows["foo"].current == 4
+    assert result.rows["foo"].maximum == 8
+    assert result.scheduler.renderer.lines == ["foo ████", "bar ████"]
+
+
+def test_run__renders_while_waiting(clock: Clock) -> None:
+    result = replay(1, clock)
+    assert clock.sleeps == [1, 1, 2]
+    assert result.scheduler.frames == 5
+
+
+def test_speed__negative() -> None:
+    with raises(ValueError) as ex:
+        Replay(BytesIO(), speed=-1)
+    assert str(ex.value) == "speed must not be negative, not -1"
+
+
+def test_main(tmp_path: Path, capfd: CaptureFixture[str]) -> None:
+    path = tmp_path / "journal.jsonl"
+    path.write_bytes(JOURNAL)
+    assert main([str(path), "--speed", "0", "--fraction", "--no-color"]) == 0
+    assert "4 / 8" in capfd.readouterr().out
@@ -1,16 +1,21 @@
-from typing import Optional, Tuple
+from math import isclose
+from typing import List, Optional, Tuple
 
 from pytest import mark
 
 from progrow.layout import Layout
+from progrow.rate_estimator import RateEstimator
 from progrow.row import Row
 from progrow.style import Style
+from tests.conftest import Clock
 
 fraction_part_test_cases = [
     (0, False, None, ("0", 1)),
     (1, False, None, ("1", 1)),
     (1.2, False, None, ("1.2", 3)),
     (-3.4, False, None, ("-3.4", 4)),
+    (1.2, True, None, ("\x1b[94m1.2\x1b[39m", 3)),
+    (1.2, True, 5, ("\x1b[94m  1.2\x1b[39m", 5)),
 ]
 
 
@@ -188,6 +193,8 @@ def test_render_name(
         (9, 11, False, "", None, ("81%", 3)),
         (10, 11, False, "", None, ("90%", 3)),
         (11, 11, False, "", None, ("100%", 4)),
+        (1, 11, True, " ", None, (" \x1b[36m9%\x1b[39m", 3)),
+        (1, 11, True, " ", 4, (" \x1b[36m 9%\x1b[39m", 4)),
     ],
 )
 def test_render_percent(
@@ -216,3 +223,172 @@ def test_render_right_fraction(
 ) -> None:
     row = Row("foo", current=value - 1.0, maximum=value)
     assert row.render_right_fraction(color=color, length=length) == expect
+
+
+def test_measure() -> None:
+    row = Row("foo", current=1234, maximum=12345)
+    assert row.measure() == (3, 5, 6, 2)
+
+
+def test_listeners() -> None:
+    changed: List[Row] = []
+    row = Row("foo", current=1, maximum=2)
+    row.add_listener(changed.append)
+    row.current = 2
+    row.maximum = 3
+    row.name = "bar"
+    assert changed == [row, row, row]
+    assert (row.name, row.current, row.maximum) == ("bar", 2, 3)
+
+
+def test_listeners__many() -> None:
+    first: List[Row] = []
+    second: List[Row] = []
+    row = Row("foo", current=1, maximum=2)
+    row.add_listener(first.append)
+    row.add_listener(second.append)
+    row.advance()
+    row.remove_listener(first.append)
+    row.remove_listener(first.append)
+    row.advance()
+    assert first == [row]
+    assert second == [row, row]
+
+
+def test_advance() -> None:
+    changed: List[Row] = []
+    row = Row("foo", current=1, maximum=10)
+    row.add_listener(changed.append)
+    assert row.advance() == 2
+    assert row.advance(2.5) == 4.5
+    assert row.current == 4.5
+    assert changed == [row, row]
+
+
+def test_advance_maximum() -> None:
+    changed: List[Row] = []
+    row = Row("foo", current=1, maximum=10)
+    row.add_listener(changed.append)
+    assert row.advance_maximum(5) == 15
+    assert row.maximum == 15
+    assert changed == [row]
+
+
+def test_copy_from() -> None:
+    changed: List[Row] = []
+    source = Row("foo", current=1, maximum=2)
+    source.rate_estimator = RateEstimator(1.0)
+    copy = Row("", 0, 0)
+    copy.add_listener(changed.append)
+    copy.copy_from(source)
+    assert (copy.name, copy.current, copy.maximum) == ("foo", 1, 2)
+    assert copy.rate_estimator is source.rate_estimator
+    assert changed == []
+
+
+def test_zero_maximum() -> None:
+    row = Row("foo", current=0, maximum=0)
+    assert row.percent == 0.0
+    assert row.measure() == (3, 1, 1, 2)
+
+
+def test_slots() -> None:
+    assert not hasattr(Row("foo", 1, 2), "__dict__")
+
+
+def make_timed_row(clock: Clock) -> Row:
+    row = Row("foo", current=0, maximum=100)
+    row.rate_estimator = RateEstimator(half_life=2, clock=clock)
+    row.rate_estimator.update(0)
+    for second in range(1, 11):
+        clock.now = second
+        row.advance(2)
+    return row
+
+
+def test_eta(clock: Clock) -> None:
+    row = make_timed_row(clock)
+    assert row.eta is not None
+    assert isclose(row.eta, 40)
+
+
+def test_eta__complete() -> None:
+    assert Row("foo", current=3, maximum=3).eta == 0
+
+
+def test_eta__unknown() -> None:
+    assert Row("foo", current=1, maximum=3).eta is None
+
+
+def test_rate(clock: Clock) -> None:
+    row = make_timed_row(clock)
+    assert row.rate is not None
+    assert isclose(row.rate, 2)
+
+
+def test_rate__current_setter(clock: Clock) -> None:
+    row = Row("foo", current=0, maximum=100)
+    row.rate_estimator = RateEstimator(clock=clock)
+    row.current = 0
+    clock.now = 2
+    row.current = 10
+    assert row.rate == 5
+
+
+def test_reset(clock: Clock) -> None:
+    row = make_timed_row(clock)
+    changed: List[Row] = []
+    row.add_listener(changed.append)
+    row.reset(60, 200)
+    assert (row.current, row.maximum) == (60, 200)
+    assert changed == []
+    assert row.rate is None
+
+
+def test_rate__not_estimated() -> None:
+    assert Row("foo", current=1, maximum=3).rate is None
+
+
+@mark.parametrize(
+    "style, expect",
+    [
+        (
+            Style(color=False, show_rate=True, width=30),
+            "foo ████▏                2.0/s",
+        ),
+        (
+            Style(color=False, show_eta=True, width=30),
+            "foo ███▍              ETA 0:40",
+        ),
+        (
+            Style(
+                color=False,
+                show_percent=True,
+                show_rate=True,
+                show_eta=True,
+                width=40,
+            ),
+            "foo ██▋           20% • 2.0/s • ETA 0:40",
+        ),
+        (
+            Style(show_rate=True, width=30),
+            "\x1b[33mfoo\x1b[39m \x1b[32m████▏               \x1b[39m"
+            + " \x1b[35m2.0/s\x1b[39m",
+        ),
+    ],
+)
+def test_render__rate(style: Style, expect: str, clock: Clock) -> None:
+    row = make_timed_row(clock)
+    assert row.render(style=style) == expect
+
+
+def test_render__rate_layout(clock: Clock) -> None:
+    row = make_timed_row(clock)
+    style = Style(color=False, show_rate=True, show_eta=True, width=40)
+    layout = Layout.from_widths(style, name=3)
+    assert row.render(layout, style) == "foo ██▋             2.0/s •     ETA 0:40"
+
+
+def test_snapshot__rate(clock: Clock) -> None:
+    row = make_timed_row(clock)
+    assert row.snapshot().rate == row.rate
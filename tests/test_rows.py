@@ -1,8 +1,13 @@
+from io import StringIO
+from random import Random
+from sys import getswitchinterval, setswitchinterval
+from threading import Event, Thread
 from typing import List
 
-from pytest import mark
+from pytest import mark, raises
 
 from progrow.layout import Layout
+from progrow.render_cache import RenderCache
 from progrow.row import Row
 from progrow.rows import Rows
 from progrow.style import Style
@@ -149,3 +154,381 @@ def test_calculate_layout(rows: Rows, style: Style, expect: Layout) -> None:
 )
 def test_to_string(rows: Rows, style: Style, expect: List[str]) -> None:
     assert rows.render(style) == "\n".join(expect)
+
+
+def expected_layout(rows: Rows, style: Style) -> Layout:
+    layout = Layout()
+    for row in rows.rows:
+        layout.consider_name(row.render_name(False, style.name_suffix).length)
+        layout.consider_left_fraction(row.render_left_fraction(False).length)
+        layout.consider_right_fraction(row.render_right_fraction(False).length)
+        layout.consider_percent(row.render_percent(False, style.percent_prefix).length)
+    return layout
+
+
+def assert_layout(rows: Rows, style: Style) -> None:
+    actual = rows.calculate_layout(style)
+    expect = expected_layout(rows, style)
+    assert actual.name_length == expect.name_length
+    assert actual.left_fraction_length == expect.left_fraction_length
+    assert actual.right_fraction_length == expect.right_fraction_length
+    assert actual.percent_length == expect.percent_length
+
+
+def test_calculate_layout__empty() -> None:
+    layout = Rows().calculate_layout(Style(show_fraction=True, show_percent=True))
+    assert layout.name_length is None
+    assert layout.left_fraction_length is None
+    assert layout.right_fraction_length is None
+    assert layout.percent_length is None
+
+
+def test_calculate_layout__incremental() -> None:
+    random = Random(0)
+    style = Style(show_fraction=True, show_percent=True)
+    rows = Rows()
+
+    for index in range(20):
+        rows.append(f"row-{index}", current=0, maximum=random.randint(1, 10000))
+
+    assert_layout(rows, style)
+
+    for _ in range(500):
+        row = random.choice(rows.rows)
+        change = random.randint(0, 2)
+        if change == 0:
+            row.current = random.randint(0, int(row.maximum))
+        elif change == 1:
+            row.maximum = random.randint(max(1, int(row.current)), 10000)
+        else:
+            row.name = "x" * random.randint(1, 12)
+        assert_layout(rows, style)
+
+
+def test_calculate_layout__shrinks() -> None:
+    style = Style(name_suffix="", show_fraction=True)
+    rows = Rows()
+    rows.append("long-name", current=1000, maximum=1000)
+    rows.append("short", current=1, maximum=10)
+    assert rows.calculate_layout(style).name_length == 9
+
+    rows.rows[0].name = "a"
+    rows.rows[0].current = 1
+    rows.rows[0].maximum = 1
+    layout = rows.calculate_layout(style)
+    assert layout.name_length == 5
+    assert layout.left_fraction_length == 1
+    assert layout.right_fraction_length == 2
+
+
+def test_calculate_layout__list_changed_directly() -> None:
+    style = Style(name_suffix="")
+    rows = Rows()
+    rows.append("foo", current=1, maximum=9)
+    assert rows.calculate_layout(style).name_length == 3
+
+    rows.rows.append(Row("foobar", current=1, maximum=9))
+    assert rows.calculate_layout(style).name_length == 6
+
+    rows.rows.pop()
+    assert rows.calculate_layout(style).name_length == 3
+
+    rows.rows[0].name = "f"
+    assert rows.calculate_layout(style).name_length == 1
+
+
+def test_calculate_layout__row_replaced() -> None:
+    style = Style(name_suffix="")
+    rows = Rows()
+    rows.append("foo", current=1, maximum=9)
+    rows.append("b", current=1, maximum=9)
+    assert rows.calculate_layout(style).name_length == 3
+
+    removed = rows.rows[0]
+    rows.rows[0] = Row("foobar", current=1, maximum=9)
+    assert rows.calculate_layout(style).name_length == 6
+
+    rows.rows[0] = Row("a", current=1, maximum=9)
+    assert rows.calculate_layout(style).name_length == 1
+    assert removed.listeners == ()
+
+
+def test_calculate_layout__shared_row() -> None:
+    style = Style(name_suffix="")
+    row = Row("foo", current=1, maximum=9)
+    first = Rows([row])
+    second = Rows([row])
+    assert first.calculate_layout(style).name_length == 3
+    assert second.calculate_layout(style).name_length == 3
+
+    row.name = "foobar"
+    assert first.calculate_layout(style).name_length == 6
+    assert second.calculate_layout(style).name_length == 6
+
+    second.rows.clear()
+    row.name = "f"
+    assert first.calculate_layout(style).name_length == 1
+    assert second.calculate_layout(style).name_length is None
+
+
+def test_calculate_layout__rewrapped() -> None:
+    style = Style(name_suffix="")
+    rows = make_rows(3)
+    assert rows.calculate_layout(style).name_length == 5
+    assert Rows(list(rows.rows)).calculate_layout(style).name_length == 5
+
+
+def test_init__independent_defaults() -> None:
+    first = Rows()
+    first.append("foo", current=1, maximum=9)
+    assert Rows().rows == []
+
+
+class Writes(StringIO):
+    def __init__(self) -> None:
+        super().__init__()
+        self.writes: List[str] = []
+
+    def write(self, s: str) -> int:
+        self.writes.append(s)
+        return super().write(s)
+
+
+def make_rows(count: int) -> Rows:
+    rows = Rows()
+    for index in range(count):
+        rows.append(f"row-{index}", current=index, maximum=count)
+    return rows
+
+
+def test_iter_render() -> None:
+    rows = make_rows(3)
+    style = Style(color=False, show_fraction=True, width=30)
+    lines = rows.iter_render(style)
+    assert next(lines) == "row-0                    0 / 3"
+    assert list(lines) == rows.render(style).split("\n")[1:]
+
+
+def test_getitem() -> None:
+    rows = Rows([Row("foo", 1, 2)])
+    rows.append("bar", current=1, maximum=2)
+    rows.append("foo", current=2, maximum=2)
+    assert rows["bar"] is rows.rows[1]
+    assert rows["foo"] is rows.rows[0]
+
+
+def test_getitem__missing() -> None:
+    with raises(KeyError):
+        Rows()["foo"]
+
+
+def test_getitem__list_changed_directly() -> None:
+    rows = Rows()
+    rows.append("foo", current=1, maximum=2)
+    row = Row("bar", 1, 2)
+    rows.rows.append(row)
+    assert rows["bar"] is row
+
+
+def test_getitem__row_replaced() -> None:
+    rows = Rows()
+    rows.append("foo", current=1, maximum=2)
+    row = Row("foo", 2, 2)
+    rows.rows[0] = row
+    assert rows["foo"] is row
+
+
+def test_getitem__row_replaced_with_new_name() -> None:
+    rows = Rows()
+    rows.append("foo", current=1, maximum=2)
+    rows.append("bar", current=1, maximum=2)
+    row = Row("baz", 2, 2)
+    rows.rows[0] = row
+    assert rows["baz"] is row
+    with raises(KeyError):
+        rows["foo"]
+
+
+def test_getitem__row_replaced_after_render() -> None:
+    rows = Rows()
+    rows.append("foo", current=1, maximum=2)
+    assert rows["foo"] is rows.rows[0]
+    row = Row("bar", 2, 2)
+    rows.rows[0] = row
+    rows.render()
+    assert rows["bar"] is row
+
+
+def test_getitem__renamed() -> None:
+    rows = Rows()
+    rows.append("foo", current=1, maximum=2)
+    rows.append("foo", current=2, maximum=2)
+    rows.rows[0].name = "bar"
+    assert rows["bar"] is rows.rows[0]
+    assert rows["foo"] is rows.rows[1]
+
+
+def test_len() -> None:
+    rows = Rows()
+    rows.append("foo", current=1, maximum=2)
+    assert len(rows) == 1
+
+
+def test_row() -> None:
+    row = Row("foo", 1, 2)
+    assert Rows([row]).row(0) is row
+
+
+def test_watchers() -> None:
+    rows = Rows()
+    seen: List[str] = []
+    rows.watchers.append(lambda row: seen.append(f"{row.name} {row.current}"))
+    rows.append("foo", current=1, maximum=2)
+    rows.rows[0].advance()
+    assert seen == ["foo 1", "foo 2"]
+
+
+def test_rate_half_life() -> None:
+    rows = Rows([Row("foo", current=1, maximum=2)], rate_half_life=3)
+    rows.append("bar", current=1, maximum=2)
+
+    for row in rows.rows:
+        assert row.rate_estimator
+        assert row.rate_estimator.half_life == 3
+        assert row.rate_estimator.state
+
+
+def test_rate_half_life__not_set() -> None:
+    rows = Rows()
+    rows.append("foo", current=1, maximum=2)
+    assert rows.rows[0].rate_estimator is None
+
+
+def test_render__cache() -> None:
+    cache = RenderCache()
+    rows = Rows(render_cache=cache)
+    rows.append("foo", current=1, maximum=2)
+    rows.append("bar", current=3, maximum=4)
+    style = Style(color=False, show_fraction=True, width=20)
+
+    expect = Rows([Row("foo", 1, 2), Row("bar", 3, 4)]).render(style)
+    assert rows.render(style) == expect
+    assert rows.render(style) == expect
+    assert cache.hits == 2
+    assert cache.misses == 2
+
+    rows.rows[0].current = 2
+    rows.render(style)
+    assert cache.hits == 3
+    assert cache.misses == 3
+
+
+def test_render_to() -> None:
+    rows = make_rows(100)
+    style = Style(color=False, show_percent=True, width=30)
+    stream = Writes()
+    rows.render_to(stream, style, chunk_size=100)
+    assert stream.getvalue() == rows.render(style) + "\n"
+    assert len(stream.writes) == 25
+    assert all(len(write) < 130 for write in stream.writes)
+
+
+def test_render_to__empty() -> None:
+    stream = Writes()
+    Rows().render_to(stream)
+    assert stream.writes == []
+
+
+def test_advance__threads() -> None:
+    rows = make_rows(8)
+    shared = rows.rows[0]
+    style = Style(show_fraction=True, show_percent=True, width=60)
+    errors: List[BaseException] = []
+    done = Event()
+
+    def advance(row: Row) -> None:
+        for _ in range(5_000):
+            row.advance()
+            shared.advance(2)
+
+    def render() -> None:
+        try:
+            while not done.is_set():
+                rows.render(style)
+        except BaseException as ex:
+            errors.append(ex)
+            raise
+
+    interval = getswitchinterval()
+    setswitchinterval(1e-6)
+
+    try:
+        renderer = Thread(target=render)
+        renderer.start()
+        workers = [Thread(target=advance, args=(row,)) for row in rows.rows[1:]]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        done.set()
+        renderer.join()
+    finally:
+        setswitchinterval(interval)
+
+    assert errors == []
+    assert shared.current == 7 * 5_000 * 2
+    assert [row.current for row in rows.rows[1:]] == [
+        index + 5_000 for index in range(1, 8)
+    ]
+    assert_layout(rows, style)
+
+
+def test_set() -> None:
+    rows = Rows()
+    rows.append("foo", current=1, maximum=4)
+    rows.append("bar", current=1, maximum=4)
+    rows.set("bar", 3)
+    assert [row.current for row in rows.rows] == [1, 3]
+
+
+def test_update_many() -> None:
+    rows = Rows()
+    for name in ["foo", "bar", "baz"]:
+        rows.append(name, current=1, maximum=1_000)
+    seen: List[str] = []
+    rows.watchers.append(lambda row: seen.append(f"{row.name} {row.current}"))
+    rows.update_many([("baz", 10), ("foo", 5), ("baz", 100)])
+    assert [row.current for row in rows.rows] == [5, 1, 100]
+    assert seen == ["baz 100", "foo 5"]
+    assert rows.calculate_layout(Style(show_fraction=True)).left_fraction_length == 3
+
+
+def test_update_many__missing() -> None:
+    rows = Rows()
+    rows.append("foo", current=1, maximum=2)
+    rows.append("bar", current=1, maximum=2)
+    style = Style(color=False, show_fraction=True, width=20)
+    expect = rows.render(style)
+    with raises(KeyError):
+        rows.update_many([("foo", 500), ("baz", 3), ("bar", 2)])
+    assert [row.current for row in rows.rows] == [1, 1]
+    assert rows.render(style) == expect
+
+
+def test_snapshot() -> None:
+    row = Row("foo", current=1, maximum=2)
+    row.add_listener(print)
+    snapshot = row.snapshot()
+    row.advance()
+    assert (snapshot.name, snapshot.current, snapshot.maximum) == ("foo", 1, 2)
+    assert snapshot.listeners == ()
+
+
+def test_render__cache_too_small() -> None:
+    cache = RenderCache(maxsize=2)
+    rows = Rows(render_cache=cache)
+    for index in range(3):
+        rows.append(f"row {index}", current=index, maximum=2)
+    style = Style(color=False, width=20)
+    assert rows.render(style) == Rows(list(rows.rows)).render(style)
+    assert (cache.hits, cache.misses) == (0, 0)
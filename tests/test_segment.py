@@ -0,0 +1,14 @@
+from progrow.segment import Segment
+
+
+def test_plain() -> None:
+    assert Segment.plain("foo") == Segment(text="foo", length=3)
+
+
+def test_paint() -> None:
+    assert Segment.paint("foo", "\x1b[33m") == Segment("\x1b[33mfoo\x1b[39m", 3)
+
+
+def test_tuple() -> None:
+    text, length = Segment.plain("foo")
+    assert (text, length) == ("foo", 3)
@@ -0,0 +1,66 @@
+from concurrent.futures import ProcessPoolExecutor
+from sys import version_info
+
+from pytest import mark, raises
+
+from progrow.shared_rows import SharedRows, SharedRowsHandle
+from progrow.style import Style
+
+pytestmark = mark.skipif(version_info < (3, 8), reason="requires Python 3.8")
+
+
+def work(handle: SharedRowsHandle, index: int) -> None:
+    with SharedRows.attach(handle) as rows:
+        row = rows.row(index)
+        for _ in range(1_000):
+            row.advance()
+
+
+def test_create() -> None:
+    with SharedRows.create(["foo", "bar"], [1, 2], [9, 9]) as rows:
+        assert list(rows.currents) == [1, 2]
+        assert list(rows.maximums) == [9, 9]
+        assert rows.render(Style(color=False, width=40)) == "foo ████\nbar ███████▉"
+
+
+def test_create__empty() -> None:
+    with SharedRows.create([], [], []) as rows:
+        assert rows.render() == ""
+
+
+def test_append() -> None:
+    with SharedRows.create(["foo"], [1], [9]) as rows:
+        with raises(TypeError):
+            rows.append("bar", current=1, maximum=9)
+
+
+def test_attach() -> None:
+    with SharedRows.create(["foo", "bar"], [0, 0], [10, 10]) as rows:
+        with SharedRows.attach(rows.handle) as attached:
+            assert attached.names == ["", ""]
+            attached.row(1).advance(5)
+        assert rows.row(1).current == 5
+
+
+def test_snapshot() -> None:
+    with SharedRows.create(["foo"], [1], [9]) as rows:
+        snapshot = rows.snapshot()
+        rows.row(0).advance()
+    assert list(snapshot.currents) == [1]
+
+
+def test_processes() -> None:
+    count = 4
+    names = [f"worker {index}" for index in range(count)]
+
+    with SharedRows.create(names, [0] * count, [1_000] * count) as rows:
+        with ProcessPoolExecutor(max_workers=count) as executor:
+            futures = [
+                executor.submit(work, rows.handle, index) for index in range(count)
+            ]
+            for future in futures:
+                future.result()
+
+        assert list(rows.currents) == [1_000] * count
+        style = Style(color=False, show_percent=True, width=30)
+        assert rows.render(style).split("\n")[0] == "worker 0 ████████████████ 100%"
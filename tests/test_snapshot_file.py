@@ -0,0 +1,181 @@
+from io import BytesIO
+from typing import List
+
+from pytest import mark, raises
+
+from progrow.columnar_rows import ColumnarRows
+from progrow.row import Row
+from progrow.rows import Rows
+from progrow.snapshot_file import HEADER, dump_columns, load_columns
+from progrow.style import Style
+from progrow.tree_rows import TreeRows
+
+
+def values(rows: Rows) -> List[str]:
+    return [f"{row.name} {row.current}/{row.maximum}" for row in rows.rows]
+
+
+def make_rows() -> Rows:
+    return Rows(
+        [
+            Row("foo", current=1, maximum=2),
+            Row("bär", current=1.5, maximum=3),
+            Row("", current=0, maximum=float("inf")),
+        ]
+    )
+
+
+expect = ["foo 1/2", "bär 1.5/3", " 0/inf"]
+
+
+@mark.parametrize("format", ["binary", "jsonl"])
+def test_dump__rows(format: str) -> None:
+    stream = BytesIO()
+    make_rows().dump(stream, format)
+    stream.seek(0)
+    loaded = Rows.load(stream)
+    assert isinstance(loaded, ColumnarRows)
+    assert values(loaded) == expect
+
+
+@mark.parametrize("format", ["binary", "jsonl"])
+def test_dump__columnar(format: str) -> None:
+    stream = BytesIO()
+    ColumnarRows(["foo", "bar"], [1, 2], [3, 4]).dump(stream, format)
+    stream.seek(0)
+    assert values(Rows.load(stream)) == ["foo 1/3", "bar 2/4"]
+
+
+@mark.parametrize("format", ["binary", "jsonl"])
+def test_dump__empty(format: str) -> None:
+    stream = BytesIO()
+    Rows().dump(stream, format)
+    stream.seek(0)
+    assert len(Rows.load(stream)) == 0
+
+
+def test_dump__jsonl() -> None:
+    stream = BytesIO()
+    make_rows().dump(stream, "jsonl")
+    assert stream.getvalue().decode("utf-8").split("\n") == [
+        '["foo", 1, 2]',
+        '["bär", 1.5, 3]',
+        '["", 0, Infinity]',
+        "",
+    ]
+
+
+def test_dump__binary_size() -> None:
+    stream = BytesIO()
+    dump_columns(stream, ["a", "bc"], [1, 2], [3, 4])
+    assert len(stream.getvalue()) == HEADER.size + 2 * 8 * 2 + len("a\x00bc")
+
+
+def test_dump__nul() -> None:
+    with raises(ValueError) as ex:
+        dump_columns(BytesIO(), ["a\x00b"], [1], [2])
+    assert str(ex.value) == "names in a binary snapshot cannot contain NUL"
+
+
+def test_dump__unknown_format() -> None:
+    with raises(ValueError) as ex:
+        dump_columns(BytesIO(), [], [], [], "xml")
+    assert str(ex.value) == "unknown snapshot format: xml"
+
+
+@mark.parametrize("cut", [5, HEADER.size + 1, HEADER.size + 17, -1])
+def test_load__truncated(cut: int) -> None:
+    stream = BytesIO()
+    dump_columns(stream, ["foo"], [1], [2])
+    with raises(ValueError) as ex:
+        load_columns(BytesIO(stream.getvalue()[:cut]))
+    assert str(ex.value) == "snapshot is truncated"
+
+
+def test_load__version() -> None:
+    stream = BytesIO()
+    dump_columns(stream, ["foo"], [1], [2])
+    data = bytearray(stream.getvalue())
+    data[7] = 2
+    with raises(ValueError) as ex:
+        load_columns(BytesIO(bytes(data)))
+    assert str(ex.value) == "unsupported snapshot version"
+
+
+@mark.parametrize("format", ["binary", "jsonl"])
+def test_restore(format: str) -> None:
+    stream = BytesIO()
+    make_rows().dump(stream, format)
+    stream.seek(0)
+
+    rows = Rows([Row("baz", current=5, maximum=6), Row("foo", current=0, maximum=9)])
+    foo = rows.rows[1]
+    changed: List[Row] = []
+    rows.watchers.append(changed.append)
+    rows.restore(stream)
+
+    assert type(rows) is Rows
+    assert rows.rows[1] is foo
+    assert values(rows) == ["baz 5/6", "foo 1/2", "bär 1.5/3", " 0/inf"]
+    assert foo in changed
+
+
+def test_restore__columnar() -> None:
+    stream = BytesIO()
+    make_rows().dump(stream)
+    stream.seek(0)
+
+    rows = ColumnarRows(["foo"], [0], [9])
+    rows.restore(stream)
+
+    assert type(rows) is ColumnarRows
+    assert values(rows) == expect
+
+
+def test_restore__columnar_same_names() -> None:
+    stream = BytesIO()
+    make_rows().dump(stream)
+    stream.seek(0)
+
+    rows = ColumnarRows(["foo", "bär", ""], [0, 0, 0], [1, 1, 1])
+    changed: List[str] = []
+    rows.watchers.append(lambda row: changed.append(row.name))
+    rows.restore(stream)
+
+    assert values(rows) == expect
+    assert changed == ["foo", "bär", ""]
+
+
+def test_restore__duplicate_names() -> None:
+    stream = BytesIO()
+    Rows([Row("foo", 1, 2), Row("bar", 3, 4)]).dump(stream)
+    stream.seek(0)
+
+    rows = Rows([Row("foo", 0, 9), Row("foo", 0, 9)])
+    rows.restore(stream)
+    assert values(rows) == ["foo 1/2", "foo 0/9", "bar 3/4"]
+
+
+def make_tree() -> TreeRows:
+    tree = TreeRows(total="all")
+    parent = tree.add("parent")
+    tree.add("foo", maximum=2, parent=parent)
+    tree.add("bar", maximum=4, parent=parent)
+    return tree
+
+
+def test_restore__tree() -> None:
+    tree = make_tree()
+    tree["foo"].current = 1
+    tree["bar"].current = 3
+    stream = BytesIO()
+    tree.dump(stream)
+    stream.seek(0)
+
+    restored = make_tree()
+    restored.restore(stream)
+    style = Style(color=False, width=30)
+    assert restored.render(style) == tree.render(style)
+
+    restored["foo"].current = 2
+    assert values(restored) == ["all 5/6", "parent 5/6", "foo 2/2", "bar 3/4"]
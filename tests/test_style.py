@@ -54,3 +54,52 @@ def test_width__forced() -> None:
 
 def test_width__auto() -> None:
     assert Style().width > 0
+
+
+def test_init__width_ttl_empty() -> None:
+    assert Style().width_ttl is None
+
+
+def test_init__width_ttl_set() -> None:
+    assert Style(width_ttl=1.5).width_ttl == 1.5
+
+
+def test_slots() -> None:
+    assert not hasattr(Style(), "__dict__")
+    assert not hasattr(Style().freeze(), "__dict__")
+
+
+@mark.parametrize(
+    "show_fraction, show_percent, show_rate, expect",
+    [
+        (False, False, False, " "),
+        (True, False, False, " • "),
+        (False, True, False, " • "),
+        (False, False, True, " • "),
+    ],
+)
+def test_eta_prefix(
+    show_fraction: bool,
+    show_percent: bool,
+    show_rate: bool,
+    expect: str,
+) -> None:
+    style = Style(
+        show_fraction=show_fraction,
+        show_percent=show_percent,
+        show_rate=show_rate,
+    )
+    assert style.eta_prefix == expect
+
+
+@mark.parametrize(
+    "show_fraction, show_percent, expect",
+    [
+        (False, False, " "),
+        (True, False, " • "),
+        (False, True, " • "),
+    ],
+)
+def test_rate_prefix(show_fraction: bool, show_percent: bool, expect: str) -> None:
+    style = Style(show_fraction=show_fraction, show_percent=show_percent)
+    assert style.rate_prefix == expect
@@ -0,0 +1,101 @@
+import os
+import signal
+from threading import Thread
+from typing import List
+
+from pytest import mark
+
+from progrow.terminal_width import TerminalWidth, lookup_terminal_width
+from tests.conftest import Clock
+
+
+class Lookup:
+    def __init__(self) -> None:
+        self.calls = 0
+        self.width = 80
+
+    def __call__(self) -> int:
+        self.calls += 1
+        return self.width
+
+
+def test_lookup_terminal_width() -> None:
+    assert lookup_terminal_width() > 0
+
+
+def test_get__unwatched(clock: Clock) -> None:
+    lookup = Lookup()
+    width = TerminalWidth(lookup, clock, fallback_ttl=0.5)
+    width.watching = False
+    assert width.get() == 80
+    lookup.width = 100
+    clock.now = 0.25
+    assert width.get() == 80
+    clock.now = 0.5
+    assert width.get() == 100
+    assert lookup.calls == 2
+
+
+def test_get__watched() -> None:
+    lookup = Lookup()
+    width = TerminalWidth(lookup)
+    width.watching = True
+    assert width.get() == 80
+    lookup.width = 100
+    assert width.get() == 80
+    width.invalidate()
+    assert width.get() == 100
+    assert lookup.calls == 2
+
+
+def test_get__ttl(clock: Clock) -> None:
+    lookup = Lookup()
+    width = TerminalWidth(lookup, clock)
+    width.watching = False
+    assert width.get(ttl=1.0) == 80
+    lookup.width = 100
+    clock.now = 0.5
+    assert width.get(ttl=1.0) == 80
+    clock.now = 1.0
+    assert width.get(ttl=1.0) == 100
+    assert lookup.calls == 2
+
+
+@mark.skipif(not hasattr(signal, "SIGWINCH"), reason="SIGWINCH not supported")
+def test_watch() -> None:
+    sigwinch = getattr(signal, "SIGWINCH")
+    previous = signal.getsignal(sigwinch)
+    chained: List[int] = []
+    signal.signal(sigwinch, lambda signum, frame: chained.append(signum))
+
+    try:
+        lookup = Lookup()
+        width = TerminalWidth(lookup)
+        assert width.get() == 80
+        assert width.watching
+        assert width.watch()
+
+        lookup.width = 100
+        os.kill(os.getpid(), sigwinch)
+        assert width.get() == 100
+        assert chained == [sigwinch]
+    finally:
+        signal.signal(sigwinch, previous)
+
+
+@mark.skipif(not hasattr(signal, "SIGWINCH"), reason="SIGWINCH not supported")
+def test_watch__first_read_from_thread() -> None:
+    sigwinch = getattr(signal, "SIGWINCH")
+    previous = signal.getsignal(sigwinch)
+
+    try:
+        lookup = Lookup()
+        width = TerminalWidth(lookup)
+        thread = Thread(target=width.get)
+        thread.start()
+        thread.join()
+        assert width.watching is None
+        assert width.get() == 80
+        assert width.watching
+    finally:
+        signal.signal(sigwinch, previous)
@@ -0,0 +1,114 @@
+from random import Random
+from threading import Thread
+from typing import List
+
+from pytest import mark
+
+from progrow.columnar_rows import ColumnarRows
+from progrow.row import Row
+from progrow.rows import Rows
+from progrow.style import Style
+from progrow.top_rows import TopRows
+
+
+def make_rows() -> Rows:
+    rows = Rows()
+    for index in range(10):
+        rows.append(f"row {index}", current=index, maximum=10)
+    return rows
+
+
+def names(rows: List[Row]) -> List[str]:
+    return [row.name for row in rows]
+
+
+def test_visible() -> None:
+    assert names(TopRows(make_rows(), 3).visible()) == ["row 0", "row 1", "row 2"]
+
+
+def test_visible__append() -> None:
+    rows = make_rows()
+    top = TopRows(rows, 2)
+    rows.append("new", current=0, maximum=100)
+    assert names(top.visible()) == ["row 0", "new"]
+
+
+def test_visible__changed() -> None:
+    rows = make_rows()
+    top = TopRows(rows, 3)
+    rows.rows[0].current = 10
+    rows.rows[9].advance(-9)
+    assert names(top.visible()) == ["row 9", "row 1", "row 2"]
+    assert names(top.visible()) == ["row 9", "row 1", "row 2"]
+
+
+def test_visible__columnar() -> None:
+    rows = ColumnarRows(["a", "b", "c"], [2, 1, 3], [4, 4, 4])
+    assert names(TopRows(rows, 2).visible()) == ["b", "a"]
+    assert names(TopRows(rows, 2, most=True).visible()) == ["c", "a"]
+
+
+def test_visible__list_changed_directly() -> None:
+    rows = make_rows()
+    top = TopRows(rows, 1)
+    rows.rows.append(Row("direct", current=0, maximum=100))
+    assert names(top.visible()) == ["row 0"]
+    rows.rows[0].current = 5
+    assert names(top.visible()) == ["direct"]
+
+
+def test_visible__most() -> None:
+    top = TopRows(make_rows(), 2, most=True)
+    assert names(top.visible()) == ["row 9", "row 8"]
+
+
+def test_visible__offset() -> None:
+    top = TopRows(make_rows(), 2)
+    top.scroll(3)
+    assert names(top.visible()) == ["row 3", "row 4"]
+
+
+@mark.parametrize("most", [False, True])
+def test_visible__random(most: bool) -> None:
+    random = Random(17)
+    rows = Rows()
+    for index in range(500):
+        rows.append(f"row {index}", current=0, maximum=random.randint(1, 100))
+    top = TopRows(rows, 10, most=most)
+
+    for _ in range(5_000):
+        row = rows.rows[random.randrange(len(rows))]
+        row.current = random.randint(0, int(row.maximum))
+        if random.random() < 0.01:
+            ordered = sorted(rows.rows, key=lambda r: r.percent, reverse=most)
+            expect = [r.percent for r in ordered[:10]]
+            assert [r.percent for r in top.visible()] == expect
+
+    assert sum(map(len, top._heaps)) <= 2 * len(rows) + 64 * len(top._heaps)
+
+
+def test_render() -> None:
+    style = Style(color=False, show_percent=True, width=20)
+    assert TopRows(make_rows(), 2, most=True).render(style).split("\n") == [
+        "row 9 █████████▏ 90%",
+        "row 8 ████████▏  80%",
+    ]
+
+
+def test_update__threads() -> None:
+    rows = Rows()
+    for index in range(100):
+        rows.append(f"row {index}", current=0, maximum=100)
+    top = TopRows(rows, 3)
+
+    def advance(start: int) -> None:
+        for row in rows.rows[start::4]:
+            row.advance(1 + start)
+
+    threads = [Thread(target=advance, args=(start,)) for start in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert [row.current for row in top.visible()] == [1, 1, 1]
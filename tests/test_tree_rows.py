@@ -0,0 +1,191 @@
+from threading import Thread
+from typing import List
+
+from progrow.row import Row
+from progrow.style import Style
+from progrow.top_rows import TopRows
+from progrow.tree_rows import TreeRows
+
+style = Style(color=False, show_fraction=True, width=40)
+
+
+def values(rows: List[Row]) -> List[str]:
+    return [f"{row.name} {row.current}/{row.maximum}" for row in rows]
+
+
+def make_tree() -> TreeRows:
+    tree = TreeRows(total="total")
+    job = tree.add("job")
+    stage_1 = tree.add("stage 1", parent=job)
+    stage_2 = tree.add("stage 2", parent=job)
+    tree.add("shard a", 3, 10, parent=stage_1)
+    tree.add("shard b", 5, 10, parent=stage_1)
+    tree.add("shard c", 1, 4, parent=stage_2)
+    tree.add("other job", 2, 2)
+    return tree
+
+
+def test_add() -> None:
+    tree = make_tree()
+    assert values(tree.rows) == [
+        "total 11/26",
+        "job 9/24",
+        "stage 1 8/20",
+        "stage 2 1/4",
+        "shard a 3/10",
+        "shard b 5/10",
+        "shard c 1/4",
+        "other job 2/2",
+    ]
+
+
+def test_append() -> None:
+    tree = TreeRows()
+    tree.append("foo", current=1, maximum=2)
+    assert values(tree.children()) == ["foo 1/2"]
+    assert tree.total is None
+
+
+def test_children() -> None:
+    tree = make_tree()
+    job = tree.children()[0]
+    assert values(tree.children(job)) == ["stage 1 8/20", "stage 2 1/4"]
+    assert tree.children(tree.rows[4]) == []
+
+
+def test_depth() -> None:
+    tree = make_tree()
+    assert [tree.depth(row) for row in tree.rows] == [0, 0, 1, 1, 2, 2, 2, 0]
+
+
+def test_invalidate__rolls_up() -> None:
+    tree = make_tree()
+    shard_a = tree.rows[4]
+    shard_c = tree.rows[6]
+
+    shard_a.advance(7)
+    shard_c.maximum = 8
+    shard_c.current = 0
+
+    assert values(tree.rows[:4]) == [
+        "total 17/30",
+        "job 15/28",
+        "stage 1 15/20",
+        "stage 2 0/8",
+    ]
+
+
+def test_invalidate__threads() -> None:
+    tree = TreeRows(total="total")
+    parents = [tree.add(f"parent {index}") for index in range(4)]
+    leaves = [
+        tree.add(f"leaf {index}", 0, 1_000, parent=parents[index % 4])
+        for index in range(16)
+    ]
+
+    def work(row: Row) -> None:
+        for _ in range(1_000):
+            row.advance()
+
+    threads = [Thread(target=work, args=(leaf,)) for leaf in leaves]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert tree.total
+    assert values([tree.total]) == ["total 16000/16000"]
+    assert values(parents) == [f"parent {index} 4000/4000" for index in range(4)]
+
+
+def test_invalidate__threads_change_maximums() -> None:
+    tree = TreeRows(total="total")
+    parent = tree.add("parent")
+    leaves = [tree.add(f"leaf {index}", 0, 0, parent=parent) for index in range(8)]
+
+    def work(row: Row) -> None:
+        for _ in range(500):
+            row.maximum += 2
+            row.advance()
+
+    threads = [Thread(target=work, args=(leaf,)) for leaf in leaves]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert tree.total
+    assert values([parent, tree.total]) == ["parent 4000/8000", "total 4000/8000"]
+
+
+def test_render() -> None:
+    assert make_tree().render(style).split("\n") == [
+        "job         ███████▌              9 / 24",
+        "  stage 1   ████████▏             8 / 20",
+        "    shard a ██████▏               3 / 10",
+        "    shard b ██████████▏           5 / 10",
+        "  stage 2   █████▏                1 /  4",
+        "    shard c █████▏                1 /  4",
+        "other job   ███████████████████▉  2 /  2",
+        "total       ████████▌            11 / 26",
+    ]
+
+
+def test_render__max_depth() -> None:
+    tree = make_tree()
+    tree.max_depth = 1
+    assert tree.render(style).split("\n") == [
+        "job       ████████▎               9 / 24",
+        "other job ██████████████████████  2 /  2",
+        "total     █████████▍             11 / 26",
+    ]
+
+
+def test_render__max_depth_changed() -> None:
+    tree = make_tree()
+    tree.max_depth = 1
+    assert tree.calculate_layout(style).name_length == 10
+    tree.max_depth = None
+    assert tree.calculate_layout(style).name_length == 12
+
+
+def test_render__empty_parent() -> None:
+    tree = TreeRows()
+    tree.add("job")
+    percent_style = Style(
+        color=False,
+        show_fraction=True,
+        show_percent=True,
+        width=40,
+    )
+    assert tree.render(percent_style) == "job                           0 / 0 • 0%"
+
+
+def test_render__empty_total() -> None:
+    tree = TreeRows(total="all")
+    assert tree.render(Style(color=False, show_percent=True, width=20)) == (
+        "all               0%"
+    )
+
+
+def test_top_rows__empty_parent() -> None:
+    tree = TreeRows()
+    top = TopRows(tree, 2)
+    job = tree.add("job")
+    tree.add("stage", 1, 4, parent=job)
+    assert sorted(values(top.visible())) == ["job 1/4", "stage 1/4"]
+
+
+def test_update_many() -> None:
+    tree = make_tree()
+    tree.update_many([("shard a", 10), ("shard c", 4), ("shard a", 6)])
+    assert values(tree.rows) == [
+        "total 17/26",
+        "job 15/24",
+        "stage 1 11/20",
+        "stage 2 4/4",
+        "shard a 6/10",
+        "shard b 5/10",
+        "shard c 4/4",
+        "other job 2/2",
+    ]
@@ -0,0 +1,122 @@
+from typing import List
+
+from pytest import mark, raises
+
+from progrow.columnar_rows import ColumnarRows
+from progrow.render_cache import RenderCache
+from progrow.row import Row
+from progrow.rows import Rows
+from progrow.style import Style
+from progrow.viewport import Viewport
+
+style = Style(color=False, show_fraction=True, show_percent=True, width=40)
+
+
+class CountingRow(Row):
+    __slots__ = ("snapshots",)
+
+    def __init__(self, name: str, current: float, maximum: float) -> None:
+        super().__init__(name, current, maximum)
+        self.snapshots = 0
+
+    def snapshot(self) -> Row:
+        self.snapshots += 1
+        return super().snapshot()
+
+
+def make_rows() -> Rows:
+    rows = Rows()
+    for index in range(10):
+        rows.append(f"row {index}", current=index, maximum=10)
+    rows.append("a much longer name", current=1_000, maximum=1_000)
+    return rows
+
+
+def names(rows: List[Row]) -> List[str]:
+    return [row.name for row in rows]
+
+
+def test_init__height() -> None:
+    with raises(ValueError) as ex:
+        Viewport(Rows(), height=0)
+    assert str(ex.value) == "height must be positive, not 0"
+
+
+def test_iter_render__only_visible() -> None:
+    rows = Rows([CountingRow(f"row {index}", index, 10) for index in range(100)])
+    viewport = Viewport(rows, height=3, offset=50)
+    assert len(list(viewport.iter_render(style))) == 3
+    assert sum(row.snapshots for row in rows.rows) == 3  # type: ignore
+
+
+def test_render() -> None:
+    rows = make_rows()
+    lines = rows.render(style).split("\n")
+    assert Viewport(rows, height=3, offset=2).render(style) == "\n".join(lines[2:5])
+
+
+def test_render__cache() -> None:
+    cache = RenderCache()
+    rows = make_rows()
+    rows.render_cache = cache
+    viewport = Viewport(rows, height=3)
+    viewport.render(style)
+    viewport.render(style)
+    assert cache.hits == 3
+    assert cache.misses == 3
+
+
+def test_render__columnar() -> None:
+    rows = make_rows()
+    columnar = ColumnarRows(
+        [row.name for row in rows.rows],
+        [row.current for row in rows.rows],
+        [row.maximum for row in rows.rows],
+    )
+    expect = Viewport(rows, height=4, offset=3).render(style)
+    assert Viewport(columnar, height=4, offset=3).render(style) == expect
+
+
+def test_render__empty() -> None:
+    assert Viewport(Rows(), height=3, fit_visible=True).render(style) == ""
+
+
+def test_render__fit_visible() -> None:
+    rows = make_rows()
+    viewport = Viewport(rows, height=2, offset=1, fit_visible=True)
+    assert viewport.render(style).split("\n") == [
+        "row 1 ██▏                   1 / 10 • 10%",
+        "row 2 ████▎                 2 / 10 • 20%",
+    ]
+
+
+@mark.parametrize(
+    "offset, lines, expect",
+    [
+        (0, 3, 3),
+        (0, -3, 0),
+        (5, 100, 8),
+        (5, -2, 3),
+    ],
+)
+def test_scroll(offset: int, lines: int, expect: int) -> None:
+    viewport = Viewport(make_rows(), height=3, offset=offset)
+    viewport.scroll(lines)
+    assert viewport.offset == expect
+
+
+def test_visible() -> None:
+    viewport = Viewport(make_rows(), height=3, offset=9)
+    assert names(viewport.visible()) == ["row 9", "a much longer name"]
+
+
+def test_visible__sorted() -> None:
+    rows = make_rows()
+    viewport = Viewport(rows, height=3, offset=1, key=lambda row: -row.current)
+    assert names(viewport.visible()) == ["row 9", "row 8", "row 7"]
+
+
+def test_visible__sorted_reverse() -> None:
+    rows = make_rows()
+    viewport = Viewport(rows, height=2, key=lambda row: row.percent, reverse=True)
+    assert names(viewport.visible()) == ["a much longer name", "row 9"]